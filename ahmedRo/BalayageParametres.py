@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from DonneesCamions import en_listes
+from ModeleGurobi import resoudre_ordonnancement_avance
+from HeuristiqueQuais import resoudre_ordonnancement_heuristique
+
+
+def _cmax(solution):
+    # Arrondi: les dates du PLNE portent un bruit de l'ordre de la tolérance
+    return round(max(res["Fin_Operation"] for res in solution), 6)
+
+
+def _cout(solution, C_swap):
+    return _cmax(solution) + C_swap * sum(res["Cout_Penalite"] for res in solution)
+
+
+def _matrice_quais(a, M):
+    """Autorisations pour M quais: colonnes de `a` tronquées, quais supplémentaires autorisés."""
+    return [ligne[:M] + [1] * (M - len(ligne)) for ligne in a]
+
+
+def _balayer_quai(N, M, p, r, d, prep, a, valeurs_C_swap, temps_limite, threads):
+    """
+    Chaîne de réglages (M, C_swap) à M fixé, par C_swap croissant: chaque
+    réglage démarre de la meilleure (au nouveau C_swap) des solutions du
+    réglage voisin précédent et de l'heuristique. Sans solution du PLNE
+    (licence, délai), la solution de départ est retenue; lève ValueError si
+    aucune des deux méthodes n'en fournit.
+    """
+    a = _matrice_quais(a, M)
+    precedente = None
+    resultats = []
+    for C_swap in valeurs_C_swap:
+        _, _, heuristique = resoudre_ordonnancement_heuristique(
+            N, M, p, r, d, prep, a, C_swap, temps_limite=0.2 * temps_limite
+        )
+        # Les solveurs retournent un message (str) à la place d'une solution en cas d'échec
+        candidats = [s for s in (precedente, heuristique) if s is not None and not isinstance(s, str)]
+        depart = min(candidats, key=lambda s: _cout(s, C_swap), default=None)
+        _, _, solution = resoudre_ordonnancement_avance(
+            N, M, p, r, d, prep, a, C_swap, formulation="compacte",
+            solution_initiale=depart, temps_limite=temps_limite, threads=threads,
+        )
+        methode = "PLNE"
+        if isinstance(solution, str):
+            if depart is None:
+                raise ValueError(f"M = {M}, C_swap = {C_swap}: {solution}")
+            solution, methode = depart, "Heuristique"
+        precedente = solution
+        resultats.append({
+            "M": M,
+            "C_swap": C_swap,
+            "Cmax": _cmax(solution),
+            "P_cost": sum(res["Cout_Penalite"] for res in solution),
+            "Cout": _cout(solution, C_swap),
+            "Methode": methode,
+            "solution": solution,
+        })
+    return resultats
+
+
+def front_pareto(resultats, eps=1e-6):
+    """
+    Réglages efficaces: aucun autre réglage n'a un makespan, un nombre
+    d'affectations pénalisées et un nombre de quais tous au plus aussi grands,
+    l'un strictement plus petit. Triés par makespan.
+    """
+    criteres = [(res["Cmax"], res["P_cost"], res["M"]) for res in resultats]
+
+    def domine(u, v):
+        return (all(x <= y + eps for x, y in zip(u, v))
+                and any(x < y - eps for x, y in zip(u, v)))
+
+    efficaces = [res for res, v in zip(resultats, criteres)
+                 if not any(domine(u, v) for u in criteres)]
+    return sorted(efficaces, key=lambda res: (res["Cmax"], res["P_cost"], res["M"]))
+
+
+def balayer_parametres(N, p, r, d, prep, a, valeurs_M, valeurs_C_swap, temps_limite=2.0,
+                       processus=None):
+    """
+    Évalue la grille de réglages (M, C_swap) et retourne (resultats, pareto).
+
+    a: autorisations N x M_a; pour M > M_a, les quais supplémentaires sont
+        autorisés, pour M < M_a seuls les M premiers sont gardés.
+    temps_limite: secondes de PLNE par réglage (démarré depuis l'heuristique
+        ou le réglage voisin).
+    processus: taille du pool (par défaut une chaîne par valeur de M, au plus
+        le nombre de cœurs); chaque processus traite les C_swap d'un M.
+
+    resultats: un dict par réglage {"M", "C_swap", "Cmax", "P_cost", "Cout",
+        "Methode", "solution"}, par M puis C_swap croissants.
+    pareto: réglages efficaces (voir front_pareto).
+    Lève ValueError si une valeur de M est inférieure à 1.
+    """
+    valeurs_M = sorted(set(valeurs_M))
+    valeurs_C_swap = sorted(set(valeurs_C_swap))
+    if valeurs_M and valeurs_M[0] < 1:
+        raise ValueError(f"Nombre de quais invalide: {valeurs_M[0]} (au moins 1)")
+    if N == 0 or not valeurs_M or not valeurs_C_swap:
+        return [], []
+    p, r, d, prep, a = en_listes(p, r, d, prep, a)
+
+    coeurs = os.cpu_count() or 1
+    processus = processus or min(len(valeurs_M), coeurs)
+    threads = max(1, coeurs // processus)
+    # "spawn": processus neufs, sans l'état (Qt, environnement Gurobi) du parent
+    contexte = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processus, mp_context=contexte) as pool:
+        chaines = [
+            pool.submit(_balayer_quai, N, M, p, r, d, prep, a, valeurs_C_swap,
+                        temps_limite, threads)
+            for M in valeurs_M
+        ]
+        resultats = [res for chaine in chaines for res in chaine.result()]
+    return resultats, front_pareto(resultats)
@@ -0,0 +1,183 @@
+import csv
+import json
+
+import numpy as np
+
+# Colonnes des camions: temps de traitement, date de disponibilité,
+# date d'échéance, temps de préparation
+COLONNES = ("p", "r", "d", "prep")
+VALEURS_DEFAUT = (10.0, 0.0, 20.0, 2.0)
+ERREURS_MAX = 10
+
+
+def donnees_vides(M):
+    """Tableaux d'une instance sans camion: p, r, d, prep (float64) et a (N x M, int8)."""
+    donnees = {c: np.empty(0) for c in COLONNES}
+    donnees["a"] = np.ones((0, M), dtype=np.int8)
+    return donnees
+
+
+def en_listes(p, r, d, prep, a):
+    """
+    Listes Python des données (tableaux NumPy ou séquences): les solveurs
+    indexent élément par élément, plus rapide sur des listes que sur des
+    scalaires NumPy.
+    """
+    return (
+        *(np.asarray(v, dtype=float).tolist() for v in (p, r, d, prep)),
+        np.asarray(a, dtype=int).tolist(),
+    )
+
+
+def _en_float(valeurs, libelle, erreurs):
+    """Conversion vectorisée; les cellules non numériques deviennent NaN et sont signalées."""
+    tableau = np.asarray(valeurs, dtype=object)
+    try:
+        sortie = tableau.astype(np.float64)
+    except (TypeError, ValueError):
+        pass
+    else:
+        # None (null JSON) et "nan" passent la conversion
+        erreurs.extend(f"Camion {i + 1}, {libelle}: valeur manquante"
+                       for i in np.flatnonzero(np.isnan(sortie)))
+        return sortie
+    sortie = np.full(len(tableau), np.nan)
+    for i, v in enumerate(tableau):
+        try:
+            sortie[i] = float(v)
+        except (TypeError, ValueError):
+            if v is None or str(v).strip() == "":
+                erreurs.append(f"Camion {i + 1}, {libelle}: valeur manquante")
+            else:
+                erreurs.append(f"Camion {i + 1}, {libelle}: valeur non numérique {v!r}")
+    return sortie
+
+
+def _erreurs_domaine(donnees, a):
+    """Valeurs négatives et autorisations hors de {0, 1} (les cellules NaN sont ignorées)."""
+    erreurs = []
+    for libelle in COLONNES:
+        valeurs = donnees[libelle]
+        negatives = np.flatnonzero(valeurs < 0)
+        erreurs.extend(f"Camion {i + 1}, {libelle}: valeur négative ({valeurs[i]:g})"
+                       for i in negatives)
+    lignes, quais = np.nonzero((a != 0) & (a != 1) & ~np.isnan(a))
+    erreurs.extend(f"Camion {i + 1}, Quai {k + 1}: autorisation {a[i, k]:g} (0 ou 1 attendu)"
+                   for i, k in zip(lignes.tolist(), quais.tolist()))
+    return erreurs
+
+
+def valider_donnees(p, r, d, prep, a):
+    """
+    Vérification vectorisée des données d'une instance; lève ValueError
+    listant les cellules fautives (camion, colonne, valeur).
+    """
+    N = len(p)
+    donnees = {c: np.asarray(v, dtype=float) for c, v in zip(COLONNES, (p, r, d, prep))}
+    a = np.asarray(a, dtype=float)
+    if a.ndim != 2 or a.shape[0] != N:
+        raise ValueError(f"Matrice d'affectation de forme {a.shape}, attendue ({N}, M)")
+    longueurs = [f"Colonne {c}: {len(v)} valeurs pour {N} camions"
+                 for c, v in donnees.items() if len(v) != N]
+    if longueurs:
+        raise ValueError("\n".join(longueurs))
+
+    erreurs = []
+    for libelle, valeurs in donnees.items():
+        manquantes = np.flatnonzero(~np.isfinite(valeurs))
+        erreurs.extend(f"Camion {i + 1}, {libelle}: valeur manquante" for i in manquantes)
+    lignes, quais = np.nonzero(np.isnan(a))
+    erreurs.extend(f"Camion {i + 1}, Quai {k + 1}: autorisation manquante"
+                   for i, k in zip(lignes.tolist(), quais.tolist()))
+    erreurs.extend(_erreurs_domaine(donnees, a))
+
+    if erreurs:
+        raise ValueError(_formater_erreurs(erreurs))
+
+
+def _formater_erreurs(erreurs):
+    affichees = erreurs[:ERREURS_MAX]
+    if len(erreurs) > ERREURS_MAX:
+        affichees.append(f"... {len(erreurs) - ERREURS_MAX} autres erreurs")
+    return "\n".join(affichees)
+
+
+def _matrice_affectation(colonnes, N, M, erreurs):
+    """Matrice (N x M, float64) à partir des colonnes de chaque quai (texte ou nombres)."""
+    a = np.ones((N, M))
+    for k, valeurs in enumerate(colonnes):
+        a[:, k] = _en_float(valeurs, f"Quai {k + 1}", erreurs)
+    return a
+
+
+def _terminer(chemin, donnees, erreurs):
+    """Ajoute les erreurs de domaine; lève ValueError s'il y en a, sinon convertit `a` en int8."""
+    erreurs = erreurs + _erreurs_domaine(donnees, donnees["a"])
+    if erreurs:
+        raise ValueError(f"{chemin}:\n" + _formater_erreurs(erreurs))
+    donnees["a"] = donnees["a"].astype(np.int8)
+    return donnees
+
+
+def charger_csv(chemin, M=None):
+    """
+    CSV à une ligne par camion: colonnes p, r, d, prep et, optionnellement,
+    quai_1 ... quai_M (1 = autorisé, 0 = interdit). Sans colonne quai_k, tous
+    les quais (M) sont autorisés.
+    Retourne {"p", "r", "d", "prep": float64, "a": int8 (N x M)}.
+    """
+    with open(chemin, newline="", encoding="utf-8-sig") as f:
+        lecteur = csv.reader(f)
+        en_tete = [h.strip() for h in next(lecteur, [])]
+        lignes = [ligne for ligne in lecteur if any(c.strip() for c in ligne)]
+    manquantes = [c for c in COLONNES if c not in en_tete]
+    if manquantes:
+        raise ValueError(f"{chemin}: colonnes manquantes {', '.join(manquantes)}")
+    if any(len(ligne) != len(en_tete) for ligne in lignes):
+        fautives = [i + 1 for i, ligne in enumerate(lignes) if len(ligne) != len(en_tete)]
+        raise ValueError(f"{chemin}: nombre de cellules incorrect (camions "
+                         f"{', '.join(map(str, fautives[:ERREURS_MAX]))})")
+
+    colonnes = dict(zip(en_tete, zip(*lignes))) if lignes else {h: () for h in en_tete}
+    quais = []
+    while f"quai_{len(quais) + 1}" in colonnes:
+        quais.append(colonnes[f"quai_{len(quais) + 1}"])
+    if not quais and M is None:
+        raise ValueError(f"{chemin}: aucune colonne quai_1 ... quai_M et nombre de quais inconnu")
+
+    N = len(lignes)
+    erreurs = []
+    donnees = {c: _en_float(colonnes[c], c, erreurs) for c in COLONNES}
+    donnees["a"] = _matrice_affectation(quais, N, len(quais) or M, erreurs)
+    return _terminer(chemin, donnees, erreurs)
+
+
+def charger_json(chemin):
+    """
+    Fichier produit par « Sauvegarder » ({"M", "p", "r", "d", "prep", "a",
+    "C_swap"}). Retourne les tableaux de charger_csv, plus "C_swap" s'il est
+    présent.
+    """
+    with open(chemin, encoding="utf-8") as f:
+        contenu = json.load(f)
+    manquantes = [c for c in (*COLONNES, "a") if c not in contenu]
+    if manquantes:
+        raise ValueError(f"{chemin}: champs manquants {', '.join(manquantes)}")
+
+    N = len(contenu["p"])
+    lignes = contenu["a"]
+    M = len(lignes[0]) if lignes else int(contenu.get("M", 0))
+    longueurs = [f"champ {c}: {len(contenu[c])} valeurs pour {N} camions"
+                 for c in COLONNES if len(contenu[c]) != N]
+    if len(lignes) != N or any(len(ligne) != M for ligne in lignes):
+        longueurs.append(f"champ a: matrice {N} x {M} attendue")
+    if longueurs:
+        raise ValueError(f"{chemin}: " + "; ".join(longueurs))
+
+    erreurs = []
+    donnees = {c: _en_float(contenu[c], c, erreurs) for c in COLONNES}
+    donnees["a"] = _matrice_affectation(list(zip(*lignes)) or [()] * M, N, M, erreurs)
+    donnees = _terminer(chemin, donnees, erreurs)
+    if "C_swap" in contenu:
+        donnees["C_swap"] = float(contenu["C_swap"])
+    return donnees
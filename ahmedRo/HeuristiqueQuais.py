@@ -0,0 +1,253 @@
+import time
+from bisect import bisect_right
+
+from DonneesCamions import en_listes
+
+
+def _date_debut_min(N, r, prep):
+    return [r[i] + prep[i] for i in range(N)]
+
+
+class _Planning:
+    """
+    Affectation des camions aux quais. Sur un quai, les camions passent par
+    date de début au plus tôt e_i = r_i + prep_i croissante (règle optimale
+    pour le makespan d'une machine avec dates de disponibilité): une solution
+    n'est donc qu'une affectation, et chaque quai garde ses fins cumulées pour
+    réévaluer un retrait ou une insertion à partir de la position modifiée.
+    disponibilite[k]: date à laquelle le quai k se libère (0 par défaut).
+    """
+
+    def __init__(self, N, M, p, e, a, C_swap, affectation, disponibilite=None):
+        self.M = M
+        self.disponibilite = [float(t) for t in disponibilite] if disponibilite is not None else [0.0] * M
+        self.p = p
+        self.e = e
+        self.a = a
+        self.C_swap = C_swap
+        self.quai = list(affectation)
+        self.sequences = [[] for _ in range(M)]     # camions triés par (e_i, i)
+        self.cles = [[] for _ in range(M)]
+        for i in sorted(range(N), key=lambda i: (e[i], i)):
+            self.sequences[self.quai[i]].append(i)
+            self.cles[self.quai[i]].append((e[i], i))
+        self.fins = [self._fins(k) for k in range(M)]   # fins cumulées par position
+        self.penalites = sum(1 for i in range(N) if a[i][self.quai[i]] == 0)
+
+    def _fins(self, k):
+        fins = []
+        t = self.disponibilite[k]
+        for i in self.sequences[k]:
+            t = max(t, self.e[i]) + self.p[i]
+            fins.append(t)
+        return fins
+
+    def fin_quai(self, k):
+        return self.fins[k][-1] if self.fins[k] else self.disponibilite[k]
+
+    def cmax(self):
+        return max(self.fin_quai(k) for k in range(self.M))
+
+    def cout(self):
+        return self.cmax() + self.C_swap * self.penalites
+
+    # -- Évaluation incrémentale: seule la fin du quai modifié est recalculée --
+    def _fin_avant(self, k, position):
+        return self.fins[k][position - 1] if position > 0 else self.disponibilite[k]
+
+    def _suite(self, k, position, t, retire=None, ajoute=None):
+        """Fin du quai k en repartant de la position `position` avec le temps t."""
+        sequence = self.sequences[k]
+        debut = position
+        if ajoute is not None:
+            t = max(t, self.e[ajoute]) + self.p[ajoute]
+        for i in sequence[debut:]:
+            if i != retire:
+                t = max(t, self.e[i]) + self.p[i]
+        return t
+
+    def fin_sans(self, k, i):
+        position = bisect_right(self.cles[k], (self.e[i], i)) - 1
+        return self._suite(k, position, self._fin_avant(k, position), retire=i)
+
+    def fin_avec(self, k, i, retire=None):
+        """Fin du quai k après insertion de i (et retrait éventuel de `retire`)."""
+        position = bisect_right(self.cles[k], (self.e[i], i))
+        if retire is not None:
+            position_r = bisect_right(self.cles[k], (self.e[retire], retire)) - 1
+            if position_r < position:
+                t = self._fin_avant(k, position_r)
+                sequence = self.sequences[k]
+                for j in sequence[position_r + 1:position]:
+                    t = max(t, self.e[j]) + self.p[j]
+                return self._suite(k, position, t, ajoute=i)
+            return self._suite(k, position, self._fin_avant(k, position), retire=retire, ajoute=i)
+        return self._suite(k, position, self._fin_avant(k, position), ajoute=i)
+
+    def deplacer(self, i, k):
+        ancien = self.quai[i]
+        self.penalites += (self.a[i][k] == 0) - (self.a[i][ancien] == 0)
+        position = bisect_right(self.cles[ancien], (self.e[i], i)) - 1
+        del self.sequences[ancien][position]
+        del self.cles[ancien][position]
+        position = bisect_right(self.cles[k], (self.e[i], i))
+        self.sequences[k].insert(position, i)
+        self.cles[k].insert(position, (self.e[i], i))
+        self.quai[i] = k
+        self.fins[ancien] = self._fins(ancien)
+        self.fins[k] = self._fins(k)
+
+    def solution(self, d):
+        debut = [0.0] * len(self.quai)
+        for k in range(self.M):
+            t = self.disponibilite[k]
+            for i in self.sequences[k]:
+                debut[i] = max(t, self.e[i])
+                t = debut[i] + self.p[i]
+        return [
+            {
+                "Camion": i + 1,
+                "Quai": self.quai[i] + 1,
+                "Debut_Chargement": debut[i],
+                "Fin_Operation": debut[i] + self.p[i],
+                "Retard": max(0, debut[i] + self.p[i] - d[i]),
+                "Cout_Penalite": 1 if self.a[i][self.quai[i]] == 0 else 0,
+            }
+            for i in range(len(self.quai))
+        ]
+
+
+def ordonnancement_par_liste(N, M, p, r, prep, a, C_swap, regle="ERD", disponibilite=None):
+    """
+    Ordonnancement de liste: les camions sont pris par date de disponibilité
+    croissante ("ERD") ou par temps de traitement décroissant ("LPT") et
+    placés sur le quai minimisant max(Cmax courant, fin du camion) + pénalité
+    C_swap si le quai n'est pas autorisé (à égalité: fin la plus tôt).
+    disponibilite[k]: date à laquelle le quai k se libère (0 par défaut).
+    Retourne la liste des quais (indices 0..M-1) affectés.
+    """
+    e = _date_debut_min(N, r, prep)
+    if regle == "ERD":
+        ordre = sorted(range(N), key=lambda i: (e[i], -p[i]))
+    elif regle == "LPT":
+        ordre = sorted(range(N), key=lambda i: (-p[i], e[i]))
+    else:
+        raise ValueError(f"Règle inconnue: {regle}")
+
+    disponible = [float(t) for t in disponibilite] if disponibilite is not None else [0.0] * M
+    cmax = max(disponible)
+    affectation = [0] * N
+    for i in ordre:
+        meilleur = None
+        for k in range(M):
+            fin = max(disponible[k], e[i]) + p[i]
+            critere = (max(cmax, fin) + (C_swap if a[i][k] == 0 else 0), fin)
+            if meilleur is None or critere < meilleur[0]:
+                meilleur = (critere, k, fin)
+        _, k, fin = meilleur
+        affectation[i] = k
+        disponible[k] = fin
+        cmax = max(cmax, fin)
+    return affectation
+
+
+def _recherche_locale(planning, echeance, eps=1e-9):
+    """
+    Insertion puis échange en première amélioration. Critère: (coût,
+    somme des fins de quai), le second terme départageant les mouvements qui
+    soulagent un quai critique sans encore baisser le makespan.
+    """
+    M = planning.M
+    N = len(planning.quai)
+    a = planning.a
+    C_swap = planning.C_swap
+
+    ameliore = True
+    while ameliore and time.time() < echeance:
+        ameliore = False
+        fins = [planning.fin_quai(k) for k in range(M)]
+        cmax = max(fins)
+        critere = (cmax + C_swap * planning.penalites, sum(fins))
+
+        def nouveau_critere(modifs, delta_penalites):
+            nouvelles = list(fins)
+            for k, fin in modifs:
+                nouvelles[k] = fin
+            return (max(nouvelles) + C_swap * (planning.penalites + delta_penalites),
+                    sum(nouvelles))
+
+        # Insertion: déplacer un camion vers un autre quai
+        for i in range(N):
+            ancien = planning.quai[i]
+            fin_ancien = planning.fin_sans(ancien, i)
+            for k in range(M):
+                if k == ancien:
+                    continue
+                delta = (a[i][k] == 0) - (a[i][ancien] == 0)
+                candidat = nouveau_critere(
+                    [(ancien, fin_ancien), (k, planning.fin_avec(k, i))], delta
+                )
+                if candidat[0] < critere[0] - eps or (
+                        candidat[0] <= critere[0] + eps and candidat[1] < critere[1] - eps):
+                    planning.deplacer(i, k)
+                    ameliore = True
+                    break
+            if ameliore or time.time() > echeance:
+                break
+        if ameliore:
+            continue
+
+        # Échange: un camion d'un quai critique contre un camion d'un autre quai
+        critiques = [k for k in range(M) if fins[k] >= cmax - eps]
+        for k1 in critiques:
+            for i in list(planning.sequences[k1]):
+                for j in range(N):
+                    k2 = planning.quai[j]
+                    if k2 == k1:
+                        continue
+                    delta = ((a[i][k2] == 0) + (a[j][k1] == 0)
+                             - (a[i][k1] == 0) - (a[j][k2] == 0))
+                    candidat = nouveau_critere(
+                        [(k1, planning.fin_avec(k1, j, retire=i)),
+                         (k2, planning.fin_avec(k2, i, retire=j))], delta
+                    )
+                    if candidat[0] < critere[0] - eps or (
+                            candidat[0] <= critere[0] + eps and candidat[1] < critere[1] - eps):
+                        planning.deplacer(i, k2)
+                        planning.deplacer(j, k1)
+                        ameliore = True
+                        break
+                if ameliore or time.time() > echeance:
+                    break
+            if ameliore or time.time() > echeance:
+                break
+
+
+def resoudre_ordonnancement_heuristique(N, M, p, r, d, prep, a, C_swap, regle=None, temps_limite=1.0,
+                                        disponibilite=None):
+    """
+    Heuristique d'ordonnancement des camions (même retour que
+    resoudre_ordonnancement_avance): ordonnancement de liste ERD et LPT (ou la
+    seule `regle` demandée), puis recherche locale par insertion et échange
+    sur la meilleure des deux, dans la limite de `temps_limite` secondes.
+    disponibilite[k]: date à laquelle le quai k se libère (0 par défaut).
+    Les données peuvent être des listes ou des tableaux NumPy.
+
+    La solution retournée peut servir de MIP start:
+    resoudre_ordonnancement_avance(..., solution_initiale=solution).
+    """
+    if N == 0 or M == 0:
+        return 0, 0, "Aucun camion ou quai à planifier."
+    p, r, d, prep, a = en_listes(p, r, d, prep, a)
+
+    echeance = time.time() + temps_limite
+    e = _date_debut_min(N, r, prep)
+    plannings = [
+        _Planning(N, M, p, e, a, C_swap,
+                  ordonnancement_par_liste(N, M, p, r, prep, a, C_swap, regle, disponibilite),
+                  disponibilite)
+        for regle in ([regle] if regle else ["ERD", "LPT"])
+    ]
+    planning = min(plannings, key=_Planning.cout)
+    _recherche_locale(planning, echeance)
+    return planning.cmax(), planning.penalites, planning.solution(d)
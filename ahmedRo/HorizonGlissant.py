@@ -0,0 +1,158 @@
+import time
+
+from ModeleGurobi import resoudre_ordonnancement_avance
+from HeuristiqueQuais import resoudre_ordonnancement_heuristique
+
+
+class PlanificateurGlissant:
+    """
+    Ordonnancement à horizon glissant des camions arrivant dans la journée.
+
+    Les événements (arrivée, retard) sont enregistrés au fil de l'eau; à
+    chaque replanification à la date `maintenant`:
+      1. les camions dont le chargement a commencé sont figés (quai et début)
+         et occupent leur quai jusqu'à leur fin;
+      2. les camions non commencés disponibles avant maintenant + fenetre
+         (au plus taille_fenetre_max, par date de disponibilité) sont
+         optimisés par le PLNE compact, démarré depuis l'heuristique;
+      3. les camions au-delà de la fenêtre sont placés par l'heuristique à la
+         suite de la fenêtre.
+    Chaque replanification tient dans `budget` secondes (heuristique puis PLNE
+    sur le temps restant); sans événement depuis la dernière, le plan courant
+    reste valide et est retourné tel quel.
+
+    L'horloge du planificateur (`maintenant`) est la date de la dernière
+    replanification; elle ne recule jamais.
+    """
+
+    def __init__(self, M, C_swap, fenetre=60.0, taille_fenetre_max=12, budget=1.0):
+        self.M = M
+        self.C_swap = C_swap
+        self.fenetre = fenetre
+        self.taille_fenetre_max = taille_fenetre_max
+        self.budget = budget
+        self.p, self.r, self.d, self.prep, self.a = [], [], [], [], []
+        self.plan = {}          # {camion: (quai 0..M-1, début)}
+        self.maintenant = 0.0   # date de la dernière replanification
+        self.modifie = False
+        self.dernier_resultat = (0, 0, [])
+
+    # --- Événements ---
+    def ajouter_camion(self, p, r, d, prep=0.0, autorisations=None):
+        """Enregistre l'arrivée annoncée d'un camion; retourne son indice (0..N-1)."""
+        self.p.append(p)
+        self.r.append(r)
+        self.d.append(d)
+        self.prep.append(prep)
+        self.a.append(list(autorisations) if autorisations is not None else [1] * self.M)
+        self.modifie = True
+        return len(self.p) - 1
+
+    def retarder_camion(self, i, nouvelle_date, maintenant=None):
+        """
+        Nouvelle date de disponibilité r_i; refusé (ValueError) si le
+        chargement a commencé à `maintenant` (par défaut l'horloge du
+        planificateur).
+        """
+        maintenant = self._horloge(maintenant)
+        if self._commence(i, maintenant):
+            raise ValueError(f"Le camion {i + 1} est déjà en chargement")
+        self.r[i] = nouvelle_date
+        self.modifie = True
+
+    def _horloge(self, maintenant):
+        if maintenant is None:
+            return self.maintenant
+        return max(maintenant, self.maintenant)
+
+    def _commence(self, i, maintenant):
+        return i in self.plan and self.plan[i][1] < maintenant
+
+    # --- Replanification ---
+    def replanifier(self, maintenant):
+        """Retourne (Cmax, P_cost, solution) au format de resoudre_ordonnancement_avance."""
+        self.maintenant = maintenant = self._horloge(maintenant)
+        if not self.modifie:
+            return self.dernier_resultat
+        echeance = time.time() + self.budget
+        N, M = len(self.p), self.M
+
+        figes = {i for i in range(N) if self._commence(i, maintenant)}
+        disponibilite = [0.0] * M
+        for i in figes:
+            k, debut = self.plan[i]
+            disponibilite[k] = max(disponibilite[k], debut + self.p[i])
+
+        # Un camion non commencé ne peut débuter avant maintenant
+        libres = sorted(
+            (i for i in range(N) if i not in figes),
+            key=lambda i: (self.r[i] + self.prep[i], i),
+        )
+        r_eff = {i: max(self.r[i], maintenant - self.prep[i]) for i in libres}
+        fenetre = [i for i in libres if self.r[i] + self.prep[i] <= maintenant + self.fenetre]
+        fenetre = fenetre[:self.taille_fenetre_max]
+        suite = libres[len(fenetre):]
+
+        disponibilite = self._planifier(fenetre, r_eff, disponibilite, echeance, exact=True)
+        self._planifier(suite, r_eff, disponibilite, echeance, exact=False)
+
+        self.modifie = False
+        self.dernier_resultat = self._resultat()
+        return self.dernier_resultat
+
+    def _planifier(self, camions, r_eff, disponibilite, echeance, exact):
+        """Planifie `camions` sur les quais libérés à `disponibilite`; retourne les nouvelles disponibilités."""
+        if not camions:
+            return disponibilite
+        n = len(camions)
+        donnees = (
+            n, self.M,
+            [self.p[i] for i in camions],
+            [r_eff[i] for i in camions],
+            [self.d[i] for i in camions],
+            [self.prep[i] for i in camions],
+            [self.a[i] for i in camions],
+            self.C_swap,
+        )
+        restant = max(0.0, echeance - time.time())
+        _, _, solution = resoudre_ordonnancement_heuristique(
+            *donnees, temps_limite=restant / 2 if exact else restant,
+            disponibilite=disponibilite,
+        )
+        # Marge réservée à la construction du modèle et à l'extraction
+        restant = 0.8 * (echeance - time.time())
+        if exact and restant > 0:
+            _, _, exacte = resoudre_ordonnancement_avance(
+                *donnees, formulation="compacte", solution_initiale=solution,
+                temps_limite=restant, disponibilite=disponibilite,
+            )
+            # Solution du PLNE si trouvée (sinon instance trop grande ou délai dépassé)
+            if not isinstance(exacte, str):
+                solution = exacte
+
+        disponibilite = list(disponibilite)
+        for res in solution:
+            i = camions[res["Camion"] - 1]
+            k = res["Quai"] - 1
+            self.plan[i] = (k, res["Debut_Chargement"])
+            disponibilite[k] = max(disponibilite[k], res["Fin_Operation"])
+        return disponibilite
+
+    def _resultat(self):
+        solution = []
+        for i in range(len(self.p)):
+            k, debut = self.plan[i]
+            fin = debut + self.p[i]
+            solution.append({
+                "Camion": i + 1,
+                "Quai": k + 1,
+                "Debut_Chargement": debut,
+                "Fin_Operation": fin,
+                "Retard": max(0, fin - self.d[i]),
+                "Cout_Penalite": 1 if self.a[i][k] == 0 else 0,
+            })
+        if not solution:
+            return 0, 0, []
+        cmax = max(s["Fin_Operation"] for s in solution)
+        penalites = sum(s["Cout_Penalite"] for s in solution)
+        return cmax, penalites, solution
@@ -1,24 +1,60 @@
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QPushButton, QTableWidget, QTableWidgetItem,
+    QTabWidget, QPushButton, QTableWidget, QTableWidgetItem, QTableView,
     QMessageBox, QLineEdit, QLabel, QHeaderView, QGroupBox,
-    QProgressBar, QSpinBox, QDoubleSpinBox, QFileDialog, QSplitter
+    QProgressBar, QSpinBox, QDoubleSpinBox, QFileDialog, QSplitter, QComboBox
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QAbstractTableModel, QModelIndex,
+    QThread
 )
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor, QIcon
 
 # Import Matplotlib pour le diagramme de Gantt
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.patches as mpatches
+from matplotlib.ticker import MaxNLocator
+from matplotlib.collections import PolyCollection, LineCollection
 
 # Import du module Gurobi
 from ModeleGurobi import resoudre_ordonnancement_avance 
+from HeuristiqueQuais import resoudre_ordonnancement_heuristique
+from BalayageParametres import balayer_parametres
+from DonneesCamions import (
+    COLONNES, VALEURS_DEFAUT, donnees_vides, valider_donnees, charger_csv, charger_json
+)
 import numpy as np
 import json
 from datetime import datetime
 
+# Au-delà, étiquettes par camion masquées et graduations espacées (illisibles et coûteuses)
+ETIQUETTES_MAX = 60
+
+
+def _rectangles(x, largeur, y, hauteur):
+    """Sommets (n, 4, 2) de n rectangles, pour un seul PolyCollection."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x2 = x + np.asarray(largeur, dtype=float)
+    y2 = y + np.asarray(hauteur, dtype=float)
+    return np.stack([
+        np.column_stack([x, y]), np.column_stack([x2, y]),
+        np.column_stack([x2, y2]), np.column_stack([x, y2]),
+    ], axis=1)
+
+
+def _signature(valeur):
+    """Représentation hachable des entrées d'un graphique (détection des changements)."""
+    if isinstance(valeur, dict):
+        return tuple(sorted((k, _signature(v)) for k, v in valeur.items()))
+    if isinstance(valeur, (list, tuple)):
+        return tuple(_signature(v) for v in valeur)
+    if isinstance(valeur, np.ndarray):
+        return (valeur.shape, valeur.tobytes())
+    return valeur
+
 
 class MplCanvas(FigureCanvas):
     """Classe pour intégrer un graphique Matplotlib dans une fenêtre PyQt."""
@@ -139,6 +175,154 @@ class StatsWidget(QWidget):
         self.stats_labels["delays"].setText(f"{delays:.2f}")
 
 
+def _formater(valeur):
+    return f"{valeur:g}" if np.isfinite(valeur) else ""
+
+
+class CamionsTableModel(QAbstractTableModel):
+    """
+    Propriétés des camions (p, r, d, prep), un tableau NumPy float64 par
+    colonne: la vue ne lit que les cellules visibles et un import n'est qu'un
+    remplacement de tableaux. Une saisie non numérique est refusée.
+    """
+    EN_TETES = ["⏱️ Temps Traitement (p)", "🕐 Date Dispo (r)",
+                "📅 Date Échéance (d)", "🔧 Temps Prépa (prep)"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        vides = donnees_vides(0)
+        self.colonnes = {c: vides[c] for c in COLONNES}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.colonnes["p"])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLONNES)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return _formater(self.colonnes[COLONNES[index.column()]][index.row()])
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        try:
+            valeur = float(str(value).strip().replace(",", "."))
+        except ValueError:
+            return False
+        self.colonnes[COLONNES[index.column()]][index.row()] = valeur
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.EN_TETES[section]
+        return f"C{section + 1}"
+
+    def ajouter_camion(self, valeurs=VALEURS_DEFAUT):
+        ligne = self.rowCount()
+        self.beginInsertRows(QModelIndex(), ligne, ligne)
+        for c, v in zip(COLONNES, valeurs):
+            self.colonnes[c] = np.append(self.colonnes[c], float(v))
+        self.endInsertRows()
+
+    def supprimer_dernier(self):
+        ligne = self.rowCount() - 1
+        self.beginRemoveRows(QModelIndex(), ligne, ligne)
+        for c in COLONNES:
+            self.colonnes[c] = self.colonnes[c][:-1]
+        self.endRemoveRows()
+
+    def set_donnees(self, donnees):
+        """donnees: {"p", "r", "d", "prep": tableaux de même longueur}."""
+        self.beginResetModel()
+        self.colonnes = {c: np.array(donnees[c], dtype=float) for c in COLONNES}
+        self.endResetModel()
+
+    def tableaux(self):
+        """Copies de p, r, d, prep (les modifications de la table n'affectent pas un calcul en cours)."""
+        return tuple(self.colonnes[c].copy() for c in COLONNES)
+
+
+class AutorisationsTableModel(QAbstractTableModel):
+    """Matrice d'autorisation N x M (int8): 1 = affectation autorisée, 0 = interdite."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.a = donnees_vides(0)["a"]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.a.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.a.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return str(self.a[index.row(), index.column()])
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or str(value).strip() not in ("0", "1"):
+            return False
+        self.a[index.row(), index.column()] = int(str(value).strip())
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return f"🏭 Quai {section + 1}"
+        return f"C{section + 1}"
+
+    def redimensionner(self, N, M):
+        """Conserve les valeurs existantes; les nouvelles cellules sont autorisées (1)."""
+        if self.a.shape == (N, M):
+            return
+        a = np.ones((N, M), dtype=np.int8)
+        n, m = min(N, self.a.shape[0]), min(M, self.a.shape[1])
+        a[:n, :m] = self.a[:n, :m]
+        self.set_matrice(a)
+
+    def set_matrice(self, a):
+        self.beginResetModel()
+        self.a = np.array(a, dtype=np.int8)
+        self.endResetModel()
+
+
+class BalayageWorker(QThread):
+    """Exécute balayer_parametres hors du thread de l'interface."""
+    termine = pyqtSignal(object, object)  # resultats, pareto
+    echec = pyqtSignal(str)
+
+    def __init__(self, *arguments, **options):
+        super().__init__()
+        self.arguments = arguments
+        self.options = options
+
+    def run(self):
+        try:
+            resultats, pareto = balayer_parametres(*self.arguments, **self.options)
+        except Exception as e:
+            self.echec.emit(str(e))
+        else:
+            self.termine.emit(resultats, pareto)
+
+
 class OrdonnancementApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -148,6 +332,11 @@ class OrdonnancementApp(QMainWindow):
         self.M = 2  # Nombre de quais initial
         self.N = 0  # Nombre de camions initial
         self.current_solution = None  # Stocker la solution actuelle
+        # Graphiques rendus à la première ouverture de leur onglet, et seulement
+        # si leurs entrées ont changé depuis le dernier rendu
+        self._graphiques = {}   # onglet -> [(fonction de tracé, arguments)]
+        self._signatures = {}   # nom de la fonction -> signature du dernier rendu
+        self._balayage_worker = None  # thread du balayage en cours (gardé jusqu'à sa fin)
         
         # Appliquer le thème sombre
         self._apply_dark_theme()
@@ -159,6 +348,7 @@ class OrdonnancementApp(QMainWindow):
         self.layout.setContentsMargins(15, 15, 15, 15)
         
         self._setup_ui()
+        self.tabs.currentChanged.connect(self._dessiner_onglet_courant)
         self.add_truck_row()  # Ajout d'un camion par défaut
         
     def _apply_dark_theme(self):
@@ -200,7 +390,7 @@ class OrdonnancementApp(QMainWindow):
             QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
                 border: 2px solid #4CAF50;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 alternate-background-color: #323232;
                 color: white;
@@ -208,10 +398,10 @@ class OrdonnancementApp(QMainWindow):
                 border: 1px solid #3d3d3d;
                 border-radius: 5px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #4CAF50;
             }
             QHeaderView::section {
@@ -325,6 +515,16 @@ class OrdonnancementApp(QMainWindow):
         self.cswap_input.setToolTip("Coût unitaire pour affectations non autorisées")
         control_layout.addWidget(self.cswap_input)
         
+        control_layout.addWidget(QLabel("Méthode:"))
+        self.methode_input = QComboBox()
+        self.methode_input.addItems(["PLNE (Gurobi)", "Heuristique", "Heuristique + PLNE"])
+        self.methode_input.setToolTip(
+            "PLNE: solution optimale (petites instances)\n"
+            "Heuristique: liste + recherche locale, centaines de camions en moins d'une seconde\n"
+            "Heuristique + PLNE: la solution heuristique sert de point de départ au PLNE"
+        )
+        control_layout.addWidget(self.methode_input)
+        
         control_layout.addStretch()
         
         # Boutons d'action avec icônes
@@ -358,6 +558,14 @@ class OrdonnancementApp(QMainWindow):
         self.save_btn.clicked.connect(self.save_data)
         action_layout.addWidget(self.save_btn)
         
+        self.import_btn = ModernButton("Importer", "#795548", "📥")
+        self.import_btn.setToolTip(
+            "Importer des camions depuis un fichier CSV (colonnes p, r, d, prep, quai_1 ... quai_M)\n"
+            "ou JSON (fichier de sauvegarde)"
+        )
+        self.import_btn.clicked.connect(self.import_data)
+        action_layout.addWidget(self.import_btn)
+        
         action_layout.addStretch()
         
         self.optimize_btn = ModernButton("🚀 Lancer l'Optimisation", "#4CAF50")
@@ -385,18 +593,21 @@ class OrdonnancementApp(QMainWindow):
         self.tab_gantt = QWidget()
         self.tab_charts = QWidget()
         self.tab_analysis = QWidget()
+        self.tab_pareto = QWidget()
         
         self.tabs.addTab(self.tab_input, "📝 Saisie des Données")
         self.tabs.addTab(self.tab_results, "📊 Résultats & Métriques")
         self.tabs.addTab(self.tab_gantt, "📈 Diagramme de Gantt")
         self.tabs.addTab(self.tab_charts, "📊 Graphiques Détaillés")
         self.tabs.addTab(self.tab_analysis, "🔍 Analyse Avancée")
+        self.tabs.addTab(self.tab_pareto, "⚖️ Compromis Cmax / Pénalité")
         
         self._setup_input_tab()
         self._setup_results_tab()
         self._setup_gantt_tab()
         self._setup_charts_tab()
         self._setup_analysis_tab()
+        self._setup_pareto_tab()
         
         main_splitter.addWidget(self.tabs)
         
@@ -426,14 +637,9 @@ class OrdonnancementApp(QMainWindow):
         help_label.setWordWrap(True)
         camions_layout.addWidget(help_label)
         
-        self.camions_table = QTableWidget()
-        self.camions_table.setColumnCount(4)
-        self.camions_table.setHorizontalHeaderLabels([
-            "⏱️ Temps Traitement (p)", 
-            "🕐 Date Dispo (r)", 
-            "📅 Date Échéance (d)", 
-            "🔧 Temps Prépa (prep)"
-        ])
+        self.camions_model = CamionsTableModel(self)
+        self.camions_table = QTableView()
+        self.camions_table.setModel(self.camions_model)
         self.camions_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.camions_table.setAlternatingRowColors(True)
         camions_layout.addWidget(self.camions_table)
@@ -450,7 +656,10 @@ class OrdonnancementApp(QMainWindow):
         help_label2.setStyleSheet("color: #aaa; font-size: 12px; padding: 5px;")
         affectation_layout.addWidget(help_label2)
         
-        self.affectation_table = QTableWidget()
+        self.affectation_model = AutorisationsTableModel(self)
+        self.affectation_table = QTableView()
+        self.affectation_table.setModel(self.affectation_model)
+        self.affectation_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.affectation_table.setAlternatingRowColors(True)
         affectation_layout.addWidget(self.affectation_table)
         
@@ -577,55 +786,60 @@ class OrdonnancementApp(QMainWindow):
         
         analysis_layout.addWidget(analysis_container)
         
-    def update_tables_structure(self):
-        """Met à jour les dimensions des tableaux de saisie."""
-        try:
-            self.M = self.quais_input.value()
-        except:
-            self.M = 2
-            
-        self.N = self.camions_table.rowCount()
+    def _setup_pareto_tab(self):
+        """Configuration de l'onglet de balayage des paramètres (M, C_swap)."""
+        pareto_layout = QVBoxLayout(self.tab_pareto)
+        pareto_layout.setSpacing(10)
         
-        # Mise à jour du tableau d'affectation
-        self.affectation_table.setRowCount(self.N)
-        self.affectation_table.setColumnCount(self.M)
+        title = QLabel("⚖️ Compromis Makespan / Pénalité selon M et C_swap")
+        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #4CAF50; padding: 10px;")
+        pareto_layout.addWidget(title)
+        
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Quais (M):"))
+        self.balayage_M_input = QLineEdit("2, 3, 4")
+        self.balayage_M_input.setToolTip("Nombres de quais à évaluer, séparés par des virgules")
+        controls.addWidget(self.balayage_M_input)
+        
+        controls.addWidget(QLabel("C_swap:"))
+        self.balayage_cswap_input = QLineEdit("0, 1, 5, 20, 100, 1000")
+        self.balayage_cswap_input.setToolTip("Coûts de pénalité à évaluer, séparés par des virgules")
+        controls.addWidget(self.balayage_cswap_input)
+        
+        controls.addWidget(QLabel("PLNE par réglage (s):"))
+        self.balayage_temps_input = QDoubleSpinBox()
+        self.balayage_temps_input.setRange(0.1, 600)
+        self.balayage_temps_input.setValue(2)
+        self.balayage_temps_input.setFixedWidth(80)
+        controls.addWidget(self.balayage_temps_input)
+        
+        self.balayage_btn = ModernButton("Lancer le Balayage", "#3F51B5", "⚖️")
+        self.balayage_btn.setToolTip(
+            "Résout chaque réglage (M, C_swap) en parallèle et trace les réglages efficaces"
+        )
+        self.balayage_btn.clicked.connect(self.run_parameter_sweep)
+        controls.addWidget(self.balayage_btn)
+        pareto_layout.addLayout(controls)
         
-        quai_labels = [f"🏭 Quai {k+1}" for k in range(self.M)]
-        self.affectation_table.setHorizontalHeaderLabels(quai_labels)
+        self.pareto_canvas = MplCanvas(self, width=10, height=6, dpi=100)
+        pareto_layout.addWidget(self.pareto_canvas)
         
-        for i in range(self.N):
-            for k in range(self.M):
-                item = self.affectation_table.item(i, k)
-                if item is None:
-                    item = QTableWidgetItem("1")
-                    self.affectation_table.setItem(i, k, item)
-                    
-            self.camions_table.setVerticalHeaderItem(i, QTableWidgetItem(f"C{i+1}"))
-            self.affectation_table.setVerticalHeaderItem(i, QTableWidgetItem(f"C{i+1}"))
-            
-        self.affectation_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    def update_tables_structure(self):
+        """Met à jour les dimensions de la matrice d'affectation."""
+        self.M = self.quais_input.value()
+        self.N = self.camions_model.rowCount()
+        self.affectation_model.redimensionner(self.N, self.M)
         
     def add_truck_row(self):
         """Ajoute une ligne de camion dans les tableaux."""
-        current_row = self.camions_table.rowCount()
-        self.camions_table.insertRow(current_row)
-        
-        default_values = ["10", "0", "20", "2"]
-        for col, val in enumerate(default_values):
-            self.camions_table.setItem(current_row, col, QTableWidgetItem(val))
-            
+        self.camions_model.ajouter_camion()
         self.update_tables_structure()
-        self.N = self.camions_table.rowCount()
         self._update_status("✅ Camion ajouté", "#4CAF50")
         
     def remove_truck_row(self):
         """Supprime la dernière ligne de camion."""
-        current_row = self.camions_table.rowCount()
-        
-        if current_row > 0:
-            self.camions_table.removeRow(current_row - 1)
-            self.affectation_table.removeRow(current_row - 1)
-            self.N = current_row - 1
+        if self.camions_model.rowCount() > 0:
+            self.camions_model.supprimer_dernier()
             self.update_tables_structure()
             self._update_status("✅ Camion supprimé", "#FF9800")
         else:
@@ -641,39 +855,32 @@ class OrdonnancementApp(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.camions_table.setRowCount(0)
-            self.affectation_table.setRowCount(0)
-            self.N = 0
+            self.camions_model.set_donnees(donnees_vides(self.M))
+            self.update_tables_structure()
             self.results_table.setRowCount(0)
             self.sc.axes.clear()
             self.sc.draw()
+            self._graphiques = {}
+            self._signatures = {}
             self._update_status("🔄 Données effacées", "#f44336")
             
     def load_example_data(self):
         """Charge un exemple de données prédéfini."""
-        # Effacer les données actuelles
-        self.camions_table.setRowCount(0)
-        self.N = 0
-        
-        # Configuration de l'exemple
+        # 3 camions (colonnes p, r, d, prep) sur 3 quais
+        examples = np.array([
+            [10, 0, 25, 2],
+            [8, 5, 20, 1],
+            [12, 0, 30, 3],
+        ], dtype=float)
         self.quais_input.setValue(3)
-        
-        # Ajouter 3 camions avec données d'exemple
-        examples = [
-            ["10", "0", "25", "2"],
-            ["8", "5", "20", "1"],
-            ["12", "0", "30", "3"],
-        ]
-        
-        for data in examples:
-            self.add_truck_row()
-            row = self.camions_table.rowCount() - 1
-            for col, val in enumerate(data):
-                self.camions_table.setItem(row, col, QTableWidgetItem(val))
+        self.camions_model.set_donnees(dict(zip(COLONNES, examples.T)))
         
         # Restrictions d'exemple
-        self.affectation_table.setItem(0, 2, QTableWidgetItem("0"))
-        self.affectation_table.setItem(2, 0, QTableWidgetItem("0"))
+        a = np.ones((3, 3), dtype=np.int8)
+        a[0, 2] = 0
+        a[2, 0] = 0
+        self.affectation_model.set_matrice(a)
+        self.update_tables_structure()
         
         self._update_status("✅ Exemple chargé", "#4CAF50")
         QMessageBox.information(
@@ -705,11 +912,11 @@ class OrdonnancementApp(QMainWindow):
                 save_dict = {
                     "N": N,
                     "M": M,
-                    "p": p,
-                    "r": r,
-                    "d": d,
-                    "prep": prep,
-                    "a": a,
+                    "p": p.tolist(),
+                    "r": r.tolist(),
+                    "d": d.tolist(),
+                    "prep": prep.tolist(),
+                    "a": a.tolist(),
                     "C_swap": C_swap,
                     "timestamp": datetime.now().isoformat()
                 }
@@ -760,50 +967,51 @@ class OrdonnancementApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Erreur", f"Erreur lors de l'export:\n{e}")
                 
-    def get_input_data(self):
-        """Récupère et valide toutes les données d'entrée."""
+    def import_data(self):
+        """Importe les camions et la matrice d'affectation depuis un fichier CSV ou JSON."""
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Importer des données", "", "Données (*.csv *.json);;Tous les fichiers (*)"
+        )
+        if not filename:
+            return
         try:
-            M = self.quais_input.value()
-            C_swap = self.cswap_input.value()
-            N = self.camions_table.rowCount()
-            
-            if N == 0 or M == 0:
-                QMessageBox.warning(self, "Attention", "Veuillez ajouter au moins un camion et un quai.")
-                return None
-            
-            p, r, d, prep = [], [], [], []
-            a = np.zeros((N, M), dtype=int)
-            
-            for i in range(N):
-                try:
-                    p.append(float(self.camions_table.item(i, 0).text()))
-                    r.append(float(self.camions_table.item(i, 1).text()))
-                    d.append(float(self.camions_table.item(i, 2).text()))
-                    prep.append(float(self.camions_table.item(i, 3).text()))
-                except:
-                    QMessageBox.critical(
-                        self, 
-                        "Erreur", 
-                        f"Valeur invalide pour le camion {i+1}.\nVeuillez vérifier les données."
-                    )
-                    return None
-            
-            for i in range(N):
-                for k in range(M):
-                    try:
-                        a[i, k] = int(self.affectation_table.item(i, k).text())
-                    except:
-                        a[i, k] = 1
-                        
-            return N, M, p, r, d, prep, a.tolist(), C_swap
+            if filename.lower().endswith(".json"):
+                donnees = charger_json(filename)
+            else:
+                donnees = charger_csv(filename, M=self.quais_input.value())
+            a = donnees["a"]
+            if not 1 <= a.shape[1] <= self.quais_input.maximum():
+                raise ValueError(f"{a.shape[1]} quais (entre 1 et {self.quais_input.maximum()} attendus)")
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Erreur d'Import", f"Import impossible:\n{e}")
+            return
         
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Erreur de Saisie", 
-                f"Veuillez vérifier les valeurs.\nDétail: {e}"
-            )
+        self.camions_model.set_donnees(donnees)
+        self.affectation_model.set_matrice(a)
+        self.quais_input.setValue(a.shape[1])
+        if "C_swap" in donnees:
+            self.cswap_input.setValue(donnees["C_swap"])
+        self.update_tables_structure()
+        self._update_status(f"✅ {self.N} camions importés", "#4CAF50")
+        
+    def get_input_data(self):
+        """Récupère et valide toutes les données d'entrée (tableaux NumPy)."""
+        M = self.quais_input.value()
+        C_swap = self.cswap_input.value()
+        N = self.camions_model.rowCount()
+        
+        if N == 0 or M == 0:
+            QMessageBox.warning(self, "Attention", "Veuillez ajouter au moins un camion et un quai.")
             return None
+        
+        p, r, d, prep = self.camions_model.tableaux()
+        a = self.affectation_model.a.copy()
+        try:
+            valider_donnees(p, r, d, prep, a)
+        except ValueError as e:
+            QMessageBox.critical(self, "Erreur de Saisie", f"Veuillez vérifier les valeurs:\n{e}")
+            return None
+        return N, M, p, r, d, prep, a, C_swap
             
     def run_optimization(self):
         """Lance l'optimisation Gurobi et affiche les résultats."""
@@ -822,9 +1030,20 @@ class OrdonnancementApp(QMainWindow):
         QApplication.processEvents()
         
         # Appel du solveur
-        Cmax_opt, P_cost_opt, solution = resoudre_ordonnancement_avance(
-            N, M, p, r, d, prep, a, C_swap
-        )
+        methode = self.methode_input.currentText()
+        if methode == "PLNE (Gurobi)":
+            Cmax_opt, P_cost_opt, solution = resoudre_ordonnancement_avance(
+                N, M, p, r, d, prep, a, C_swap, formulation="compacte"
+            )
+        else:
+            Cmax_opt, P_cost_opt, solution = resoudre_ordonnancement_heuristique(
+                N, M, p, r, d, prep, a, C_swap
+            )
+            if methode == "Heuristique + PLNE" and not isinstance(solution, str):
+                Cmax_opt, P_cost_opt, solution = resoudre_ordonnancement_avance(
+                    N, M, p, r, d, prep, a, C_swap, formulation="compacte",
+                    solution_initiale=solution
+                )
         
         self.progress_bar.setVisible(False)
         self.optimize_btn.setEnabled(True)
@@ -884,16 +1103,8 @@ class OrdonnancementApp(QMainWindow):
                     item.setForeground(QColor(statut_color))
                 self.results_table.setItem(i, col, item)
         
-        # Génération du diagramme de Gantt
-        self.draw_gantt(N, M, solution, d, r, prep)
-        
-        # Génération des graphiques détaillés
-        self.draw_utilization_chart(N, M, solution, p)
-        self.draw_delays_chart(N, solution, d)
-        
-        # Génération des graphiques d'analyse
-        self.draw_timeline_chart(N, solution, p, r, prep)
-        self.draw_workload_pie(N, M, solution, p)
+        # Diagramme de Gantt et graphiques: rendus à l'ouverture de leur onglet
+        self._programmer_graphiques(N, M, solution, p, r, d, prep)
         
         # Activer les boutons d'export
         self.export_btn.setEnabled(True)
@@ -902,19 +1113,88 @@ class OrdonnancementApp(QMainWindow):
         self._update_status("✅ Optimisation terminée avec succès", "#4CAF50")
         self.tabs.setCurrentIndex(1)  # Passer à l'onglet résultats
         
+    def run_parameter_sweep(self):
+        """Balaye les réglages (M, C_swap) en parallèle et trace les réglages efficaces."""
+        data = self.get_input_data()
+        if data is None:
+            return
+        N, M, p, r, d, prep, a, C_swap = data
+        try:
+            valeurs_M = [int(v) for v in self.balayage_M_input.text().split(",") if v.strip()]
+            valeurs_C_swap = [float(v) for v in self.balayage_cswap_input.text().split(",") if v.strip()]
+        except ValueError:
+            QMessageBox.warning(self, "Attention", "Listes de M et de C_swap invalides (nombres séparés par des virgules).")
+            return
+        if not valeurs_M or not valeurs_C_swap or min(valeurs_M) < 1 or min(valeurs_C_swap) < 0:
+            QMessageBox.warning(self, "Attention", "Indiquez au moins un M >= 1 et un C_swap >= 0.")
+            return
+        
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        self._update_status(
+            f"⏳ Balayage de {len(set(valeurs_M)) * len(set(valeurs_C_swap))} réglages...", "#FF9800"
+        )
+        self.balayage_btn.setEnabled(False)
+        
+        # Balayage dans un thread: l'interface reste réactive pendant les résolutions
+        self._balayage_worker = BalayageWorker(
+            N, p, r, d, prep, a, valeurs_M, valeurs_C_swap,
+            temps_limite=self.balayage_temps_input.value()
+        )
+        self._balayage_worker.termine.connect(self._balayage_termine)
+        self._balayage_worker.echec.connect(self._balayage_echoue)
+        self._balayage_worker.finished.connect(self._balayage_fini)
+        self._balayage_worker.start()
+        
+    def _balayage_termine(self, resultats, pareto):
+        self._graphiques[self.tab_pareto] = [(self.draw_pareto, (resultats, pareto))]
+        self._dessiner_onglet_courant()
+        self._update_status(f"✅ Balayage terminé: {len(pareto)} réglages efficaces", "#4CAF50")
+        
+    def _balayage_echoue(self, message):
+        QMessageBox.critical(self, "Erreur", f"Erreur lors du balayage:\n{message}")
+        self._update_status("❌ Échec du balayage", "#f44336")
+        
+    def _balayage_fini(self):
+        self.progress_bar.setVisible(False)
+        self.balayage_btn.setEnabled(True)
+        
+    def closeEvent(self, event):
+        # Un QThread détruit en cours d'exécution interrompt le programme
+        if self._balayage_worker is not None:
+            self._balayage_worker.wait()
+        super().closeEvent(event)
+        
     def refresh_gantt(self):
-        """Actualise tous les diagrammes."""
+        """Actualise les graphiques avec les données saisies (seuls ceux modifiés sont redessinés)."""
         if self.current_solution:
             data = self.get_input_data()
             if data:
                 N, M, p, r, d, prep, a, C_swap = data
-                # Rafraîchir tous les graphiques
-                self.draw_gantt(N, M, self.current_solution, d, r, prep)
-                self.draw_utilization_chart(N, M, self.current_solution, p)
-                self.draw_delays_chart(N, self.current_solution, d)
-                self.draw_timeline_chart(N, self.current_solution, p, r, prep)
-                self.draw_workload_pie(N, M, self.current_solution, p)
-                self._update_status("🔄 Tous les graphiques actualisés", "#2196F3")
+                self._programmer_graphiques(N, M, self.current_solution, p, r, d, prep)
+                self._update_status("🔄 Graphiques actualisés", "#2196F3")
+
+    def _programmer_graphiques(self, N, M, solution, p, r, d, prep):
+        """Enregistre les graphiques de chaque onglet et dessine ceux de l'onglet visible."""
+        self._graphiques.update({
+            self.tab_gantt: [(self.draw_gantt, (N, M, solution, d, r, prep))],
+            self.tab_charts: [
+                (self.draw_utilization_chart, (N, M, solution, p)),
+                (self.draw_delays_chart, (N, solution, d)),
+            ],
+            self.tab_analysis: [
+                (self.draw_timeline_chart, (N, solution, p, r, prep)),
+                (self.draw_workload_pie, (N, M, solution, p)),
+            ],
+        })
+        self._dessiner_onglet_courant()
+
+    def _dessiner_onglet_courant(self, *args):
+        for fonction, arguments in self._graphiques.get(self.tabs.currentWidget(), []):
+            signature = _signature(arguments)
+            if self._signatures.get(fonction.__name__) != signature:
+                fonction(*arguments)
+                self._signatures[fonction.__name__] = signature
                 
     def draw_gantt(self, N, M, solution, d, r, prep):
         """Dessine un diagramme de Gantt simple et clair."""
@@ -924,59 +1204,42 @@ class OrdonnancementApp(QMainWindow):
         base_colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', 
                        '#00BCD4', '#FFEB3B', '#8BC34A', '#E91E63', '#3F51B5']
         
-        solution_sorted = sorted(solution, key=lambda x: (x['Quai'], x['Debut_Chargement']))
-        
-        for res in solution_sorted:
-            camion_index = res['Camion'] - 1
-            quai = res['Quai']
-            start_op = res['Debut_Chargement']
-            end_op = res['Fin_Operation']
-            duration = end_op - start_op
-            due_date = d[camion_index]
-            
-            color = base_colors[camion_index % len(base_colors)]
-            
-            # Barre de chargement principale (simple et nette)
-            self.sc.axes.barh(
-                quai, duration,
-                left=start_op,
-                height=0.5,
-                color=color,
-                alpha=0.85,
-                edgecolor='white',
-                linewidth=1.5
-            )
-            
-            # Ligne de deadline (simple)
-            self.sc.axes.axvline(
-                x=due_date, 
-                ymin=(quai - 0.4) / (M + 1), 
-                ymax=(quai + 0.4) / (M + 1),
-                color='#FFC107', 
-                linewidth=2, 
-                linestyle='--',
-                alpha=0.7
-            )
-            
-            # Indicateur de retard (si applicable)
-            if end_op > due_date:
-                self.sc.axes.plot(
-                    [due_date, end_op],
-                    [quai, quai],
-                    color='#f44336',
-                    linewidth=4,
-                    alpha=0.6
-                )
-            
-            # Label du camion (simple)
-            self.sc.axes.text(
-                start_op + duration / 2, quai,
-                f'C{camion_index+1}',
-                ha='center', va='center',
-                color='white',
-                fontsize=10,
-                fontweight='bold'
-            )
+        # Tous les camions en un seul PolyCollection, échéances et retards en LineCollection
+        camions = np.array([res['Camion'] - 1 for res in solution], dtype=int)
+        quais = np.array([res['Quai'] for res in solution], dtype=float)
+        debuts = np.array([res['Debut_Chargement'] for res in solution], dtype=float)
+        fins = np.array([res['Fin_Operation'] for res in solution], dtype=float)
+        echeances = np.asarray(d, dtype=float)[camions]
+        couleurs = [base_colors[i % len(base_colors)] for i in camions]
+        
+        # Barres de chargement
+        self.sc.axes.add_collection(PolyCollection(
+            _rectangles(debuts, fins - debuts, quais - 0.25, 0.5),
+            facecolors=couleurs, alpha=0.85, edgecolors='white', linewidths=1.5
+        ))
+        
+        # Lignes de deadline
+        self.sc.axes.add_collection(LineCollection(
+            np.stack([np.column_stack([echeances, quais - 0.3]),
+                      np.column_stack([echeances, quais + 0.3])], axis=1),
+            colors='#FFC107', linewidths=2, linestyles='--', alpha=0.7
+        ))
+        
+        # Indicateurs de retard
+        en_retard = fins > echeances
+        if en_retard.any():
+            self.sc.axes.add_collection(LineCollection(
+                np.stack([np.column_stack([echeances[en_retard], quais[en_retard]]),
+                          np.column_stack([fins[en_retard], quais[en_retard]])], axis=1),
+                colors='#f44336', linewidths=4, alpha=0.6
+            ))
+        
+        # Labels des camions (instances de taille raisonnable)
+        if len(solution) <= ETIQUETTES_MAX:
+            for i, q, x in zip(camions, quais, (debuts + fins) / 2):
+                self.sc.axes.text(x, q, f'C{i+1}', ha='center', va='center',
+                                  color='white', fontsize=10, fontweight='bold')
+        self.sc.axes.autoscale_view()
         
         # Configuration des axes (épurée)
         self.sc.axes.set_yticks(np.arange(1, M + 1))
@@ -1057,29 +1320,29 @@ class OrdonnancementApp(QMainWindow):
         
         # Préparer les données
         camions = [f'C{res["Camion"]}' for res in solution]
-        retards = [res['Retard'] for res in solution]
-        
-        # Couleurs : vert si à temps, rouge si en retard
-        colors = ['#4CAF50' if r == 0 else '#f44336' for r in retards]
-        
-        bars = self.chart2_canvas.axes.bar(
-            camions, retards, 
-            color=colors, 
-            alpha=0.8, 
-            edgecolor='white', 
-            linewidth=1.5,
-            width=0.6
-        )
+        retards = np.array([res['Retard'] for res in solution], dtype=float)
+        indices = np.arange(len(solution))
+        
+        # Couleurs : vert si à temps, rouge si en retard (un seul PolyCollection)
+        colors = np.where(retards == 0, '#4CAF50', '#f44336')
+        self.chart2_canvas.axes.add_collection(PolyCollection(
+            _rectangles(indices - 0.3, 0.6, np.zeros(len(solution)), retards),
+            facecolors=colors, alpha=0.8, edgecolors='white', linewidths=1.5
+        ))
+        pas = max(1, len(solution) // ETIQUETTES_MAX)
+        self.chart2_canvas.axes.set_xticks(indices[::pas])
+        self.chart2_canvas.axes.set_xticklabels(camions[::pas])
+        self.chart2_canvas.axes.set_xlim(-0.5, len(solution) - 0.5)
         
         # Valeurs uniquement pour les retards
-        for bar, value in zip(bars, retards):
-            if value > 0:
-                height = bar.get_height()
-                self.chart2_canvas.axes.text(
-                    bar.get_x() + bar.get_width()/2., height + 0.2,
-                    f'{value:.1f}',
-                    ha='center', va='bottom', color='white', fontsize=10, fontweight='bold'
-                )
+        if len(solution) <= ETIQUETTES_MAX:
+            for x, value in zip(indices, retards):
+                if value > 0:
+                    self.chart2_canvas.axes.text(
+                        x, value + 0.2,
+                        f'{value:.1f}',
+                        ha='center', va='bottom', color='white', fontsize=10, fontweight='bold'
+                    )
         
         self.chart2_canvas.axes.set_xlabel('Camions', color='white', fontsize=11)
         self.chart2_canvas.axes.set_ylabel('Retard', color='white', fontsize=11)
@@ -1090,7 +1353,7 @@ class OrdonnancementApp(QMainWindow):
         self.chart2_canvas.axes.axhline(y=0, color='white', linestyle='-', linewidth=1, alpha=0.5)
         
         # Ajouter un peu d'espace en haut si des retards existent
-        max_delay = max(retards) if retards else 1
+        max_delay = retards.max() if len(retards) else 1
         if max_delay > 0:
             self.chart2_canvas.axes.set_ylim(-0.5, max_delay * 1.15)
         
@@ -1110,31 +1373,28 @@ class OrdonnancementApp(QMainWindow):
         # Attentes (temps avant le chargement)
         attentes = [max(0, debuts[i] - preparations[i]) for i in range(N)]
         
-        # Graphique en barres empilées simplifié
+        # Barres empilées: un PolyCollection par segment (attente, préparation, chargement)
         bar_width = 0.5
         indices = np.arange(N)
-        
-        # Barre 1: Attente
-        self.analysis1_canvas.axes.barh(
-            indices, attentes, bar_width, 
-            label='Attente', color='#9E9E9E', alpha=0.7, edgecolor='white', linewidth=0.5
-        )
-        
-        # Barre 2: Préparation
-        self.analysis1_canvas.axes.barh(
-            indices, preparations, bar_width, 
-            left=attentes, label='Préparation', color='#FF9800', alpha=0.8, edgecolor='white', linewidth=0.5
-        )
-        
-        # Barre 3: Chargement
-        left_chargement = [attentes[i] + preparations[i] for i in range(N)]
-        self.analysis1_canvas.axes.barh(
-            indices, durees, bar_width, 
-            left=left_chargement, label='Chargement', color='#4CAF50', alpha=0.8, edgecolor='white', linewidth=0.5
-        )
-        
-        self.analysis1_canvas.axes.set_yticks(indices)
-        self.analysis1_canvas.axes.set_yticklabels(camions, fontsize=10)
+        attentes = np.array(attentes, dtype=float)
+        preparations = np.array(preparations, dtype=float)
+        durees = np.array(durees, dtype=float)
+        segments = [
+            (np.zeros(N), attentes, 'Attente', '#9E9E9E', 0.7),
+            (attentes, preparations, 'Préparation', '#FF9800', 0.8),
+            (attentes + preparations, durees, 'Chargement', '#4CAF50', 0.8),
+        ]
+        for gauche, largeur, label, color, alpha in segments:
+            self.analysis1_canvas.axes.add_collection(PolyCollection(
+                _rectangles(gauche, largeur, indices - bar_width / 2, bar_width),
+                facecolors=color, alpha=alpha, edgecolors='white',
+                linewidths=0.5 if N <= ETIQUETTES_MAX else 0, label=label
+            ))
+        self.analysis1_canvas.axes.autoscale_view()
+        
+        pas = max(1, N // ETIQUETTES_MAX)
+        self.analysis1_canvas.axes.set_yticks(indices[::pas])
+        self.analysis1_canvas.axes.set_yticklabels(camions[::pas], fontsize=10 if pas == 1 else 7)
         self.analysis1_canvas.axes.set_xlabel('Temps', color='white', fontsize=11)
         self.analysis1_canvas.axes.set_ylabel('Camions', color='white', fontsize=11)
         self.analysis1_canvas.axes.set_title('Décomposition du Temps par Camion', color='white', fontsize=12, pad=12)
@@ -1191,6 +1451,46 @@ class OrdonnancementApp(QMainWindow):
         self.analysis2_canvas.fig.tight_layout()
         self.analysis2_canvas.draw()
         
+    def draw_pareto(self, resultats, pareto):
+        """Makespan en fonction des affectations pénalisées, un nuage par nombre de quais."""
+        axes = self.pareto_canvas.axes
+        axes.clear()
+        
+        base_colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', '#00BCD4']
+        valeurs_M = sorted({res['M'] for res in resultats})
+        for idx, M in enumerate(valeurs_M):
+            color = base_colors[idx % len(base_colors)]
+            points = [res for res in resultats if res['M'] == M]
+            axes.scatter([res['P_cost'] for res in points], [res['Cmax'] for res in points],
+                         color=color, alpha=0.35, s=30)
+            efficaces = sorted((res for res in pareto if res['M'] == M), key=lambda res: res['P_cost'])
+            if efficaces:
+                axes.plot([res['P_cost'] for res in efficaces], [res['Cmax'] for res in efficaces],
+                          color=color, linewidth=1.5, drawstyle='steps-post', marker='o',
+                          markersize=8, markeredgecolor='white', label=f'{M} quais')
+        
+        # Réglages efficaces aboutissant au même point: une étiquette avec leurs C_swap
+        etiquettes = {}
+        for res in pareto:
+            etiquettes.setdefault((res['M'], res['P_cost'], res['Cmax']), []).append(res['C_swap'])
+        if len(etiquettes) <= ETIQUETTES_MAX:
+            for (_, penalites, cmax), couts in etiquettes.items():
+                axes.annotate(
+                    'C_swap=' + ', '.join(f'{c:g}' for c in couts), (penalites, cmax),
+                    textcoords='offset points', xytext=(6, 6), color='white', fontsize=8
+                )
+        
+        axes.set_xlabel('Affectations non autorisées (pénalité)', color='white', fontsize=11)
+        axes.set_ylabel('Makespan (Cmax)', color='white', fontsize=11)
+        axes.set_title('Réglages Efficaces (M, C_swap)', color='white', fontsize=12, pad=12)
+        if pareto:
+            axes.legend(facecolor='#2b2b2b', edgecolor='white', labelcolor='white', fontsize=9)
+        axes.xaxis.set_major_locator(MaxNLocator(integer=True))
+        axes.grid(linestyle=':', alpha=0.3, color='gray')
+        
+        self.pareto_canvas.fig.tight_layout()
+        self.pareto_canvas.draw()
+        
     def _update_status(self, message, color="#aaa"):
         """Met à jour le label de statut avec animation."""
         self.status_label.setText(message)
@@ -2,7 +2,138 @@ import gurobipy as gp
 from gurobipy import GRB
 import numpy as np
 
-def resoudre_ordonnancement_avance(N, M, p, r, d, prep, a, C_swap):
+from DonneesCamions import en_listes
+
+def _ajouter_disjonctions_par_quai(m, N, M, p, r, prep, S, x, disponibilite):
+    """Non-chevauchement écrit pour chaque quai k: O(N²·M) contraintes à grande constante L."""
+    # Grande constante L
+    L = sum(p) + max(r) + max(prep) + max(disponibilite) + 100
+
+    # Utiliser un dictionnaire pour y pour simplifier l'itération des indices
+    indices_y = [(i, j) for i in range(N) for j in range(N) if i != j]
+    y = m.addVars(indices_y, vtype=GRB.BINARY, name="Precedence")
+
+    for i in range(N):
+        for j in range(i + 1, N):
+            for k in range(M):
+                # i précède j (S_j >= S_i + p_i)
+                m.addConstr(S[j] >= S[i] + p[i] - L * (1 - y[i, j]) - L * (2 - x[i, k] - x[j, k]),
+                            name=f"Precedence_1_{i}_{j}_{k}")
+
+                # j précède i (S_i >= S_j + p_j)
+                m.addConstr(S[i] >= S[j] + p[j] - L * (1 - y[j, i]) - L * (2 - x[i, k] - x[j, k]),
+                            name=f"Precedence_2_{i}_{j}_{k}")
+
+                # Soit i précède j, soit j précède i si sur même quai
+                m.addConstr(y[i, j] + y[j, i] >= x[i, k] + x[j, k] - 1,
+                            name=f"Necessite_Precedence_{i}_{j}_{k}")
+    return y
+
+
+def _ajouter_disjonctions_compactes(m, N, M, p, r, prep, S, Cmax, x, disponibilite):
+    """
+    Non-chevauchement avec un indicateur z_ij "i et j sur le même quai" par
+    paire i < j et un ordre o_ij (1 si i précède j):
+
+        S_j >= S_i + p_i - M_ij (2 - o_ij - z_ij)
+        S_i >= S_j + p_j - M_ji (1 + o_ij - z_ij)
+        z_ij >= x_ik + x_jk - 1                    (liaison sans grand M)
+
+    Seules les disjonctions à grand M ne dépendent plus de k (2 par paire au
+    lieu de 2·M); la liaison reste écrite par quai, N(N-1)/2·M lignes 0/1
+    sans grand M, et le modèle reste en O(N²·M) lignes. Une liaison agrégée
+    (une par paire, via l'indice du quai Σ (k+1) x_ik) exige un grand M
+    supplémentaire et affaiblit la relaxation: plus lente à l'essai.
+    Un ordonnancement au plus tôt finit avant H = max(r + prep, disponibilité
+    des quais) + Σ p pour toute affectation, d'où S_i <= H - p_i et le grand M
+    propre à la paire M_ij = (H - p_i) + p_i - (r_j + prep_j) = H - r_j - prep_j.
+    """
+    e = [r[i] + prep[i] for i in range(N)]
+    H = max(max(e), max(disponibilite)) + sum(p)
+    Cmax.UB = H
+    for i in range(N):
+        S[i].UB = H - p[i]
+
+    paires = [(i, j) for i in range(N) for j in range(i + 1, N)]
+    z = m.addVars(paires, vtype=GRB.BINARY, name="Meme_Quai")
+    o = m.addVars(paires, vtype=GRB.BINARY, name="Ordre")
+
+    for i, j in paires:
+        m.addConstr(S[j] >= S[i] + p[i] - (H - e[j]) * (2 - o[i, j] - z[i, j]),
+                    name=f"Precedence_1_{i}_{j}")
+        m.addConstr(S[i] >= S[j] + p[j] - (H - e[i]) * (1 + o[i, j] - z[i, j]),
+                    name=f"Precedence_2_{i}_{j}")
+        for k in range(M):
+            m.addConstr(z[i, j] >= x[i, k] + x[j, k] - 1, name=f"Meme_Quai_{i}_{j}_{k}")
+    return z, o
+
+
+def classes_quais_equivalents(N, M, a, disponibilite=None):
+    """
+    Groupes (taille >= 2) de quais interchangeables: même colonne dans la
+    matrice d'autorisation `a` et même date de disponibilité.
+    """
+    groupes = {}
+    for k in range(M):
+        cle = (tuple(a[i][k] for i in range(N)), disponibilite[k] if disponibilite is not None else 0.0)
+        groupes.setdefault(cle, []).append(k)
+    return [quais for quais in groupes.values() if len(quais) >= 2]
+
+
+def _ajouter_brisure_symetrie(m, N, x, classes):
+    """
+    Dans chaque classe de quais interchangeables k_1 < k_2 < ..., les quais sont
+    ordonnés par plus petit camion affecté (quais vides en dernier): le camion
+    i ne peut aller sur k_t que si k_(t-1) reçoit déjà un camion j < i.
+    """
+    for quais in classes:
+        for precedent, k in zip(quais, quais[1:]):
+            for i in range(N):
+                m.addConstr(x[i, k] <= gp.quicksum(x[j, precedent] for j in range(i)),
+                            name=f"Symetrie_{i}_{k}")
+
+
+def ordre_canonique(solution, classes):
+    """
+    Renumérote les quais de chaque classe par plus petit camion affecté
+    (quais vides en dernier), forme imposée par _ajouter_brisure_symetrie.
+    """
+    renumerotation = {}
+    for quais in classes:
+        premier = {k: min((res["Camion"] for res in solution if res["Quai"] == k + 1),
+                          default=float("inf")) for k in quais}
+        for cible, k in zip(quais, sorted(quais, key=lambda k: (premier[k], k))):
+            renumerotation[k + 1] = cible + 1
+    return [{**res, "Quai": renumerotation.get(res["Quai"], res["Quai"])} for res in solution]
+
+
+def _appliquer_solution_initiale(N, M, solution, S, x, ordre):
+    """MIP start depuis une solution au format de retour (ex. heuristique)."""
+    quai = [0] * N
+    debut = [0.0] * N
+    for res in solution:
+        i = res["Camion"] - 1
+        quai[i] = res["Quai"] - 1
+        debut[i] = res["Debut_Chargement"]
+    for i in range(N):
+        S[i].Start = debut[i]
+        for k in range(M):
+            x[i, k].Start = 1.0 if quai[i] == k else 0.0
+    for i in range(N):
+        for j in range(i + 1, N):
+            meme_quai = quai[i] == quai[j]
+            i_avant_j = debut[i] <= debut[j]
+            if "z" in ordre:
+                ordre["z"][i, j].Start = 1.0 if meme_quai else 0.0
+                ordre["o"][i, j].Start = 1.0 if i_avant_j else 0.0
+            else:
+                ordre["y"][i, j].Start = 1.0 if meme_quai and i_avant_j else 0.0
+                ordre["y"][j, i].Start = 1.0 if meme_quai and not i_avant_j else 0.0
+
+
+def resoudre_ordonnancement_avance(N, M, p, r, d, prep, a, C_swap, formulation="par_quai",
+                                   solution_initiale=None, temps_limite=None, disponibilite=None,
+                                   symetrie="orbitale", threads=None):
     """
     Résout le modèle PLNE d'ordonnancement de camions sur M quais avec préférences et temps de préparation.
 
@@ -12,28 +143,38 @@ def resoudre_ordonnancement_avance(N, M, p, r, d, prep, a, C_swap):
     r: Date de disponibilité.
     d: Date d'échéance.
     prep: Temps de préparation.
+    p, r, d, prep: listes ou tableaux NumPy (de longueur N).
     a: Matrice d'affectation autorisée (N x M), doit être une liste de listes ou un numpy array convertible.
     C_swap: Coût de pénalité pour les affectations non autorisées.
+    formulation: "par_quai" (disjonctions écrites pour chaque quai) ou
+        "compacte" (indicateur "même quai" par paire, grand M par paire).
+    solution_initiale: solution au format de retour utilisée comme MIP start
+        (ex. celle de HeuristiqueQuais.resoudre_ordonnancement_heuristique).
+    temps_limite: limite en secondes; la meilleure solution trouvée est alors
+        retournée.
+    disponibilite: date à laquelle chaque quai se libère (opérations déjà
+        engagées), 0 par défaut.
+    symetrie: traitement des quais interchangeables (même colonne de `a`,
+        même disponibilité): "orbitale" (fixation orbitale de Gurobi en mode
+        agressif), "lexicographique" (quais ordonnés par plus petit camion
+        affecté) ou None.
+    threads: nombre de threads Gurobi (par défaut tous les cœurs; à réduire
+        quand plusieurs résolutions tournent en parallèle).
     """
     if N == 0 or M == 0:
         return 0, 0, "Aucun camion ou quai à planifier."
+    p, r, d, prep, a = en_listes(p, r, d, prep, a)
         
     try:
         m = gp.Model("Ordonnancement_Avance_Logistique")
         m.Params.OutputFlag = 0  # Supprimer les logs Gurobi
 
-        # Grande constante L
-        L = sum(p) + max(r) + max(prep) + 100
-
         # --- 2. Variables de Décision ---
         S = m.addVars(N, vtype=GRB.CONTINUOUS, name="Start")
         Cmax = m.addVar(vtype=GRB.CONTINUOUS, name="Cmax")
         P_cost = m.addVar(vtype=GRB.CONTINUOUS, name="PenaltyCost")
         
         x = m.addVars(N, M, vtype=GRB.BINARY, name="Affectation")
-        # Utiliser un dictionnaire pour y pour simplifier l'itération des indices
-        indices_y = [(i, j) for i in range(N) for j in range(N) if i != j]
-        y = m.addVars(indices_y, vtype=GRB.BINARY, name="Precedence") 
 
         # --- 3. Fonction Objectif (Minimiser Cmax + Coût de Pénalité * P_cost) ---
         m.setObjective(Cmax + C_swap * P_cost, GRB.MINIMIZE)
@@ -59,27 +200,48 @@ def resoudre_ordonnancement_avance(N, M, p, r, d, prep, a, C_swap):
         # 6. Cmax >= Heure d'achèvement (S_i + p_i)
         m.addConstrs((Cmax >= S[i] + p[i] for i in range(N)), name="Cmax_Definition")
 
+        # 7. Quais occupés par des opérations déjà engagées
+        if disponibilite is None:
+            disponibilite = [0.0] * M
+        elif max(disponibilite) > 0:
+            m.addConstrs((S[i] >= gp.quicksum(disponibilite[k] * x[i, k] for k in range(M))
+                          for i in range(N)), name="Disponibilite_Quai")
+            Cmax.LB = max(disponibilite)
+
         # 5. Contraintes de non-chevauchement sur le même quai (i != j)
-        for i in range(N):
-            for j in range(i + 1, N):
-                for k in range(M):
-                    # i précède j (S_j >= S_i + p_i)
-                    m.addConstr(S[j] >= S[i] + p[i] - L * (1 - y[i, j]) - L * (2 - x[i, k] - x[j, k]),
-                                name=f"Precedence_1_{i}_{j}_{k}")
-                    
-                    # j précède i (S_i >= S_j + p_j)
-                    m.addConstr(S[i] >= S[j] + p[j] - L * (1 - y[j, i]) - L * (2 - x[i, k] - x[j, k]),
-                                name=f"Precedence_2_{i}_{j}_{k}")
-
-                    # Soit i précède j, soit j précède i si sur même quai
-                    m.addConstr(y[i, j] + y[j, i] >= x[i, k] + x[j, k] - 1,
-                                name=f"Necessite_Precedence_{i}_{j}_{k}")
+        if formulation == "compacte":
+            z, o = _ajouter_disjonctions_compactes(m, N, M, p, r, prep, S, Cmax, x, disponibilite)
+            ordre = {"z": z, "o": o}
+        elif formulation == "par_quai":
+            ordre = {"y": _ajouter_disjonctions_par_quai(m, N, M, p, r, prep, S, x, disponibilite)}
+        else:
+            return None, None, f"Formulation inconnue: {formulation}"
+
+        # 8. Charge de chaque quai (inégalité valide): borne Σ p / M dès la relaxation,
+        # sans laquelle la brisure de symétrie n'élague presque rien
+        m.addConstrs((Cmax >= disponibilite[k] + gp.quicksum(p[i] * x[i, k] for i in range(N))
+                      for k in range(M)), name="Charge_Quai")
+
+        classes = classes_quais_equivalents(N, M, a, disponibilite) if symetrie else []
+        if symetrie == "lexicographique":
+            _ajouter_brisure_symetrie(m, N, x, classes)
+            if solution_initiale is not None:
+                solution_initiale = ordre_canonique(solution_initiale, classes)
+        elif classes:
+            m.Params.Symmetry = 2
+
+        if solution_initiale is not None:
+            _appliquer_solution_initiale(N, M, solution_initiale, S, x, ordre)
+        if temps_limite is not None:
+            m.Params.TimeLimit = temps_limite
+        if threads is not None:
+            m.Params.Threads = threads
 
         # --- 5. Optimisation ---
         m.optimize()
 
         # --- 6. Extraction des résultats ---
-        if m.status == GRB.OPTIMAL:
+        if m.status == GRB.OPTIMAL or (m.status == GRB.TIME_LIMIT and m.SolCount > 0):
             Cmax_optimal = Cmax.X
             P_cost_optimal = P_cost.X
             solution = []
@@ -0,0 +1,86 @@
+"""
+Tests de l'ordonnancement à horizon glissant (HorizonGlissant).
+
+Exécuter: python -m pytest tests/test_horizon_glissant.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from HorizonGlissant import PlanificateurGlissant
+
+
+def _planificateur():
+    """Deux quais, quatre camions disponibles dès le début de la journée."""
+    plan = PlanificateurGlissant(M=2, C_swap=10.0, budget=1.0)
+    for p, r, d in [(10, 0, 20), (8, 0, 20), (6, 2, 30), (5, 4, 30)]:
+        plan.ajouter_camion(p, r, d, prep=1.0)
+    return plan
+
+
+def _par_camion(solution):
+    return {res["Camion"] - 1: res for res in solution}
+
+
+def _sans_chevauchement(solution):
+    for k in {res["Quai"] for res in solution}:
+        operations = sorted((res["Debut_Chargement"], res["Fin_Operation"])
+                            for res in solution if res["Quai"] == k)
+        for (_, fin), (debut, _) in zip(operations, operations[1:]):
+            assert debut >= fin - 1e-6
+
+
+def test_camions_commences_figes_a_la_replanification():
+    plan = _planificateur()
+    _, _, initiale = plan.replanifier(0.0)
+    initiale = _par_camion(initiale)
+    maintenant = 5.0
+    commences = {i for i, res in initiale.items() if res["Debut_Chargement"] < maintenant}
+    assert commences
+
+    nouveau = plan.ajouter_camion(3, 5, 15, prep=0.0)
+    _, _, solution = plan.replanifier(maintenant)
+    solution = _par_camion(solution)
+
+    for i in commences:
+        assert solution[i]["Quai"] == initiale[i]["Quai"]
+        assert solution[i]["Debut_Chargement"] == pytest.approx(initiale[i]["Debut_Chargement"])
+    # Les camions non commencés, dont le nouveau, ne débutent pas dans le passé
+    for i, res in solution.items():
+        if i not in commences:
+            assert res["Debut_Chargement"] >= maintenant - 1e-6
+    assert nouveau in solution
+    _sans_chevauchement(solution.values())
+
+
+def test_retard_camion_commence_refuse_par_defaut():
+    plan = _planificateur()
+    _, _, solution = plan.replanifier(0.0)
+    plan.replanifier(5.0)
+    commence = min(solution, key=lambda res: res["Debut_Chargement"])["Camion"] - 1
+
+    # Sans date explicite, l'horloge du planificateur (5.0) fait foi
+    with pytest.raises(ValueError, match="déjà en chargement"):
+        plan.retarder_camion(commence, 40.0)
+    # Une date antérieure à l'horloge ne rouvre pas un camion figé
+    with pytest.raises(ValueError, match="déjà en chargement"):
+        plan.retarder_camion(commence, 40.0, maintenant=0.0)
+
+
+def test_retard_camion_non_commence_replanifie():
+    plan = _planificateur()
+    plan.replanifier(0.0)
+    plan.retarder_camion(3, 40.0)
+    _, _, solution = plan.replanifier(1.0)
+    retarde = _par_camion(solution)[3]
+    assert retarde["Debut_Chargement"] >= 40.0 + 1.0 - 1e-6
+    _sans_chevauchement(solution)
+
+
+def test_plan_inchange_sans_evenement():
+    plan = _planificateur()
+    premier = plan.replanifier(0.0)
+    assert plan.replanifier(2.0) is premier
@@ -0,0 +1,174 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+MODULE DE TESTS - Import OpenStreetMap
+═══════════════════════════════════════════════════════════════════════════════
+
+Exécuter: python -m pytest tests/test_osm_import.py -v
+Ou simplement: python tests/test_osm_import.py
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.osm_import import load_osm_graph, haversine_km
+from models.shortest_path import solve_shortest_path
+
+
+# Petit extrait: une route à double sens 1-2-3, une rue à sens unique 3-4,
+# un chemin piéton 1-4 (ignoré) et une voie privée 2-4 (ignorée).
+SAMPLE_OSM = """<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="1" lat="48.8566" lon="2.3522"/>
+  <node id="2" lat="48.8600" lon="2.3600"/>
+  <node id="3" lat="48.8650" lon="2.3700"/>
+  <node id="4" lat="48.8700" lon="2.3750"/>
+  <node id="5" lat="48.9000" lon="2.4000"/>
+  <way id="10">
+    <nd ref="1"/><nd ref="2"/><nd ref="3"/>
+    <tag k="highway" v="primary"/>
+  </way>
+  <way id="11">
+    <nd ref="3"/><nd ref="4"/>
+    <tag k="highway" v="residential"/>
+    <tag k="oneway" v="yes"/>
+  </way>
+  <way id="12">
+    <nd ref="1"/><nd ref="4"/>
+    <tag k="highway" v="footway"/>
+  </way>
+  <way id="13">
+    <nd ref="2"/><nd ref="4"/>
+    <tag k="highway" v="service"/>
+    <tag k="access" v="private"/>
+  </way>
+</osm>
+"""
+
+
+def _write_sample():
+    fd, path = tempfile.mkstemp(suffix='.osm')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(SAMPLE_OSM)
+    return path
+
+
+def test_haversine():
+    """Paris -> Lyon ≈ 392 km"""
+    print("\n" + "="*70)
+    print("TEST 1: Distance haversine")
+    print("="*70)
+
+    d = haversine_km(48.8566, 2.3522, 45.7640, 4.8357)
+    print(f"✓ Paris -> Lyon: {d:.1f} km")
+    assert abs(d - 392) < 2, f"Distance inattendue: {d}"
+
+    print("✓ TEST 1 RÉUSSI\n")
+
+
+def test_import_simplifie():
+    """
+    Avec simplification, le nœud 2 (intermédiaire) est fusionné:
+    arêtes 1<->3 (double sens) et 3->4 (sens unique)
+    """
+    print("="*70)
+    print("TEST 2: Import simplifié")
+    print("="*70)
+
+    path = _write_sample()
+    try:
+        nodes, edges, coords = load_osm_graph(path)
+    finally:
+        os.remove(path)
+
+    print(f"✓ Nœuds: {sorted(nodes)}")
+    print(f"✓ Arêtes: {edges}")
+
+    assert sorted(nodes) == ['1', '3', '4']
+    assert sorted((u, v) for u, v, _ in edges) == [('1', '3'), ('3', '1'), ('3', '4')]
+    assert coords['4'] == (48.87, 2.375)
+
+    expected = haversine_km(48.8566, 2.3522, 48.86, 2.36) + haversine_km(48.86, 2.36, 48.865, 2.37)
+    cost_13 = [c for u, v, c in edges if (u, v) == ('1', '3')][0]
+    assert abs(cost_13 - expected) < 1e-3, f"Longueur 1-3 inattendue: {cost_13}"
+
+    print("✓ TEST 2 RÉUSSI\n")
+
+
+def test_import_complet_et_resolution():
+    """
+    Sans simplification, chaque segment est une arête; le graphe est
+    directement utilisable par le solveur (1 -> 4 via le checkpoint 2).
+    """
+    print("="*70)
+    print("TEST 3: Import complet et résolution")
+    print("="*70)
+
+    path = _write_sample()
+    try:
+        nodes, edges, coords = load_osm_graph(path, simplify=False)
+    finally:
+        os.remove(path)
+
+    assert len(edges) == 5, f"Attendu 5 arêtes, obtenu {len(edges)}"
+    assert '5' not in coords, "Le nœud isolé ne doit pas être conservé"
+
+    obj, chosen, details = solve_shortest_path(nodes, edges, '1', '4', ['2'])
+    print(f"✓ Coût optimal: {obj:.3f} km")
+    print(f"✓ Arêtes: {chosen}")
+    assert [(u, v) for u, v, _ in chosen] == [('1', '2'), ('2', '3'), ('3', '4')]
+
+    print("✓ TEST 3 RÉUSSI\n")
+
+
+def test_aucune_voie():
+    """Un fichier sans voie carrossable doit lever une ValueError"""
+    print("="*70)
+    print("TEST 4: Aucune voie carrossable")
+    print("="*70)
+
+    fd, path = tempfile.mkstemp(suffix='.osm')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write('<osm><node id="1" lat="0" lon="0"/></osm>')
+    try:
+        load_osm_graph(path)
+        assert False, "Devrait lever une ValueError"
+    except ValueError as e:
+        print(f"✓ Erreur détectée: {e}")
+    finally:
+        os.remove(path)
+
+    print("✓ TEST 4 RÉUSSI\n")
+
+
+def run_all_tests():
+    """Exécute tous les tests"""
+    tests = [
+        test_haversine,
+        test_import_simplifie,
+        test_import_complet_et_resolution,
+        test_aucune_voie,
+    ]
+
+    failed = 0
+    for i, test in enumerate(tests, 1):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ TEST {i} ÉCHOUÉ: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ TEST {i} ERREUR: {e}\n")
+            failed += 1
+
+    print("="*70)
+    print(f"RÉSULTAT: {len(tests) - failed}/{len(tests)} tests réussis")
+    print("="*70 + "\n")
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -1,14 +1,18 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QFileDialog, QTableWidget, QTableWidgetItem, QMessageBox, 
-    QLineEdit, QTextEdit, QSplitter, QGroupBox, QHeaderView
+    QLineEdit, QTextEdit, QSplitter, QGroupBox, QHeaderView, QAbstractItemView
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from worker.solver_thread import SolverThread
+from worker.osm_thread import OsmImportThread
 from utils.graph_utils import draw_graph, table_to_graph_data
 import os
 
+# Arêtes d'un graphe OSM affichées dans le tableau (aperçu, non éditable)
+OSM_PREVIEW_ROWS = 200
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -16,7 +20,13 @@ class MainWindow(QMainWindow):
         self.resize(1400, 900)
         self._build_ui()
         self.solver_thread = None
+        self.osm_thread = None
         self.last_solution_details = None
+        self.node_coords = None
+        # Graphe importé (nodes, edges), passé directement au solveur sans
+        # passer par le tableau; None = graphe saisi dans le tableau
+        self.imported_graph = None
+        self._table_edit_triggers = self.table.editTriggers()
 
     def _build_ui(self):
         central = QWidget()
@@ -35,6 +45,10 @@ class MainWindow(QMainWindow):
         self.load_btn.clicked.connect(self.load_csv)
         row1.addWidget(self.load_btn)
 
+        self.load_osm_btn = QPushButton('🗺 Importer OSM')
+        self.load_osm_btn.clicked.connect(self.load_osm)
+        row1.addWidget(self.load_osm_btn)
+
         self.run_btn = QPushButton('▶ Lancer le Solveur')
         self.run_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
         self.run_btn.clicked.connect(self.run_solver)
@@ -96,13 +110,13 @@ class MainWindow(QMainWindow):
         
         # Boutons de gestion des lignes
         table_btns = QHBoxLayout()
-        add_row_btn = QPushButton('+ Ajouter ligne')
-        add_row_btn.clicked.connect(lambda: self.table.insertRow(self.table.rowCount()))
-        table_btns.addWidget(add_row_btn)
+        self.add_row_btn = QPushButton('+ Ajouter ligne')
+        self.add_row_btn.clicked.connect(lambda: self.table.insertRow(self.table.rowCount()))
+        table_btns.addWidget(self.add_row_btn)
         
-        remove_row_btn = QPushButton('- Supprimer ligne')
-        remove_row_btn.clicked.connect(lambda: self.table.removeRow(self.table.currentRow()) if self.table.currentRow() >= 0 else None)
-        table_btns.addWidget(remove_row_btn)
+        self.remove_row_btn = QPushButton('- Supprimer ligne')
+        self.remove_row_btn.clicked.connect(lambda: self.table.removeRow(self.table.currentRow()) if self.table.currentRow() >= 0 else None)
+        table_btns.addWidget(self.remove_row_btn)
         
         data_layout.addLayout(table_btns)
         data_group.setLayout(data_layout)
@@ -184,14 +198,72 @@ class MainWindow(QMainWindow):
             self.table.setItem(i, 0, QTableWidgetItem(str(row['u'])))
             self.table.setItem(i, 1, QTableWidgetItem(str(row['v'])))
             self.table.setItem(i, 2, QTableWidgetItem(str(row['cost'])))
+        self.node_coords = None
+        self._set_imported_graph(None)
         self.log_text.append(f'✓ {len(df)} arêtes chargées')
 
+    def load_osm(self):
+        path, _ = QFileDialog.getOpenFileName(self, 'Ouvrir extrait OpenStreetMap', os.getcwd(),
+                                              'Fichiers OSM (*.osm *.osm.bz2)')
+        if not path:
+            return
+        if self.osm_thread is not None and self.osm_thread.isRunning():
+            QMessageBox.warning(self, 'Import en cours', 'Un import OSM est déjà en cours')
+            return
+        self.log_text.append(f'🗺 Import OSM: {os.path.basename(path)}')
+
+        # Lecture en flux dans un thread: la fenêtre reste réactive
+        self.osm_thread = OsmImportThread(path)
+        self.osm_thread.graph_ready.connect(self.on_osm_loaded)
+        self.osm_thread.log.connect(self.on_log)
+        self.osm_thread.error.connect(self.on_osm_error)
+        self.osm_thread.start()
+        self.load_osm_btn.setEnabled(False)
+
+    def on_osm_loaded(self, nodes, edges, coords):
+        self.node_coords = coords
+        self._set_imported_graph((nodes, edges))
+        self.load_osm_btn.setEnabled(True)
+        self.log_text.append(f'✓ {len(coords)} nœuds, {len(edges)} arêtes importés')
+        if len(edges) > OSM_PREVIEW_ROWS:
+            self.log_text.append(f'  (aperçu des {OSM_PREVIEW_ROWS} premières arêtes dans le tableau)')
+
+    def on_osm_error(self, error_msg):
+        QMessageBox.critical(self, 'Erreur', f"Échec de l'import OSM: {error_msg}")
+        self.load_osm_btn.setEnabled(True)
+
+    def _set_imported_graph(self, graph):
+        """
+        graph: (nodes, edges) importés, ou None pour revenir au graphe du tableau.
+        Un graphe importé n'est montré qu'en aperçu, en lecture seule.
+        """
+        self.imported_graph = graph
+        editable = graph is None
+        self.table.setEditTriggers(self._table_edit_triggers if editable
+                                   else QAbstractItemView.NoEditTriggers)
+        self.add_row_btn.setEnabled(editable)
+        self.remove_row_btn.setEnabled(editable)
+        if graph is None:
+            return
+        preview = graph[1][:OSM_PREVIEW_ROWS]
+        self.table.setRowCount(len(preview))
+        for i, (u, v, c) in enumerate(preview):
+            self.table.setItem(i, 0, QTableWidgetItem(u))
+            self.table.setItem(i, 1, QTableWidgetItem(v))
+            self.table.setItem(i, 2, QTableWidgetItem(str(c)))
+
+    def _graph_data(self):
+        """(nodes, edges) du graphe importé, sinon lus dans le tableau."""
+        if self.imported_graph is not None:
+            return self.imported_graph
+        return table_to_graph_data(self.table)
+
     def run_solver(self):
         # Read graph
         try:
-            nodes, edges = table_to_graph_data(self.table)
+            nodes, edges = self._graph_data()
             self.log_text.append(f'\n═══ NOUVELLE EXÉCUTION ═══')
-            self.log_text.append(f'Nœuds: {", ".join(nodes)}')
+            self.log_text.append(f'Nœuds: {len(nodes)}')
             self.log_text.append(f'Arêtes: {len(edges)}')
         except Exception as e:
             QMessageBox.critical(self, 'Erreur', f'Données invalides: {e}')
@@ -263,13 +335,13 @@ class MainWindow(QMainWindow):
         
         # Visualiser automatiquement
         try:
-            nodes, _ = table_to_graph_data(self.table)
             src = self.src_input.text().strip()
             tgt = self.tgt_input.text().strip()
             cps = [c.strip() for c in self.checkpoints_input.text().split(',') if c.strip()]
             
             img_path = draw_graph(chosen_edges, highlight_edges=chosen_edges, 
-                                 source=src, target=tgt, checkpoints=cps)
+                                 source=src, target=tgt, checkpoints=cps,
+                                 coords=self.node_coords)
             self.log_text.append(f'📊 Graphe solution sauvegardé: {img_path}')
         except Exception as e:
             self.log_text.append(f'Avertissement: visualisation échouée - {e}')
@@ -289,7 +361,7 @@ class MainWindow(QMainWindow):
 
     def show_graph(self):
         try:
-            nodes, edges = table_to_graph_data(self.table)
+            nodes, edges = self._graph_data()
             src = self.src_input.text().strip()
             tgt = self.tgt_input.text().strip()
             cps = [c.strip() for c in self.checkpoints_input.text().split(',') if c.strip()]
@@ -297,6 +369,7 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, 'Erreur', f'Données invalides: {e}')
             return
         
-        img_path = draw_graph(edges, source=src, target=tgt, checkpoints=cps)
+        img_path = draw_graph(edges, source=src, target=tgt, checkpoints=cps,
+                              coords=self.node_coords)
         self.log_text.append(f'📊 Graphe complet sauvegardé: {img_path}')
         QMessageBox.information(self, 'Graphe', f'Graphe sauvegardé dans:\n{img_path}')
@@ -27,7 +27,7 @@ def table_to_graph_data(table_widget):
         nodes.add(v)
     return list(nodes), edges
 
-def draw_graph(edges, highlight_edges=None, source=None, target=None, checkpoints=None):
+def draw_graph(edges, highlight_edges=None, source=None, target=None, checkpoints=None, coords=None):
     """
     Dessine un graphe avec mise en évidence des différents types de nœuds.
     
@@ -37,6 +37,7 @@ def draw_graph(edges, highlight_edges=None, source=None, target=None, checkpoint
         source: Nœud source (en vert)
         target: Nœud cible (en rouge)
         checkpoints: Liste des nœuds checkpoints (en jaune)
+        coords: Coordonnées {nœud: (lat, lon)} (import OSM), sinon disposition automatique
     
     Returns:
         Chemin vers l'image générée
@@ -45,7 +46,10 @@ def draw_graph(edges, highlight_edges=None, source=None, target=None, checkpoint
     for u, v, c in edges:
         G.add_edge(u, v, weight=c)
 
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    if coords and all(n in coords for n in G.nodes()):
+        pos = {n: (coords[n][1], coords[n][0]) for n in G.nodes()}
+    else:
+        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
     
     fig, ax = plt.subplots(figsize=(12, 8))
     
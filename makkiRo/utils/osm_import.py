@@ -0,0 +1,182 @@
+"""
+Import en flux d'extraits OpenStreetMap (.osm / .osm.bz2) vers le graphe du solveur.
+
+Le fichier est lu deux fois avec `iterparse` et chaque élément est libéré dès
+qu'il a été traité, de sorte que la mémoire utilisée dépend uniquement du
+réseau routier retenu et jamais de la taille de l'extrait:
+
+    1) Passe 1: parcours des <way> routiers, comptage des références de nœuds
+       (un nœud référencé plusieurs fois ou en bout de voie est une intersection).
+    2) Passe 2: lecture des coordonnées des seuls nœuds utiles, puis découpage
+       des voies en arêtes entre intersections (longueur haversine en km).
+
+Le résultat a le même format que `table_to_graph_data`: (nodes, edges) où
+edges est une liste de tuples (u, v, cost), plus les coordonnées des nœuds.
+"""
+
+import bz2
+import math
+import xml.etree.ElementTree as ET
+
+# Valeurs du tag highway considérées comme carrossables
+DRIVABLE_HIGHWAYS = frozenset({
+    'motorway', 'motorway_link', 'trunk', 'trunk_link',
+    'primary', 'primary_link', 'secondary', 'secondary_link',
+    'tertiary', 'tertiary_link', 'unclassified', 'residential',
+    'living_street', 'service', 'road',
+})
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Distance orthodromique en kilomètres entre deux points (degrés)."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    h = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def _open(path):
+    if str(path).endswith('.bz2'):
+        return bz2.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def _iter_elements(path, tags):
+    """Parcourt les éléments `tags` du fichier en libérant la mémoire au fur et à mesure."""
+    with _open(path) as f:
+        context = ET.iterparse(f, events=('start', 'end'))
+        _, root = next(context)
+        for event, elem in context:
+            if event != 'end':
+                continue
+            if elem.tag in tags:
+                yield elem
+            if elem.tag in ('node', 'way', 'relation'):
+                # Détacher l'élément de la racine pour qu'il soit collecté
+                elem.clear()
+                root.clear()
+
+
+def _way_direction(tags):
+    """Retourne 1 (sens de saisie), -1 (sens inverse) ou 0 (double sens)."""
+    oneway = tags.get('oneway', '').lower()
+    if oneway in ('yes', 'true', '1'):
+        return 1
+    if oneway == '-1':
+        return -1
+    if oneway == 'no':
+        return 0
+    if tags.get('junction') == 'roundabout' or tags.get('highway') == 'motorway':
+        return 1
+    return 0
+
+
+def _drivable_way(elem, highway_types):
+    """Retourne (refs, tags) si la voie est carrossable, sinon None."""
+    tags = {t.get('k'): t.get('v') for t in elem.iter('tag')}
+    if tags.get('highway') not in highway_types:
+        return None
+    if tags.get('access') in ('no', 'private') or tags.get('area') == 'yes':
+        return None
+    refs = [nd.get('ref') for nd in elem.iter('nd')]
+    if len(refs) < 2:
+        return None
+    return refs, tags
+
+
+def load_osm_graph(path, highway_types=None, simplify=True, log=None):
+    """
+    Construit le graphe routier d'un extrait OSM local sans le charger en mémoire.
+
+    Args:
+        path: chemin du fichier .osm (ou .osm.bz2)
+        highway_types: valeurs de highway retenues (défaut: DRIVABLE_HIGHWAYS)
+        simplify: si True, fusionne les nœuds intermédiaires des voies et ne
+            conserve que les intersections et extrémités
+        log: PyQt signal (callable) pour logger des messages
+
+    Returns:
+        tuple: (nodes, edges, coords)
+            nodes: liste des ids de nœuds (str)
+            edges: liste de tuples (u, v, cost) avec cost en km
+            coords: dict {node_id: (lat, lon)}
+
+    Raises:
+        ValueError: Si le fichier ne contient aucune voie carrossable
+    """
+    highway_types = frozenset(highway_types or DRIVABLE_HIGHWAYS)
+
+    # ═══════════════════════════════════════════════════════════════
+    # PASSE 1: NŒUDS UTILISÉS PAR LES VOIES CARROSSABLES
+    # ═══════════════════════════════════════════════════════════════
+
+    ref_count = {}
+    n_ways = 0
+    for elem in _iter_elements(path, ('way',)):
+        way = _drivable_way(elem, highway_types)
+        if way is None:
+            continue
+        refs, _ = way
+        n_ways += 1
+        for ref in refs:
+            ref_count[ref] = ref_count.get(ref, 0) + 1
+        # Les extrémités de voie sont toujours conservées
+        ref_count[refs[0]] += 1
+        ref_count[refs[-1]] += 1
+
+    if not n_ways:
+        raise ValueError('Aucune voie carrossable trouvée dans le fichier OSM')
+
+    if log:
+        log.emit(f'OSM passe 1: {n_ways} voies, {len(ref_count)} nœuds référencés')
+
+    # ═══════════════════════════════════════════════════════════════
+    # PASSE 2: COORDONNÉES PUIS DÉCOUPAGE DES VOIES EN ARÊTES
+    # ═══════════════════════════════════════════════════════════════
+
+    all_coords = {}
+    edges = []
+    graph_nodes = set()
+
+    for elem in _iter_elements(path, ('node', 'way')):
+        if elem.tag == 'node':
+            nid = elem.get('id')
+            if nid in ref_count:
+                all_coords[nid] = (float(elem.get('lat')), float(elem.get('lon')))
+            continue
+
+        way = _drivable_way(elem, highway_types)
+        if way is None:
+            continue
+        refs, tags = way
+        refs = [ref for ref in refs if ref in all_coords]
+        direction = _way_direction(tags)
+
+        start = None
+        length = 0.0
+        for prev, ref in zip([None] + refs[:-1], refs):
+            if prev is not None:
+                length += haversine_km(*all_coords[prev], *all_coords[ref])
+            keep = not simplify or ref_count[ref] > 1
+            if not keep:
+                continue
+            if start is not None and start != ref:
+                cost = round(length, 4)
+                if direction >= 0:
+                    edges.append((start, ref, cost))
+                if direction <= 0:
+                    edges.append((ref, start, cost))
+                graph_nodes.add(start)
+                graph_nodes.add(ref)
+            start = ref
+            length = 0.0
+
+    coords = {n: all_coords[n] for n in graph_nodes}
+
+    if log:
+        log.emit(f'OSM passe 2: {len(coords)} nœuds, {len(edges)} arêtes')
+
+    return list(coords), edges, coords
@@ -0,0 +1,19 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from utils.osm_import import load_osm_graph
+
+class OsmImportThread(QThread):
+    graph_ready = pyqtSignal(list, list, dict)  # nodes, edges, coords
+    log = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        try:
+            nodes, edges, coords = load_osm_graph(self.path, log=self.log)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.graph_ready.emit(nodes, edges, coords)
@@ -0,0 +1,219 @@
+"""
+Décomposition de Benders pour la conception de réseau à coûts fixes.
+
+Maître : min  Σ f_a y_a + η     (y binaire, η >= 0)
+Sous-problème (y fixé) : min Σ c_a x_a  s.c. conservation du flux,
+                         0 <= x_a <= u_a y_a
+
+Les coupes sont ajoutées comme contraintes paresseuses (callback MIPSOL) dans
+un seul arbre de branch-and-cut :
+  - coupe d'optimalité : η >= Σ π_i b_i + Σ μ_a u_a y_a   (duals du LP)
+  - coupe de réalisabilité : Σ λ_i b_i + Σ λ_a u_a y_a >= 0  (rayon de Farkas)
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import gurobipy as gp
+from gurobipy import GRB
+
+from model.network import (
+    index_arcs,
+    arc_attr,
+    flow_lp,
+    build_results,
+    empty_results,
+    set_mip_start,
+    set_solve_options,
+    solve_status,
+    add_bound_info,
+)
+
+
+class _FlowSubproblem:
+    """LP de flot à coût minimum dont seules les capacités dépendent de y."""
+
+    def __init__(self, node_map, arcs, out_arcs, in_arcs, var_cost, capacity, env=None):
+        self.arcs = arcs
+        self.capacity = capacity
+        self.node_map = node_map
+
+        m, self.x, self.bal = flow_lp("Benders_Subproblem", node_map, arcs, out_arcs, in_arcs,
+                                      var_cost, env=env)
+        # Rayon de Farkas des sous-problèmes infaisables (coupes de réalisabilité)
+        m.Params.InfUnbdInfo = 1
+        self.cap = m.addConstrs((self.x[a] <= 0 for a in arcs), name="cap")
+        self.model = m
+
+    def solve(self, y_vals):
+        for a in self.arcs:
+            self.cap[a].RHS = self.capacity[a] * min(1.0, max(0.0, y_vals[a]))
+        self.model.optimize()
+        return self.model.status
+
+    def cut(self, y, eta=None):
+        """
+        Coupe de Benders issue de la dernière résolution: optimalité si `eta`
+        est fourni (sous-problème optimal), réalisabilité sinon.
+        """
+        attr = "Pi" if eta is not None else "FarkasDual"
+        const = sum(self.node_map[n] * c.getAttr(attr) for n, c in self.bal.items())
+        coeffs = {a: self.capacity[a] * self.cap[a].getAttr(attr) for a in self.arcs}
+        expr = const + gp.quicksum(coeffs[a] * y[a] for a in self.arcs if coeffs[a] != 0)
+        if eta is not None:
+            return eta >= expr
+        return expr >= 0
+
+    def flows(self):
+        return {a: self.x[a].X for a in self.arcs}
+
+
+def solve_benders(nodes_data, arcs_data, start=None, time_limit=None, mip_gap=None,
+                  node_limit=None, stop_flag=None, on_incumbent=None, tol=1e-6):
+    """
+    Résout le modèle de conception de réseau par Benders (branch-and-cut).
+
+    start: dict de résultats optionnel dont la conception sert de MIP start.
+    time_limit, mip_gap, node_limit, stop_flag, on_incumbent: voir TransportOptimizer.solve.
+
+    Retourne le même dict que TransportOptimizer.solve.
+    """
+    node_map = {n["id"]: n["demand"] for n in nodes_data}
+
+    def incumbent(obj_val, y_vals, subs):
+        on_incumbent(build_results("Incumbent", obj_val, arcs_data, y_vals, subs[0].flows()))
+
+    master, y_vals, scenario_flows = benders_design(
+        arcs_data, [node_map], [1.0], start=start, tol=tol, time_limit=time_limit,
+        mip_gap=mip_gap, node_limit=node_limit, stop_flag=stop_flag,
+        on_incumbent=incumbent if on_incumbent else None,
+    )
+    if y_vals is None:
+        return empty_results(solve_status(master))
+
+    _, flows = scenario_flows[0]
+    return add_bound_info(
+        build_results(solve_status(master), master.ObjVal, arcs_data, y_vals, flows),
+        master,
+    )
+
+
+def benders_design(arcs_data, node_maps, probabilities, start=None, tol=1e-6, max_workers=None,
+                   time_limit=None, mip_gap=None, node_limit=None, stop_flag=None,
+                   on_incumbent=None):
+    """
+    Cœur de Benders « multi-coupes » : une conception y partagée et un
+    sous-problème de flot par scénario de demande (node_maps[s]), pondéré par
+    probabilities[s]. Avec plusieurs scénarios, les sous-problèmes sont résolus
+    en parallèle dans des threads (un environnement Gurobi par scénario,
+    Gurobi relâche le GIL pendant l'optimisation).
+
+    on_incumbent: callable(obj_val, y_vals, subs) appelé pour chaque nouvelle
+    meilleure conception acceptée, les sous-problèmes contenant ses flux.
+
+    Retourne (master, y_vals, scenario_flows): y_vals est la meilleure
+    conception ou None si aucune n'a été trouvée; scenario_flows donne, pour
+    chaque scénario, (coût de flot, {arc: flux}) de cette conception. Les
+    sous-problèmes et leurs environnements sont libérés avant le retour.
+    """
+    arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+    fixed_cost = arc_attr(arcs_data, "fixed_cost")
+    var_cost = arc_attr(arcs_data, "var_cost")
+    capacity = arc_attr(arcs_data, "capacity")
+
+    parallel = len(node_maps) > 1
+    envs = [gp.Env(params={"OutputFlag": 0}) if parallel else None for _ in node_maps]
+    subs = [
+        _FlowSubproblem(node_map, arcs, out_arcs, in_arcs, var_cost, capacity, env=env)
+        for node_map, env in zip(node_maps, envs)
+    ]
+    pool = ThreadPoolExecutor(max_workers or len(subs)) if parallel else None
+
+    def solve_subs(y_vals):
+        if pool is None:
+            return [sub.solve(y_vals) for sub in subs]
+        return list(pool.map(lambda sub: sub.solve(y_vals), subs))
+
+    # Problème maître: variables de conception + estimation du coût de flot
+    master = gp.Model("Benders_Master")
+    master.Params.LazyConstraints = 1
+    y = master.addVars(
+        arcs, vtype=GRB.BINARY, name=[f"build_{u}_{v}" for u, v in arcs]
+    )
+    eta = master.addVars(len(subs), lb=0, name="eta")
+    master.setObjective(
+        y.prod(fixed_cost) + gp.quicksum(p * eta[s] for s, p in enumerate(probabilities)),
+        GRB.MINIMIZE,
+    )
+
+    # Coupes de réalisabilité triviales ajoutées d'emblée: la capacité construite
+    # autour de chaque nœud doit couvrir son offre (sortante) ou sa demande (entrante)
+    for node_map in node_maps:
+        for node_id, demand in node_map.items():
+            around = out_arcs.get(node_id, []) if demand > 0 else in_arcs.get(node_id, [])
+            if demand != 0:
+                master.addConstr(
+                    gp.quicksum(capacity[a] * y[a] for a in around) >= abs(demand),
+                    name=f"node_cut_{node_id}",
+                )
+
+    if start:
+        set_mip_start(start, y)
+    set_solve_options(master, time_limit, mip_gap, node_limit)
+
+    def separate(y_vals, eta_vals, add):
+        """Ajoute les coupes violées; retourne leur nombre."""
+        n_cuts = 0
+        for s, status in enumerate(solve_subs(y_vals)):
+            sub = subs[s]
+            if status == GRB.INFEASIBLE:
+                add(sub.cut(y))
+                n_cuts += 1
+            elif status == GRB.OPTIMAL:
+                flow_cost = sub.model.ObjVal
+                if eta_vals[s] < flow_cost - tol * max(1.0, abs(flow_cost)):
+                    add(sub.cut(y, eta[s]))
+                    n_cuts += 1
+        return n_cuts
+
+    best = [float("inf")]
+
+    def callback(model, where):
+        if stop_flag and stop_flag():
+            model.terminate()
+        elif where == GRB.Callback.MIPSOL:
+            # Solution entière: coupe paresseuse obligatoire
+            y_vals = dict(zip(arcs, model.cbGetSolution([y[a] for a in arcs])))
+            n_cuts = separate(y_vals, model.cbGetSolution(list(eta.values())), model.cbLazy)
+            if n_cuts == 0 and on_incumbent:
+                # Solution acceptée: son coût réel est fixe + espérance des flux
+                obj_val = sum(fixed_cost[a] for a in arcs if y_vals[a] > 0.5) + sum(
+                    p * sub.model.ObjVal for p, sub in zip(probabilities, subs)
+                )
+                if obj_val < best[0]:
+                    best[0] = obj_val
+                    on_incumbent(obj_val, y_vals, subs)
+        elif (
+            where == GRB.Callback.MIPNODE
+            and model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL
+            and model.cbGet(GRB.Callback.MIPNODE_NODCNT) == 0
+        ):
+            # Relaxation fractionnaire à la racine: renforce la borne du maître
+            y_vals = dict(zip(arcs, model.cbGetNodeRel([y[a] for a in arcs])))
+            separate(y_vals, model.cbGetNodeRel(list(eta.values())), model.cbCut)
+
+    try:
+        master.optimize(callback)
+        if master.SolCount == 0:
+            return master, None, []
+
+        y_vals = {a: y[a].X for a in arcs}
+        if any(status != GRB.OPTIMAL for status in solve_subs(y_vals)):
+            return master, None, []
+        return master, y_vals, [(sub.model.ObjVal, sub.flows()) for sub in subs]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        for sub in subs:
+            sub.model.dispose()
+        for env in envs:
+            if env is not None:
+                env.dispose()
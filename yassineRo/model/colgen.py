@@ -0,0 +1,204 @@
+"""
+Génération de colonnes (price-and-branch) sur une formulation par chemins.
+
+Une commodité k par nœud de demande (volume d_k), servie depuis n'importe quel
+nœud d'offre s. Problème maître restreint (RMP) sur les chemins générés P_k:
+
+    min  Σ_a f_a y_a + Σ_k Σ_{p ∈ P_k} c_p λ_p + M Σ_k art_k
+    s.c. Σ_{p ∈ P_k} λ_p + art_k = d_k                      (demande, σ_k)
+         Σ_{p partant de s} λ_p <= b_s                      (offre, α_s)
+         Σ_{p ∋ a} λ_p <= u_a y_a                            (capacité, μ_a)
+         Σ_{p ∈ P_k, p ∋ a} λ_p <= min(d_k, u_a) y_a        (liaison forte, ν_ak)
+
+Les liaisons fortes (une par arc et commodité) sont ajoutées à la demande,
+lorsqu'elles sont violées. Tarification: plus court chemin (Dijkstra) vers k
+sur les coûts réduits c_a - μ_a - ν_ak >= 0, diminués de α_s à l'origine. La
+borne lagrangienne RMP + Σ_k d_k min(0, coût réduit_k) est une borne
+inférieure à chaque itération; elle rejoint la valeur du LP à convergence.
+Les y sont ensuite rendus binaires sur les colonnes générées (price-and-branch)
+et la conception obtenue est évaluée par un flot à coût minimum sur tout le
+réseau.
+
+Les coûts variables doivent être positifs ou nuls; un nœud non déclaré est
+un simple nœud de transit.
+"""
+import heapq
+import time
+
+import gurobipy as gp
+from gurobipy import GRB
+
+from model.benders import _FlowSubproblem
+from model.network import index_arcs, arc_attr, build_results, empty_results, solve_status
+
+
+def _shortest_to(target, in_arcs, length):
+    """Dijkstra inverse: {nœud: (distance jusqu'à target, arc suivant)}."""
+    best = {target: (0.0, None)}
+    heap = [(0.0, target)]
+    done = set()
+    while heap:
+        dist, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        for a in in_arcs.get(node, ()):
+            cand = dist + length(a)
+            if a[0] not in best or cand < best[a[0]][0]:
+                best[a[0]] = (cand, a)
+                heapq.heappush(heap, (cand, a[0]))
+    return best
+
+
+def _path_from(origin, tree):
+    path = []
+    node = origin
+    while tree[node][1] is not None:
+        a = tree[node][1]
+        path.append(a)
+        node = a[1]
+    return path
+
+
+def solve_column_generation(nodes_data, arcs_data, time_limit=None, mip_gap=None,
+                            max_iter=500, tol=1e-6):
+    """
+    Conception par génération de colonnes puis MIP sur les chemins générés.
+
+    time_limit: limite globale en secondes (génération + MIP)
+    mip_gap: écart relatif visé par le MIP final
+
+    Retourne le dict commun (statut "Optimal" si l'écart à la borne est nul,
+    "Heuristic" sinon) avec "bound" (borne lagrangienne / LP), "mip_gap",
+    "columns" et "iterations".
+    """
+    started = time.time()
+    arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+    fixed_cost = arc_attr(arcs_data, "fixed_cost")
+    var_cost = arc_attr(arcs_data, "var_cost")
+    capacity = arc_attr(arcs_data, "capacity")
+    node_map = {n["id"]: n["demand"] for n in nodes_data}
+    dests = {n: -d for n, d in node_map.items() if d < 0}
+    supplies = {n: d for n, d in node_map.items() if d > 0}
+    if not dests:
+        return build_results("Optimal", 0.0, arcs_data, {}, {})
+
+    # Coût unitaire des artificielles: supérieur à tout chemin, coûts fixes compris
+    big_m = (sum(fixed_cost.values()) + sum(var_cost.values())) \
+        * max(1.0, 1.0 / min(dests.values())) + 1.0
+
+    m = gp.Model("Path_Master")
+    m.Params.OutputFlag = 0
+    y = m.addVars(arcs, ub=1.0, obj=fixed_cost, name=[f"build_{u}_{v}" for u, v in arcs])
+    art = m.addVars(list(dests), obj=big_m, name="artificial")
+    demand_row = {k: m.addConstr(art[k] == d_k, name=f"demand_{k}") for k, d_k in dests.items()}
+    supply_row = {s: m.addConstr(gp.LinExpr() <= b_s, name=f"supply_{s}") for s, b_s in supplies.items()}
+    cap_row = {a: m.addConstr(-capacity[a] * y[a] <= 0, name=f"cap[{a[0]},{a[1]}]") for a in arcs}
+    strong_row = {}          # {(a, k): contrainte}
+    columns = {k: [] for k in dests}   # {k: [(variable λ, chemin, origine)]}
+
+    def add_path(k, origin, path):
+        col = gp.Column()
+        col.addTerms(1.0, demand_row[k])
+        col.addTerms(1.0, supply_row[origin])
+        for a in path:
+            col.addTerms(1.0, cap_row[a])
+            if (a, k) in strong_row:
+                col.addTerms(1.0, strong_row[a, k])
+        var = m.addVar(obj=sum(var_cost[a] for a in path), column=col)
+        columns[k].append((var, path, origin))
+
+    def price(k, length, alpha):
+        tree = _shortest_to(k, in_arcs, length)
+        origins = [s for s in supplies if s in tree]
+        if not origins:
+            return None
+        s = min(origins, key=lambda o: tree[o][0] - alpha.get(o, 0.0))
+        return s, tree[s][0] - alpha.get(s, 0.0), _path_from(s, tree)
+
+    # Colonnes initiales: plus courts chemins sur coût variable + coût fixe amorti
+    for k in dests:
+        found = price(k, lambda a: var_cost[a] + fixed_cost[a] / capacity[a], {})
+        if found:
+            add_path(k, found[0], found[2])
+
+    iterations = 0
+    lower_bound = 0.0
+    for iterations in range(1, max_iter + 1):
+        if time_limit is not None and time.time() - started > time_limit:
+            break
+        m.optimize()
+        if m.status != GRB.OPTIMAL:
+            return empty_results(solve_status(m))
+        sigma = {k: c.Pi for k, c in demand_row.items()}
+        alpha = {s: c.Pi for s, c in supply_row.items()}
+        mu = {a: c.Pi for a, c in cap_row.items()}
+        nu = {}
+        for (a, k), c in strong_row.items():
+            nu.setdefault(k, {})[a] = c.Pi
+
+        added = 0
+        lagrangian = m.ObjVal
+        for k, d_k in dests.items():
+            nu_k = nu.get(k, {})
+            found = price(k, lambda a: var_cost[a] - mu[a] - nu_k.get(a, 0.0), alpha)
+            if found is None:
+                continue
+            reduced_cost = found[1] - sigma[k]
+            lagrangian += d_k * min(0.0, reduced_cost)
+            if reduced_cost < -tol * max(1.0, abs(sigma[k])):
+                add_path(k, found[0], found[2])
+                added += 1
+        # Borne lagrangienne (Σ_p λ_p = d_k): valide même avant convergence
+        lower_bound = max(lower_bound, lagrangian)
+        if added:
+            continue
+
+        # Plus de colonne améliorante: séparation des liaisons fortes violées
+        y_vals = {a: y[a].X for a in arcs}
+        for k, d_k in dests.items():
+            load = {}
+            for var, path, _ in columns[k]:
+                if var.X > tol:
+                    for a in path:
+                        load[a] = load.get(a, 0.0) + var.X
+            for a, flow in load.items():
+                bound = min(d_k, capacity[a])
+                if (a, k) not in strong_row and flow > bound * y_vals[a] + tol:
+                    expr = gp.quicksum(var for var, path, _ in columns[k] if a in path)
+                    strong_row[a, k] = m.addConstr(
+                        expr <= bound * y[a], name=f"strong_cap[{a[0]},{a[1]},{k}]"
+                    )
+                    added += 1
+        if not added:
+            break
+
+    n_columns = sum(len(c) for c in columns.values())
+
+    # Price-and-branch: conception entière sur les chemins générés
+    y_list = [y[a] for a in arcs]
+    m.setAttr("VType", y_list, [GRB.BINARY] * len(y_list))
+    if time_limit is not None:
+        m.Params.TimeLimit = max(0.0, time_limit - (time.time() - started))
+    if mip_gap is not None:
+        m.Params.MIPGap = mip_gap
+    m.optimize()
+    if m.SolCount == 0:
+        return empty_results(solve_status(m))
+
+    # Flot à coût minimum de la conception sur tout le réseau (tous chemins)
+    design = dict(zip(arcs, m.getAttr("X", y_list)))
+    sub = _FlowSubproblem(node_map, arcs, out_arcs, in_arcs, var_cost, capacity)
+    if sub.solve(design) != GRB.OPTIMAL:
+        return empty_results("Infeasible/Unbounded")
+    built = {a for a, v in design.items() if v > 0.5}
+    obj_val = sum(fixed_cost[a] for a in built) + sub.model.ObjVal
+
+    gap = (obj_val - lower_bound) / abs(obj_val) if obj_val else 0.0
+    results = build_results("Optimal" if gap <= 1e-4 else "Heuristic", obj_val,
+                            arcs_data, design, sub.flows())
+    results["bound"] = lower_bound
+    results["mip_gap"] = max(gap, 0.0)
+    results["columns"] = n_columns
+    results["iterations"] = iterations
+    return results
@@ -0,0 +1,133 @@
+"""
+Inégalités de coupe (cut-set) pour la conception de réseau à coûts fixes.
+
+Pour un ensemble de nœuds S de demande nette D(S) > 0, la capacité des arcs
+construits entrant dans S doit couvrir D(S):
+
+    Σ_{a ∈ δ-(S)} min(u_a, D(S)) y_a >= D(S)
+
+(symétriquement, l'offre nette d'un ensemble doit pouvoir en sortir). La
+relaxation LP satisfait déjà la version non arrondie: les coupes utiles sont
+leurs arrondis MIR, séparés sur la solution fractionnaire ȳ de la racine
+(callback MIPNODE). Les ensembles candidats sont construits par croissance
+gloutonne autour de chaque nœud d'offre ou de demande.
+
+strong_link_bounds() fournit en complément un majorant du flux de chaque arc,
+plus serré que sa capacité, pour renforcer x_a <= M_a y_a.
+"""
+import math
+
+
+def strong_link_bounds(node_map, arcs, out_arcs, in_arcs, capacity):
+    """
+    {arc: M_a} pour les arcs où M_a < u_a. Le flux sur (u, v) ne peut dépasser
+    ce que v absorbe (sa demande + capacité sortante) ni ce que u émet (son
+    offre + capacité entrante). Les nœuds non déclarés sont ignorés.
+    """
+    bounds = {}
+    for u, v in arcs:
+        limit = capacity[u, v]
+        if v in node_map:
+            limit = min(limit, max(0, -node_map[v]) + sum(capacity[a] for a in out_arcs.get(v, ())))
+        if u in node_map:
+            limit = min(limit, max(0, node_map[u]) + sum(capacity[a] for a in in_arcs.get(u, ())))
+        if limit < capacity[u, v]:
+            bounds[u, v] = limit
+    return bounds
+
+
+def _mir(coeffs, rhs, tol):
+    """
+    Arrondi MIR de Σ a_j y_j >= b (y entiers >= 0):
+    Σ (⌊a_j⌋ + min(f_j, f) / f) y_j >= ⌈b⌉, avec f = frac(b). None si b est entier.
+    """
+    f = rhs - math.floor(rhs)
+    if f < tol or f > 1 - tol:
+        return None
+    rounded = {}
+    for a, coef in coeffs.items():
+        f_j = coef - math.floor(coef)
+        rounded[a] = math.floor(coef) + min(f_j, f) / f
+    return rounded, math.ceil(rhs)
+
+
+class CutSetSeparator:
+    """Séparation heuristique des coupes cut-set (version arrondie MIR)."""
+
+    def __init__(self, node_map, arcs, out_arcs, in_arcs, capacity,
+                 max_size=6, max_cuts=50, tol=1e-6):
+        self.node_map = node_map
+        self.arcs = arcs
+        self.out_arcs = out_arcs
+        self.in_arcs = in_arcs
+        self.capacity = capacity
+        self.max_size = max_size
+        self.max_cuts = max_cuts
+        self.tol = tol
+        self._added = set()
+
+    def separate(self, y_vals):
+        """
+        Retourne les coupes violées par ȳ, sous forme de (coeffs, rhs) pour
+        Σ coeffs[a] y_a >= rhs, au plus max_cuts, sans répéter une coupe déjà
+        retournée.
+        """
+        cuts = []
+        for node_id, demand in self.node_map.items():
+            if demand == 0:
+                continue
+            # Demande: arcs entrant dans S; offre: arcs sortant de S
+            inward = demand < 0
+            for cut in self._grow(node_id, inward, y_vals):
+                cuts.append(cut)
+                if len(cuts) >= self.max_cuts:
+                    return cuts
+        return cuts
+
+    def _grow(self, seed, inward, y_vals):
+        sign = -1 if inward else 1
+        crossing = self.in_arcs if inward else self.out_arcs
+        S = {seed}
+        net = sign * self.node_map[seed]
+        while True:
+            cut_arcs = [a for n in S for a in crossing.get(n, ())
+                        if (a[0] if inward else a[1]) not in S]
+            if net > self.tol:
+                cut = self._violated(frozenset(S), inward, net, cut_arcs, y_vals)
+                if cut is not None:
+                    yield cut
+            if len(S) >= self.max_size:
+                return
+            # Ajoute le voisin déclaré le plus fortement relié à S (capacité ȳ-pondérée)
+            weight = {}
+            for a in cut_arcs:
+                other = a[0] if inward else a[1]
+                if other in self.node_map:
+                    weight[other] = weight.get(other, 0.0) + self.capacity[a] * y_vals[a]
+            if not weight:
+                return
+            nxt = max(weight, key=weight.get)
+            S.add(nxt)
+            net += sign * self.node_map[nxt]
+
+    def _violated(self, S, inward, net, cut_arcs, y_vals):
+        base = {a: min(self.capacity[a], net) for a in cut_arcs}
+        divisors = sorted({base[a] for a in cut_arcs if y_vals[a] > self.tol}, reverse=True)[:5]
+
+        best, best_violation = None, self.tol
+        for delta in divisors:
+            key = (S, inward, delta)
+            if key in self._added:
+                continue
+            mir = _mir({a: c / delta for a, c in base.items()}, net / delta, self.tol)
+            if mir is None:
+                continue
+            coeffs, rhs = mir
+            violation = (rhs - sum(c * y_vals[a] for a, c in coeffs.items())) / rhs
+            if violation > best_violation:
+                best, best_violation = (key, coeffs, rhs), violation
+        if best is None:
+            return None
+        key, coeffs, rhs = best
+        self._added.add(key)
+        return coeffs, rhs
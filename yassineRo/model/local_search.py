@@ -0,0 +1,213 @@
+"""
+Recherche locale pour la conception de réseau (ouverture / fermeture / échange).
+
+Une conception est un ensemble d'arcs ouverts; son coût est la somme des coûts
+fixes des arcs utilisés et du coût d'un flot à coût minimum limité à ces arcs.
+Ce LP unique est réoptimisé à chaud par le simplexe dual: changer la
+conception ne modifie que des bornes de variables, la base précédente reste
+duale réalisable.
+
+Voisinages, en première amélioration:
+  - fermeture d'un arc ouvert (coût fixe le plus lourd d'abord);
+  - fermeture avec réacheminement: l'arc est interdit et le flux recalculé sur
+    tout le réseau, les arcs fermés coûtant leur pente c_a + f_a / u_a'; la
+    conception suit les arcs utilisés (ouvre un chemin entier si besoin);
+  - ouverture d'un arc fermé, parmi ceux dont le coût réduit
+    c_a - (π_u - π_v) promet une économie supérieure à leur coût fixe;
+  - échange: fermeture d'un arc et ouverture d'un de ces candidats.
+
+Chaque départ (pentes c_a + f_a / min(u_a, offre totale), perturbées
+aléatoirement sauf pour le premier) est suivi d'une recherche locale itérée
+jusqu'à sa limite de temps. Les départs sont explorés en parallèle dans un
+pool de processus; le résultat peut servir de MIP start à
+TransportOptimizer.solve(start=...).
+"""
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from gurobipy import GRB
+
+from model.network import index_arcs, arc_attr, flow_lp, build_results, empty_results
+
+
+class _FlowEvaluator:
+    """Flot à coût minimum sur les arcs ouverts d'une conception, avec cache."""
+
+    def __init__(self, nodes_data, arcs_data, eps=1e-6):
+        self.arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+        self.fixed_cost = arc_attr(arcs_data, "fixed_cost")
+        self.var_cost = arc_attr(arcs_data, "var_cost")
+        self.capacity = arc_attr(arcs_data, "capacity")
+        self.eps = eps
+        # Aucun arc ne porte plus que l'offre totale: u_a' = min(u_a, offre totale)
+        self.total_supply = sum(n["demand"] for n in nodes_data if n["demand"] > 0)
+        self.cache = {}
+        self.evaluations = 0
+
+        node_map = {n["id"]: n["demand"] for n in nodes_data}
+        m, self.x, self.bal = flow_lp("Local_Search_Flow", node_map, self.arcs, out_arcs,
+                                      in_arcs, self.var_cost, self.capacity)
+        m.Params.Method = 1  # simplexe dual: seules les bornes changent
+        self.x_list = [self.x[a] for a in self.arcs]
+        self.model = m
+
+    def _solve(self, design):
+        self.model.setAttr("UB", self.x_list,
+                           [self.capacity[a] if a in design else 0.0 for a in self.arcs])
+        self.model.optimize()
+        return self.model.status == GRB.OPTIMAL
+
+    def evaluate(self, design):
+        """(coût, arcs réellement utilisés); coût infini si la conception est infaisable."""
+        design = frozenset(design)
+        if design not in self.cache:
+            self.evaluations += 1
+            if not self._solve(design):
+                self.cache[design] = (float("inf"), design)
+            else:
+                flows = dict(zip(self.arcs, self.model.getAttr("X", self.x_list)))
+                used = frozenset(a for a in design if flows[a] > self.eps)
+                cost = sum(self.fixed_cost[a] for a in used) + self.model.ObjVal
+                self.cache[design] = self.cache[used] = (cost, used)
+        return self.cache[design]
+
+    def flows(self, design):
+        self._solve(design)
+        return dict(zip(self.arcs, self.model.getAttr("X", self.x_list)))
+
+    def open_candidates(self, design):
+        """Arcs fermés triés par économie estimée -rc_a * u_a - f_a > 0."""
+        if not self._solve(design):
+            return []
+        pi = {n: c.Pi for n, c in self.bal.items()}
+        savings = {}
+        for a in self.arcs:
+            if a in design:
+                continue
+            rc = self.var_cost[a] - (pi.get(a[0], 0.0) - pi.get(a[1], 0.0))
+            saving = -rc * self.capacity[a] - self.fixed_cost[a]
+            if saving > self.eps:
+                savings[a] = saving
+        return sorted(savings, key=savings.get, reverse=True)
+
+    def _slope(self, a):
+        return self.var_cost[a] + self.fixed_cost[a] / max(
+            min(self.capacity[a], self.total_supply), self.eps
+        )
+
+    def _linearized(self, costs, design):
+        """Arcs utilisés par le flot de coûts `costs` sur les arcs de `design`."""
+        self.model.setAttr("Obj", self.x_list, costs)
+        feasible = self._solve(design)
+        flows = self.model.getAttr("X", self.x_list) if feasible else []
+        self.model.setAttr("Obj", self.x_list, [self.var_cost[a] for a in self.arcs])
+        return {a for a, f in zip(self.arcs, flows) if f > self.eps}
+
+    def linearized_design(self, rng=None):
+        """Arcs utilisés par le flot de pente c_a + f_a / u_a' (perturbée si rng)."""
+        costs = [
+            self.var_cost[a] + (self._slope(a) - self.var_cost[a])
+            * (rng.uniform(0.5, 1.5) if rng else 1.0)
+            for a in self.arcs
+        ]
+        return self._linearized(costs, set(self.arcs))
+
+    def reroute(self, design, banned):
+        """
+        Conception obtenue en fermant `banned` et en réacheminant sur tout le
+        réseau: arcs ouverts au coût c_a, arcs fermés à la pente c_a + f_a / u_a'.
+        """
+        costs = [self.var_cost[a] if a in design else self._slope(a) for a in self.arcs]
+        return self._linearized(costs, set(self.arcs) - {banned})
+
+
+def _descend(evaluator, design, deadline, max_open=10):
+    """Recherche locale en première amélioration jusqu'à un optimum local."""
+    cost, design = evaluator.evaluate(design)
+    fixed_cost = evaluator.fixed_cost
+    eps = evaluator.eps
+
+    def moves():
+        by_fixed = sorted(design, key=fixed_cost.get, reverse=True)
+        for a in by_fixed:
+            yield design - {a}
+        for a in by_fixed:
+            yield evaluator.reroute(design, a)
+        candidates = evaluator.open_candidates(design)[:max_open]
+        for b in candidates:
+            yield design | {b}
+        for b in candidates:
+            for a in by_fixed:
+                yield (design - {a}) | {b}
+
+    improved = True
+    while improved:
+        improved = False
+        for neighbour in moves():
+            if time.time() > deadline:
+                return cost, design
+            new_cost, used = evaluator.evaluate(neighbour)
+            if new_cost < cost - eps:
+                cost, design = new_cost, used
+                improved = True
+                break
+    return cost, design
+
+
+def _run_start(args):
+    """Un départ de la recherche locale (exécuté dans un processus du pool)."""
+    nodes_data, arcs_data, seed, time_limit, max_kicks = args
+    deadline = time.time() + time_limit
+    evaluator = _FlowEvaluator(nodes_data, arcs_data)
+    design = evaluator.linearized_design(random.Random(seed) if seed is not None else None)
+    best_cost, best_design = _descend(evaluator, design, deadline)
+
+    # Recherche locale itérée: perturbation (deux fermetures avec réacheminement
+    # aléatoires) puis nouvelle descente, jusqu'à la limite de temps ou
+    # max_kicks perturbations consécutives sans amélioration
+    rng = random.Random(seed)
+    stalled = 0
+    while time.time() < deadline and best_design and stalled < max_kicks:
+        stalled += 1
+        design = set(best_design)
+        for _ in range(2):
+            if design:
+                design = evaluator.reroute(design, rng.choice(sorted(design)))
+        cost, design = _descend(evaluator, design, deadline)
+        if cost < best_cost - evaluator.eps:
+            best_cost, best_design = cost, design
+            stalled = 0
+    return best_cost, sorted(best_design), evaluator.evaluations
+
+
+def solve_local_search(nodes_data, arcs_data, starts=4, time_limit=5.0, max_workers=None, seed=0,
+                       max_kicks=100):
+    """
+    starts: nombre de départs (le premier utilise les pentes non perturbées)
+    time_limit: durée maximale de chaque départ, en secondes
+    max_kicks: perturbations consécutives sans amélioration avant l'arrêt d'un départ
+    max_workers: taille du pool de processus (starts > 1)
+
+    Retourne le dict de TransportOptimizer.solve avec le statut "Heuristic",
+    complété par "starts" (coût de chaque départ) et "evaluations".
+    """
+    jobs = [(nodes_data, arcs_data, seed + i if i else None, time_limit, max_kicks)
+            for i in range(starts)]
+    if starts > 1:
+        with ProcessPoolExecutor(max_workers) as pool:
+            runs = list(pool.map(_run_start, jobs))
+    else:
+        runs = [_run_start(jobs[0])]
+
+    best_cost, best_design, _ = min(runs, key=lambda r: r[0])
+    if best_cost == float("inf"):
+        return empty_results("Infeasible/Unbounded")
+
+    evaluator = _FlowEvaluator(nodes_data, arcs_data)
+    design = set(map(tuple, best_design))
+    build = {a: 1.0 for a in design}
+    results = build_results("Heuristic", best_cost, arcs_data, build, evaluator.flows(design))
+    results["starts"] = [r[0] for r in runs]
+    results["evaluations"] = sum(r[2] for r in runs)
+    return results
@@ -0,0 +1,155 @@
+"""
+Conception de réseau multi-périodes (extension de capacité).
+
+Un arc construit à la période t reste disponible aux périodes suivantes; chaque
+période a ses propres demandes et ses propres flux:
+
+    min  Σ_t ρ^t (Σ_a f_a b[a,t] + Σ_a c_a x[a,t])      ρ = 1 / (1 + discount_rate)
+    s.c. Σ_t b[a,t] <= 1                                 (un arc n'est construit qu'une fois)
+         conservation du flux de chaque période
+         x[a,t] <= u_a Σ_{τ<=t} b[a,τ]
+
+Horizon glissant (window): on résout une fenêtre de périodes, on fige les
+décisions des `step` premières périodes, puis la fenêtre avance. Les arcs déjà
+construits restent disponibles sans coût fixe dans les fenêtres suivantes.
+"""
+import gurobipy as gp
+from gurobipy import GRB
+
+from model.network import (
+    index_arcs,
+    arc_attr,
+    add_flow_balance,
+    build_results,
+    empty_results,
+    set_solve_options,
+    solve_status,
+)
+from model.precheck import check_feasibility
+
+
+def _build_window(node_maps, arcs, out_arcs, in_arcs, fixed_cost, var_cost, capacity,
+                  periods, prebuilt, rho):
+    """MILP des périodes `periods` (indices absolus), les arcs `prebuilt` étant déjà construits."""
+    m = gp.Model("Multi_Period_Design")
+    candidates = [a for a in arcs if a not in prebuilt]
+    b = m.addVars(candidates, periods, vtype=GRB.BINARY, name="build")
+    x = m.addVars(arcs, periods, lb=0, name="flow")
+
+    m.setObjective(
+        gp.quicksum(rho ** t * fixed_cost[a] * b[a + (t,)] for a in candidates for t in periods)
+        + gp.quicksum(rho ** t * var_cost[a] * x[a + (t,)] for a in arcs for t in periods),
+        GRB.MINIMIZE,
+    )
+    m.addConstrs((b.sum(*a, "*") <= 1 for a in candidates), name="build_once")
+
+    for t in periods:
+        add_flow_balance(m, {a: x[a + (t,)] for a in arcs}, node_maps[t], out_arcs, in_arcs,
+                         name=f"flow_bal[{t}]")
+
+    for a in arcs:
+        for t in periods:
+            if a in prebuilt:
+                x[a + (t,)].UB = capacity[a]
+            else:
+                available = gp.quicksum(b[a + (tau,)] for tau in periods if tau <= t)
+                m.addConstr(x[a + (t,)] <= capacity[a] * available, name=f"cap[{a[0]},{a[1]},{t}]")
+    return m, candidates, b, x
+
+
+def solve_multi_period(nodes_data, arcs_data, demands, window=None, step=1,
+                       discount_rate=0.0, time_limit=None, mip_gap=None):
+    """
+    nodes_data: nœuds du réseau (les demandes sont ignorées)
+    arcs_data: arcs candidats
+    demands: liste de dicts {node_id: demand}, un par période (nœud absent = 0)
+    window: nombre de périodes par fenêtre (None = horizon complet, monolithique)
+    step: périodes figées à chaque avancée de la fenêtre
+    discount_rate: taux d'actualisation par période
+    time_limit, mip_gap: limites appliquées à chaque fenêtre
+
+    Retourne:
+        {"status", "obj_val",                  # coût total actualisé
+         "build_plan": {(source, target): période de construction},
+         "periods": [dict de résultats par période: arcs disponibles et leurs flux,
+                     "new_arcs" construits à cette période, "obj_val" non actualisé]}
+    Le statut est "Rolling Horizon" quand la fenêtre ne couvre pas tout
+    l'horizon (solution heuristique).
+    """
+    if not demands:
+        raise ValueError("Aucune période de demande")
+    horizon = len(demands)
+    window = horizon if window is None else min(window, horizon)
+    if window < 1 or not 1 <= step <= window:
+        raise ValueError("Il faut 1 <= step <= window")
+
+    node_maps = [{n["id"]: d.get(n["id"], 0) for n in nodes_data} for d in demands]
+    for t, node_map in enumerate(node_maps):
+        infeasibility = check_feasibility(
+            [{"id": n, "demand": d} for n, d in node_map.items()], arcs_data
+        )
+        if infeasibility is not None:
+            results = empty_results("Infeasible")
+            results["infeasibility"] = {**infeasibility, "period": t}
+            return results
+
+    arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+    fixed_cost = arc_attr(arcs_data, "fixed_cost")
+    var_cost = arc_attr(arcs_data, "var_cost")
+    capacity = arc_attr(arcs_data, "capacity")
+    rho = 1.0 / (1.0 + discount_rate)
+
+    build_plan = {}          # décisions figées
+    flows = {}               # {période: {arc: flux}} figés
+    previous = {}            # plan de la fenêtre précédente, pour le MIP start
+    status = "Optimal"
+    start = 0
+    while start < horizon:
+        periods = list(range(start, min(start + window, horizon)))
+        m, candidates, b, x = _build_window(
+            node_maps, arcs, out_arcs, in_arcs, fixed_cost, var_cost, capacity,
+            periods, set(build_plan), rho,
+        )
+        m.Params.OutputFlag = 0
+        set_solve_options(m, time_limit, mip_gap)
+        for a in candidates:
+            for t in periods:
+                b[a + (t,)].Start = 1.0 if previous.get(a) == t else 0.0
+
+        m.optimize()
+        if m.SolCount == 0:
+            return empty_results(solve_status(m))
+        if m.status != GRB.OPTIMAL:
+            status = solve_status(m)
+
+        previous = {a: t for a in candidates for t in periods if b[a + (t,)].X > 0.5}
+        fixed_periods = periods if periods[-1] == horizon - 1 else periods[:step]
+        for a, t in previous.items():
+            if t in fixed_periods:
+                build_plan[a] = t
+        for t in fixed_periods:
+            flows[t] = {a: x[a + (t,)].X for a in arcs}
+        start = fixed_periods[-1] + 1
+
+    if window < horizon and status == "Optimal":
+        status = "Rolling Horizon"
+
+    period_results = []
+    total = 0.0
+    for t in range(horizon):
+        available = {a: 1.0 for a, built in build_plan.items() if built <= t}
+        new_arcs = [a for a, built in build_plan.items() if built == t]
+        cost = sum(fixed_cost[a] for a in new_arcs) + sum(
+            var_cost[a] * flows[t][a] for a in arcs
+        )
+        total += rho ** t * cost
+        results = build_results(status, cost, arcs_data, available, flows[t])
+        results["new_arcs"] = new_arcs
+        period_results.append(results)
+
+    return {
+        "status": status,
+        "obj_val": total,
+        "build_plan": build_plan,
+        "periods": period_results,
+    }
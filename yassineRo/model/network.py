@@ -0,0 +1,141 @@
+"""
+Helpers shared by the network design engines: arc indexing and the
+results dict returned by every solve method.
+"""
+import gurobipy as gp
+from gurobipy import GRB
+
+# Statuts Gurobi d'un arrêt anticipé: la meilleure solution connue est retournée
+STOP_STATUSES = {
+    GRB.TIME_LIMIT: "Time Limit",
+    GRB.NODE_LIMIT: "Node Limit",
+    GRB.INTERRUPTED: "Cancelled",
+}
+
+
+def index_arcs(arcs_data):
+    """
+    Retourne (arcs, out_arcs, in_arcs): la tuplelist des arcs (u, v) et,
+    pour chaque nœud, la liste de ses arcs sortants et entrants.
+
+    Les arcs parallèles (même source et cible) doivent d'abord passer par
+    model.presolve, les variables étant indexées par (u, v).
+    """
+    arcs = gp.tuplelist()
+    out_arcs = {}
+    in_arcs = {}
+    for arc in arcs_data:
+        a = (arc["source"], arc["target"])
+        arcs.append(a)
+        out_arcs.setdefault(a[0], []).append(a)
+        in_arcs.setdefault(a[1], []).append(a)
+    if len(set(arcs)) != len(arcs):
+        raise ValueError("Arcs parallèles entre les mêmes nœuds: activer le présolve")
+    return arcs, out_arcs, in_arcs
+
+
+def arc_attr(arcs_data, key):
+    """Dict {(u, v): arc[key]} pour un attribut d'arc (fixed_cost, var_cost, capacity)."""
+    return {(a["source"], a["target"]): a[key] for a in arcs_data}
+
+
+def add_flow_balance(m, x, node_map, out_arcs, in_arcs, name="flow_bal"):
+    """
+    Conservation du flux pour chaque nœud de node_map:
+    Σ x sortants - Σ x entrants = demande (x indexé par arc (u, v)).
+    Les lignes sont nommées f"{name}_{node_id}"; retourne {node_id: contrainte}.
+    """
+    bal = {}
+    for node_id, demand in node_map.items():
+        out_x = [x[a] for a in out_arcs.get(node_id, ())]
+        in_x = [x[a] for a in in_arcs.get(node_id, ())]
+        expr = gp.LinExpr([1.0] * len(out_x), out_x)
+        expr.addTerms([-1.0] * len(in_x), in_x)
+        bal[node_id] = m.addConstr(expr == demand, name=f"{name}_{node_id}")
+    return bal
+
+
+def flow_lp(model_name, node_map, arcs, out_arcs, in_arcs, var_cost, capacity=None, env=None):
+    """
+    LP de flot à coût minimum utilisé par les moteurs qui fixent une
+    conception: x >= 0 de coût var_cost (borné par capacity si fourni) et
+    conservation du flux. Retourne (m, x, bal).
+
+    Les réductions duales sont désactivées: un LP infaisable a le statut
+    INFEASIBLE (jamais INF_OR_UNBD), seul OPTIMAL signale un flot réalisable.
+    """
+    m = gp.Model(model_name, env=env)
+    m.Params.OutputFlag = 0
+    m.Params.DualReductions = 0
+    if capacity is None:
+        x = m.addVars(arcs, lb=0, obj=var_cost, name="flow")
+    else:
+        x = m.addVars(arcs, lb=0, ub=capacity, obj=var_cost, name="flow")
+    return m, x, add_flow_balance(m, x, node_map, out_arcs, in_arcs)
+
+
+def build_results(status, obj_val, arcs_data, build, flow):
+    """
+    Formate une solution dans le dict commun à tous les moteurs.
+
+    build, flow: dicts {(u, v): valeur} pour les variables y et x.
+    """
+    result_arcs = []
+    for arc in arcs_data:
+        u, v = arc["source"], arc["target"]
+        if build.get((u, v), 0) > 0.5:  # Si construit
+            result_arcs.append(
+                {
+                    "source": u,
+                    "target": v,
+                    "flow": flow.get((u, v), 0.0),
+                    "capacity": arc["capacity"],
+                    "fixed_cost": arc["fixed_cost"],
+                }
+            )
+    return {"status": status, "obj_val": obj_val, "built_arcs": result_arcs}
+
+
+def empty_results(status):
+    return {"status": status, "obj_val": 0, "built_arcs": []}
+
+
+def set_mip_start(results, y, x=None):
+    """
+    Initialise les attributs Start de y (et x) à partir d'un dict de résultats:
+    les arcs de "built_arcs" sont construits, tous les autres fermés.
+    """
+    built = {(a["source"], a["target"]): a["flow"] for a in results.get("built_arcs", [])}
+    for a in y.keys():
+        y[a].Start = 1.0 if a in built else 0.0
+        if x is not None:
+            x[a].Start = built.get(a, 0.0)
+
+
+def set_solve_options(model, time_limit=None, mip_gap=None, node_limit=None):
+    """Applique les limites de résolution optionnelles (None = valeur Gurobi par défaut)."""
+    if time_limit is not None:
+        model.Params.TimeLimit = time_limit
+    if mip_gap is not None:
+        model.Params.MIPGap = mip_gap
+    if node_limit is not None:
+        model.Params.NodeLimit = node_limit
+
+
+def solve_status(model):
+    """
+    Libellé du statut final: "Optimal", "Time Limit", "Node Limit", "Cancelled"
+    ou "Infeasible/Unbounded".
+    """
+    if model.status == GRB.OPTIMAL:
+        return "Optimal"
+    if model.status in STOP_STATUSES:
+        return STOP_STATUSES[model.status]
+    return "Infeasible/Unbounded"
+
+
+def add_bound_info(results, model):
+    """Ajoute la borne inférieure et l'écart relatif d'un MIP résolu (ou interrompu)."""
+    results["bound"] = model.ObjBound
+    results["mip_gap"] = model.MIPGap
+    return results
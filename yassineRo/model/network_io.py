@@ -0,0 +1,210 @@
+"""
+Import en masse d'un réseau depuis des fichiers CSV ou GeoJSON.
+
+Les données sont gardées en colonnes (tableaux NumPy typés):
+    nœuds: {"id": object, "demand": float64, "x": float64, "y": float64}
+    arcs:  {"source": object, "target": object,
+            "fixed_cost": float64, "var_cost": float64, "capacity": float64}
+x / y valent NaN si le nœud n'a pas de coordonnées.
+
+Formats:
+  - CSV nœuds: colonnes id, demand (x, y optionnelles);
+  - CSV arcs: colonnes source, target, fixed_cost, var_cost, capacity;
+  - GeoJSON: entités Point = nœuds (propriétés id, demand), entités
+    LineString = arcs (propriétés fixed_cost, var_cost, capacity; source et
+    target, ou à défaut les Points situés aux extrémités de la ligne).
+
+validate_network() vérifie toutes les lignes d'un coup (identifiants
+inconnus ou dupliqués, arcs dupliqués, valeurs non numériques) et lève une
+ValueError listant les lignes fautives.
+"""
+import csv
+import json
+
+import numpy as np
+
+NODE_COLUMNS = ("id", "demand")
+ARC_COLUMNS = ("source", "target", "fixed_cost", "var_cost", "capacity")
+NUMERIC_ARC_COLUMNS = ("fixed_cost", "var_cost", "capacity")
+MAX_REPORTED = 10
+
+
+def _to_float(values, column, errors):
+    """Conversion vectorisée; les lignes non numériques deviennent NaN et sont signalées."""
+    arr = np.asarray(values, dtype=object)
+    try:
+        return arr.astype(np.float64)
+    except (TypeError, ValueError):
+        pass
+    out = np.full(len(arr), np.nan)
+    for i, v in enumerate(arr):
+        try:
+            out[i] = float(v)
+        except (TypeError, ValueError):
+            errors.append(f"Ligne {i + 1}: {column} non numérique ({v!r})")
+    return out
+
+
+def empty_nodes():
+    return {"id": np.empty(0, dtype=object), "demand": np.empty(0),
+            "x": np.empty(0), "y": np.empty(0)}
+
+
+def empty_arcs():
+    arcs = {"source": np.empty(0, dtype=object), "target": np.empty(0, dtype=object)}
+    arcs.update({c: np.empty(0) for c in NUMERIC_ARC_COLUMNS})
+    return arcs
+
+
+def _read_csv_columns(path, required):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader, [])]
+        rows = [row for row in reader if any(c.strip() for c in row)]
+    missing = [c for c in required if c not in header]
+    if missing:
+        raise ValueError(f"{path}: colonnes manquantes {', '.join(missing)}")
+    bad = [i + 1 for i, row in enumerate(rows) if len(row) != len(header)]
+    if bad:
+        raise ValueError(f"{path}: nombre de cellules incorrect (lignes "
+                         f"{', '.join(map(str, bad[:MAX_REPORTED]))}"
+                         f"{', ...' if len(bad) > MAX_REPORTED else ''})")
+    columns = list(zip(*rows)) if rows else [()] * len(header)
+    return {h: np.asarray(col, dtype=object) for h, col in zip(header, columns)}
+
+
+def csv_kind(path):
+    """"nodes" ou "arcs" selon l'en-tête du fichier CSV."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = {h.strip() for h in next(csv.reader(f), [])}
+    if {"source", "target"} <= header:
+        return "arcs"
+    if "id" in header:
+        return "nodes"
+    raise ValueError(f"{path}: en-tête CSV non reconnu")
+
+
+def load_nodes_csv(path):
+    cols = _read_csv_columns(path, NODE_COLUMNS)
+    errors = []
+    n = len(cols["id"])
+    nodes = {
+        "id": np.char.strip(cols["id"].astype(str)).astype(object),
+        "demand": _to_float(cols["demand"], "demand", errors),
+        "x": _to_float(cols["x"], "x", errors) if "x" in cols else np.full(n, np.nan),
+        "y": _to_float(cols["y"], "y", errors) if "y" in cols else np.full(n, np.nan),
+    }
+    if errors:
+        raise ValueError(_format_errors(path, errors))
+    return nodes
+
+
+def load_arcs_csv(path):
+    cols = _read_csv_columns(path, ARC_COLUMNS)
+    errors = []
+    arcs = {c: np.char.strip(cols[c].astype(str)).astype(object) for c in ("source", "target")}
+    arcs.update({c: _to_float(cols[c], c, errors) for c in NUMERIC_ARC_COLUMNS})
+    if errors:
+        raise ValueError(_format_errors(path, errors))
+    return arcs
+
+
+def load_geojson(path):
+    """Retourne (nœuds, arcs) d'une FeatureCollection GeoJSON."""
+    with open(path, encoding="utf-8") as f:
+        features = json.load(f).get("features", [])
+    points = [ft for ft in features if (ft.get("geometry") or {}).get("type") == "Point"]
+    lines = [ft for ft in features if (ft.get("geometry") or {}).get("type") == "LineString"]
+
+    errors = []
+    coords = np.array([p["geometry"]["coordinates"][:2] for p in points], dtype=np.float64)
+    coords = coords.reshape(-1, 2)
+    nodes = {
+        "id": np.array([str(p.get("properties", {}).get("id", "")).strip() for p in points],
+                       dtype=object),
+        "demand": _to_float([p.get("properties", {}).get("demand", 0) for p in points],
+                            "demand", errors),
+        "x": coords[:, 0],
+        "y": coords[:, 1],
+    }
+
+    # Extrémités des lignes rattachées aux Points par coordonnées exactes
+    at = {tuple(c): node_id for c, node_id in zip(coords.tolist(), nodes["id"])}
+
+    def endpoint(props, key, coord):
+        if props.get(key) not in (None, ""):
+            return str(props[key]).strip()
+        return at.get(tuple(coord[:2]), "")
+
+    props = [ft.get("properties", {}) for ft in lines]
+    geometry = [ft["geometry"]["coordinates"] for ft in lines]
+    arcs = {
+        "source": np.array([endpoint(p, "source", g[0]) for p, g in zip(props, geometry)],
+                           dtype=object),
+        "target": np.array([endpoint(p, "target", g[-1]) for p, g in zip(props, geometry)],
+                           dtype=object),
+    }
+    arcs.update({c: _to_float([p.get(c) for p in props], c, errors) for c in NUMERIC_ARC_COLUMNS})
+    if errors:
+        raise ValueError(_format_errors(path, errors))
+    return nodes, arcs
+
+
+def validate_network(nodes, arcs):
+    """Vérification vectorisée; lève ValueError avec les lignes fautives."""
+    errors = []
+
+    ids = nodes["id"].astype(str)
+    uniq, counts = np.unique(ids, return_counts=True)
+    for node_id in uniq[counts > 1][:MAX_REPORTED]:
+        rows = np.flatnonzero(ids == node_id) + 1
+        errors.append(f"Nœud '{node_id}' dupliqué (lignes {', '.join(map(str, rows))})")
+    empty = np.flatnonzero(ids == "")
+    errors.extend(f"Nœud ligne {i + 1}: identifiant vide" for i in empty[:MAX_REPORTED])
+    bad_demand = np.flatnonzero(np.isnan(nodes["demand"]))
+    errors.extend(f"Nœud ligne {i + 1}: demande manquante" for i in bad_demand[:MAX_REPORTED])
+
+    for column in ("source", "target"):
+        ends = arcs[column].astype(str)
+        unknown = np.flatnonzero(~np.isin(ends, uniq))
+        errors.extend(f"Arc ligne {i + 1}: nœud {column} inconnu '{ends[i]}'"
+                      for i in unknown[:MAX_REPORTED])
+        if len(unknown) > MAX_REPORTED:
+            errors.append(f"... {len(unknown) - MAX_REPORTED} autres arcs au nœud {column} inconnu")
+
+    for column in NUMERIC_ARC_COLUMNS:
+        bad = np.flatnonzero(np.isnan(arcs[column]))
+        errors.extend(f"Arc ligne {i + 1}: {column} manquant" for i in bad[:MAX_REPORTED])
+
+    keys = np.char.add(np.char.add(arcs["source"].astype(str), "\x00"), arcs["target"].astype(str))
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    dup_rows = np.flatnonzero(counts[inverse] > 1)
+    errors.extend(f"Arc ligne {i + 1}: arc {arcs['source'][i]} -> {arcs['target'][i]} dupliqué"
+                  for i in dup_rows[:MAX_REPORTED])
+    if len(dup_rows) > MAX_REPORTED:
+        errors.append(f"... {len(dup_rows) - MAX_REPORTED} autres arcs dupliqués")
+
+    if errors:
+        raise ValueError("\n".join(errors))
+
+
+def _format_errors(path, errors):
+    shown = errors[:MAX_REPORTED]
+    if len(errors) > MAX_REPORTED:
+        shown.append(f"... {len(errors) - MAX_REPORTED} autres erreurs")
+    return f"{path}:\n" + "\n".join(shown)
+
+
+def nodes_to_records(nodes):
+    """Liste de dicts {'id', 'demand'[, 'x', 'y']} pour le solveur et le tracé."""
+    records = [{"id": i, "demand": d} for i, d in zip(nodes["id"].tolist(), nodes["demand"].tolist())]
+    has_xy = ~(np.isnan(nodes["x"]) | np.isnan(nodes["y"]))
+    for idx in np.flatnonzero(has_xy).tolist():
+        records[idx]["x"] = float(nodes["x"][idx])
+        records[idx]["y"] = float(nodes["y"][idx])
+    return records
+
+
+def arcs_to_records(arcs):
+    columns = [arcs[c].tolist() for c in ARC_COLUMNS]
+    return [dict(zip(ARC_COLUMNS, row)) for row in zip(*columns)]
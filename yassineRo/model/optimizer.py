@@ -1,103 +1,356 @@
 import gurobipy as gp
 from gurobipy import GRB
 
+from model.network import (
+    index_arcs,
+    arc_attr,
+    add_flow_balance,
+    build_results,
+    empty_results,
+    set_mip_start,
+    set_solve_options,
+    solve_status,
+    add_bound_info,
+)
+from model.benders import solve_benders
+from model.heuristic import solve_slope_scaling
+from model.colgen import solve_column_generation
+from model.local_search import solve_local_search
+from model.scenarios import solve_scenarios
+from model.multiperiod import solve_multi_period
+from model.survivable import solve_survivable
+from model.presolve import presolve as presolve_network, postsolve
+from model.precheck import check_feasibility
+from model.sensitivity import design_sensitivity, what_if
+from model.cutsets import CutSetSeparator, strong_link_bounds
+
+FORMULATIONS = ("aggregated", "multicommodity")
+
 
 class TransportOptimizer:
     def __init__(self):
         self.model = None
+        self._stop_requested = False
+
+    def cancel(self):
+        """
+        Demande l'arrêt de la résolution en cours (appelable depuis un autre
+        thread); solve() retourne alors la meilleure conception trouvée.
+        """
+        self._stop_requested = True
+
+    def reset_cancel(self):
+        """Efface une demande d'arrêt restante: appelé à la création d'un lancement."""
+        self._stop_requested = False
 
-    def solve(self, nodes_data, arcs_data):
+    def solve(self, nodes_data, arcs_data, method="mip", start=None, formulation="aggregated",
+              time_limit=None, mip_gap=None, node_limit=None, on_incumbent=None,
+              presolve=True, precheck=True, sensitivity=True, cut_sets=False):
         """
         nodes_data: list of dicts {'id': 'A', 'demand': -10} (Neg=Demand, Pos=Supply)
         arcs_data: list of dicts {'source': 'A', 'target': 'B', 'fixed_cost': 100, 'var_cost': 2, 'capacity': 50}
+        method: "mip" (modèle monolithique), "benders" (décomposition de Benders)
+                ou "heuristic" (slope scaling, borne supérieure rapide + "lower_bound";
+                time_limit, 1 s par défaut)
+                ou "column_generation" (chemins par commodité, price-and-branch,
+                "bound" et "mip_gap" estimés; voir model.colgen)
+                ou "local_search" (ouverture/fermeture/échange multi-départs, voir
+                model.local_search; time_limit par départ, 5 s par défaut)
+        start: dict de résultats (ex: issu de method="heuristic") utilisé comme MIP start
+        formulation: "aggregated" (flux agrégé) ou "multicommodity" (flux désagrégé
+                     par destination, relaxation LP plus forte) pour method="mip"
+        time_limit, mip_gap, node_limit: limites de résolution (secondes, écart relatif, nœuds)
+        on_incumbent: callable(results) appelé à chaque amélioration de la meilleure
+                      conception (statut "Incumbent")
+        presolve: retire les arcs dominés ou inutilisables et gère les arcs
+                  parallèles (voir model.presolve); le rapport est dans results["presolve"]
+        precheck: teste l'équilibre offre/demande et un flot maximum sur tous les
+                  arcs avant le MILP (voir model.precheck); en cas d'échec, statut
+                  "Infeasible" et coupe minimale dans results["infeasibility"]
+        sensitivity: fixe la conception trouvée et résout le LP de flot pour
+                     ajouter "node_potentials" et "reduced_costs" (voir model.sensitivity)
+        cut_sets: branch-and-cut pour method="mip": renforce les liaisons x <= M y
+                  et sépare des coupes cut-set à chaque nœud (voir model.cutsets)
+
+        Si la résolution s'arrête sur une limite ou via cancel(), la meilleure
+        conception trouvée est retournée avec le statut "Time Limit", "Node Limit"
+        ou "Cancelled"; "bound" et "mip_gap" donnent la qualité garantie.
+        Un cancel() fait avant l'appel (entre la création d'un worker et
+        solve()) ou pendant le precheck / présolve retourne "Cancelled" sans
+        lancer la résolution; la demande est effacée au retour de solve().
         """
         try:
-            # Création du modèle
-            m = gp.Model("Transport_Network_Design")
-
-            # Variables
-            # x[i,j]: Flux continu sur l'arc (i,j)
-            # y[i,j]: Variable binaire (1 si l'arc est construit, 0 sinon)
-            x = {}
-            y = {}
+            if precheck:
+                infeasibility = check_feasibility(nodes_data, arcs_data)
+                if infeasibility is not None:
+                    results = empty_results("Infeasible")
+                    results["infeasibility"] = infeasibility
+                    return results
 
-            arcs_indices = []
+            report = None
+            if presolve:
+                nodes_data, arcs_data, report = presolve_network(nodes_data, arcs_data)
+                if on_incumbent:
+                    user_callback = on_incumbent
+                    on_incumbent = lambda results: user_callback(postsolve(results, report))
 
-            for arc in arcs_data:
-                u = arc["source"]
-                v = arc["target"]
-                arcs_indices.append((u, v))
+            results = self._solve(nodes_data, arcs_data, method, start, formulation,
+                                  time_limit, mip_gap, node_limit, on_incumbent, cut_sets)
+            if sensitivity and results["built_arcs"]:
+                results.update(design_sensitivity(nodes_data, arcs_data, results) or {})
+            return postsolve(results, report) if report is not None else results
+        finally:
+            # La demande d'arrêt ne vaut que pour ce lancement
+            self._stop_requested = False
 
-                # Variable de décision de construction (Binaire)
-                y[u, v] = m.addVar(vtype=GRB.BINARY, name=f"build_{u}_{v}")
+    def _solve(self, nodes_data, arcs_data, method, start, formulation,
+               time_limit, mip_gap, node_limit, on_incumbent, cut_sets=False):
+        stop_flag = lambda: self._stop_requested
+        if stop_flag():
+            return empty_results("Cancelled")
+        try:
+            if method == "benders":
+                return solve_benders(
+                    nodes_data, arcs_data, start=start, time_limit=time_limit,
+                    mip_gap=mip_gap, node_limit=node_limit, stop_flag=stop_flag,
+                    on_incumbent=on_incumbent,
+                )
+            if method == "heuristic":
+                return solve_slope_scaling(nodes_data, arcs_data,
+                                           time_limit=time_limit if time_limit else 1.0)
+            if method == "local_search":
+                return solve_local_search(nodes_data, arcs_data,
+                                          time_limit=time_limit if time_limit else 5.0)
+            if method == "column_generation":
+                return solve_column_generation(nodes_data, arcs_data, time_limit=time_limit,
+                                               mip_gap=mip_gap)
+            if method != "mip":
+                raise ValueError(f"Méthode inconnue: {method}")
 
-                # Variable de flux (Continue)
-                x[u, v] = m.addVar(vtype=GRB.CONTINUOUS, lb=0, name=f"flow_{u}_{v}")
+            m, arcs, y, x = self._build_model(nodes_data, arcs_data, formulation)
 
-            # Fonction Objectif : Minimiser (Coûts Fixes * y) + (Coûts Variables * x)
-            m.setObjective(
-                gp.quicksum(
-                    arc["fixed_cost"] * y[arc["source"], arc["target"]]
-                    for arc in arcs_data
-                )
-                + gp.quicksum(
-                    arc["var_cost"] * x[arc["source"], arc["target"]]
-                    for arc in arcs_data
-                ),
-                GRB.MINIMIZE,
-            )
-
-            # Contraintes
-
-            # 1. Conservation du flux pour chaque nœud
-            # Somme(flux_sortant) - Somme(flux_entrant) = Supply/Demand du noeud
-            node_map = {n["id"]: n["demand"] for n in nodes_data}
-
-            for node_id, demand in node_map.items():
-                m.addConstr(
-                    gp.quicksum(x[node_id, v] for u, v in arcs_indices if u == node_id)
-                    - gp.quicksum(
-                        x[u, node_id] for u, v in arcs_indices if v == node_id
-                    )
-                    == demand,
-                    name=f"flow_bal_{node_id}",
-                )
+            if start:
+                set_mip_start(start, y, x)
+            set_solve_options(m, time_limit, mip_gap, node_limit)
+            separator = self._add_cut_sets(m, nodes_data, arcs_data, y, x) if cut_sets else None
 
-            # 2. Capacité et Liaison (Linking Constraints)
-            # Flux <= Capacité * y (Si y=0, flux=0. Si y=1, flux <= Capacité)
-            for arc in arcs_data:
-                u, v = arc["source"], arc["target"]
-                cap = arc["capacity"]
-                m.addConstr(x[u, v] <= cap * y[u, v], name=f"cap_{u}_{v}")
-
-            # Résolution
-            m.optimize()
-
-            if m.status == GRB.OPTIMAL:
-                result_arcs = []
-                for arc in arcs_data:
-                    u, v = arc["source"], arc["target"]
-                    if y[u, v].X > 0.5:  # Si construit
-                        result_arcs.append(
-                            {
-                                "source": u,
-                                "target": v,
-                                "flow": x[u, v].X,
-                                "capacity": arc["capacity"],
-                                "fixed_cost": arc["fixed_cost"],
-                            }
-                        )
-                return {
-                    "status": "Optimal",
-                    "obj_val": m.objVal,
-                    "built_arcs": result_arcs,
-                }
-            else:
-                return {
-                    "status": "Infeasible/Unbounded",
-                    "obj_val": 0,
-                    "built_arcs": [],
-                }
+            if stop_flag():
+                return empty_results("Cancelled")
+            return self._run_mip(m, arcs, arcs_data, y, x, on_incumbent, separator)
 
         except gp.GurobiError as e:
-            return {"status": f"Error: {e}", "obj_val": 0, "built_arcs": []}
+            return empty_results(f"Error: {e}")
+
+    def _run_mip(self, m, arcs, arcs_data, y, x, on_incumbent=None, separator=None):
+        """
+        Résout le MILP construit (arrêt via cancel(), incumbents via on_incumbent,
+        coupes cut-set si separator) et retourne le dict de résultats.
+        """
+        y_list = [y[a] for a in arcs]
+        x_list = [x[a] for a in arcs]
+
+        def callback(model, where):
+            if self._stop_requested:
+                model.terminate()
+            elif where == GRB.Callback.MIPSOL and on_incumbent:
+                # Gurobi n'appelle MIPSOL que pour une nouvelle meilleure solution
+                on_incumbent(build_results(
+                    "Incumbent",
+                    model.cbGet(GRB.Callback.MIPSOL_OBJ),
+                    arcs_data,
+                    dict(zip(arcs, model.cbGetSolution(y_list))),
+                    dict(zip(arcs, model.cbGetSolution(x_list))),
+                ))
+            elif (
+                where == GRB.Callback.MIPNODE
+                and separator is not None
+                and model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL
+                and model.cbGet(GRB.Callback.MIPNODE_NODCNT) == 0
+            ):
+                # Coupes globales séparées à la racine, à chaque passe de coupes
+                y_rel = dict(zip(arcs, model.cbGetNodeRel(y_list)))
+                for coeffs, rhs in separator.separate(y_rel):
+                    model.cbCut(gp.quicksum(c * y[a] for a, c in coeffs.items()) >= rhs)
+
+        # Résolution
+        m.optimize(callback)
+
+        status = solve_status(m)
+        if m.SolCount > 0:
+            return add_bound_info(build_results(
+                status,
+                m.objVal,
+                arcs_data,
+                dict(zip(arcs, m.getAttr("X", y_list))),
+                dict(zip(arcs, m.getAttr("X", x_list))),
+            ), m)
+        results = empty_results(status)
+        if m.status == GRB.INFEASIBLE:
+            # Après le precheck (flot maximum), seules des contraintes annexes
+            # peuvent rendre le modèle infaisable: l'IIS les isole
+            m.computeIIS()
+            results["iis"] = [c.ConstrName for c in m.getConstrs() if c.IISConstr]
+        return results
+
+    def solve_scenarios(self, nodes_data, arcs_data, demands, mode="independent",
+                        probabilities=None, max_workers=None):
+        """
+        Résout plusieurs scénarios de demande sur le même ensemble d'arcs.
+        mode: "independent" (un MILP par scénario, pool de processus) ou
+              "two_stage" (conception y partagée, flux par scénario).
+        Voir model.scenarios.solve_scenarios pour le format du résultat.
+        """
+        return solve_scenarios(nodes_data, arcs_data, demands, mode=mode,
+                               probabilities=probabilities, max_workers=max_workers)
+
+    def solve_multi_period(self, nodes_data, arcs_data, demands, window=None, step=1,
+                           discount_rate=0.0, time_limit=None, mip_gap=None):
+        """
+        Planification des constructions sur plusieurs périodes (demands: un dict
+        {node_id: demand} par période); un arc construit reste disponible.
+        window: taille de l'horizon glissant (None = modèle complet).
+        Voir model.multiperiod.solve_multi_period pour le format du résultat.
+        """
+        return solve_multi_period(nodes_data, arcs_data, demands, window=window, step=step,
+                                  discount_rate=discount_rate, time_limit=time_limit,
+                                  mip_gap=mip_gap)
+
+    def solve_survivable(self, nodes_data, arcs_data, time_limit=None, mip_gap=None,
+                         max_workers=4):
+        """
+        Conception qui reste réalisable après la panne de n'importe quel arc
+        construit; les scénarios de panne sont ajoutés à la demande.
+        Voir model.survivable.solve_survivable pour le format du résultat.
+        """
+        return solve_survivable(nodes_data, arcs_data, time_limit=time_limit,
+                                mip_gap=mip_gap, max_workers=max_workers)
+
+    def what_if(self, nodes_data, arcs_data, results, perturbations):
+        """
+        Coût de la conception de `results` sous des variations de demande
+        (liste de dicts {node_id: delta}), sans nouvelle conception: seul le
+        LP de flot est réoptimisé. Voir model.sensitivity.what_if.
+        """
+        return what_if(nodes_data, arcs_data, results, perturbations)
+
+    def lp_bounds(self, nodes_data, arcs_data):
+        """
+        Valeur de la relaxation LP de chaque formulation, ex:
+        {"aggregated": 1300.0, "multicommodity": 1850.0}. None si le LP est infaisable.
+        """
+        bounds = {}
+        for formulation in FORMULATIONS:
+            m, _, _, _ = self._build_model(nodes_data, arcs_data, formulation)
+            m.update()
+            relaxed = m.relax()
+            relaxed.Params.OutputFlag = 0
+            relaxed.optimize()
+            bounds[formulation] = relaxed.ObjVal if relaxed.status == GRB.OPTIMAL else None
+        return bounds
+
+    def _build_model(self, nodes_data, arcs_data, formulation="aggregated"):
+        """
+        Construit le MILP de conception de réseau; retourne (m, arcs, y, x).
+        Les contraintes de conservation et de capacité restent accessibles par
+        nœud et par arc: m._bal[node_id], m._cap[(u, v)].
+        """
+        if formulation not in FORMULATIONS:
+            raise ValueError(f"Formulation inconnue: {formulation}")
+
+        # Création du modèle
+        m = gp.Model("Transport_Network_Design")
+        self.model = m
+
+        # Index des arcs: listes sortantes/entrantes construites une seule fois
+        arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+        fixed_cost = arc_attr(arcs_data, "fixed_cost")
+        var_cost = arc_attr(arcs_data, "var_cost")
+        capacity = arc_attr(arcs_data, "capacity")
+
+        # Variables
+        # x[i,j]: Flux continu sur l'arc (i,j)
+        # y[i,j]: Variable binaire (1 si l'arc est construit, 0 sinon)
+        y = m.addVars(
+            arcs, vtype=GRB.BINARY, name=[f"build_{u}_{v}" for u, v in arcs]
+        )
+        x = m.addVars(
+            arcs, lb=0, vtype=GRB.CONTINUOUS, name=[f"flow_{u}_{v}" for u, v in arcs]
+        )
+
+        # Fonction Objectif : Minimiser (Coûts Fixes * y) + (Coûts Variables * x)
+        m.setObjective(y.prod(fixed_cost) + x.prod(var_cost), GRB.MINIMIZE)
+
+        # Contraintes
+
+        # 1. Conservation du flux pour chaque nœud
+        # Somme(flux_sortant) - Somme(flux_entrant) = Supply/Demand du noeud
+        node_map = {n["id"]: n["demand"] for n in nodes_data}
+
+        m._bal = add_flow_balance(m, x, node_map, out_arcs, in_arcs)
+
+        # 2. Capacité et Liaison (Linking Constraints)
+        # Flux <= Capacité * y (Si y=0, flux=0. Si y=1, flux <= Capacité)
+        m._cap = m.addConstrs((x[a] <= capacity[a] * y[a] for a in arcs), name="cap")
+
+        if formulation == "multicommodity":
+            self._add_commodity_flows(m, node_map, arcs, out_arcs, in_arcs, capacity, y, x)
+
+        return m, arcs, y, x
+
+    @staticmethod
+    def _add_cut_sets(m, nodes_data, arcs_data, y, x):
+        """
+        Branch-and-cut: ajoute les liaisons renforcées x[a] <= M_a * y[a] et
+        retourne le séparateur de coupes cut-set utilisé dans le callback MIPNODE.
+        """
+        arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+        capacity = arc_attr(arcs_data, "capacity")
+        node_map = {n["id"]: n["demand"] for n in nodes_data}
+
+        bounds = strong_link_bounds(node_map, arcs, out_arcs, in_arcs, capacity)
+        m.addConstrs((x[a] <= bound * y[a] for a, bound in bounds.items()), name="strong_link")
+        # Les coupes utilisateur sont exprimées sur le modèle d'origine
+        m.Params.PreCrush = 1
+        return CutSetSeparator(node_map, arcs, out_arcs, in_arcs, capacity)
+
+    @staticmethod
+    def _add_commodity_flows(m, node_map, arcs, out_arcs, in_arcs, capacity, y, x):
+        """
+        Désagrégation par destination: une commodité k par nœud de demande,
+        de volume d_k. Les offres sont réparties librement entre commodités
+        (w[s,k]) et x[a] = somme des flux par commodité. Les inégalités fortes
+        x[a,k] <= min(d_k, u_a) * y[a] resserrent la relaxation LP.
+        """
+        dests = {n: -d for n, d in node_map.items() if d < 0}
+        supplies = [n for n, d in node_map.items() if d > 0]
+
+        xk = m.addVars(arcs, list(dests), lb=0, name="flow_k")
+        w = m.addVars(supplies, list(dests), lb=0, name="supply_k")
+
+        # Répartition de chaque offre entre les commodités
+        m.addConstrs(
+            (w.sum(s, "*") == node_map[s] for s in supplies), name="supply_split"
+        )
+
+        # Conservation du flux par commodité
+        for k, d_k in dests.items():
+            for node_id in node_map:
+                expr = gp.LinExpr([1.0] * len(out_arcs.get(node_id, ())),
+                                  [xk[a + (k,)] for a in out_arcs.get(node_id, ())])
+                expr.addTerms([-1.0] * len(in_arcs.get(node_id, ())),
+                              [xk[a + (k,)] for a in in_arcs.get(node_id, ())])
+                if node_id == k:
+                    expr.addConstant(d_k)
+                if node_map[node_id] > 0:
+                    expr.addTerms(-1.0, w[node_id, k])
+                m.addConstr(expr == 0, name=f"comm_bal_{node_id}_{k}")
+
+        # Liaison flux agrégé / flux par commodité
+        m.addConstrs((x[a] == xk.sum(*a, "*") for a in arcs), name="flow_sum")
+
+        # Inégalités de liaison fortes
+        m.addConstrs(
+            (xk[a + (k,)] <= min(d_k, capacity[a]) * y[a]
+             for a in arcs for k, d_k in dests.items()),
+            name="strong_cap",
+        )
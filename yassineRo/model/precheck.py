@@ -0,0 +1,91 @@
+"""
+Test de réalisabilité rapide avant le MILP de conception de réseau.
+
+Si tous les arcs candidats étaient construits, le réseau devrait pouvoir
+acheminer toutes les offres vers toutes les demandes. On vérifie donc:
+  1. l'équilibre offre/demande (contraintes de conservation en égalité);
+  2. un flot maximum super-source -> super-puits sur tous les arcs à pleine
+     capacité. S'il est inférieur à la demande totale, la coupe minimale
+     explique l'infaisabilité: arcs saturés de la coupe, demandes non
+     servies et offres bloquées.
+"""
+import networkx as nx
+from networkx.algorithms.flow import preflow_push
+
+_SOURCE = ("__super_source__",)
+_SINK = ("__super_sink__",)
+
+
+def check_feasibility(nodes_data, arcs_data, tol=1e-6):
+    """
+    Retourne None si le réseau complet est réalisable (ou si le test ne
+    s'applique pas: nœuds référencés par des arcs mais non déclarés, sans
+    contrainte de conservation), sinon un dict décrivant l'infaisabilité:
+
+        {"reason": "imbalance" | "capacity", "total_supply", "total_demand",
+         "max_flow", "cut_arcs": [(u, v)], "unserved_nodes": {node: manque},
+         "stranded_supply": {node: excédent}}
+    """
+    declared = {n["id"]: n["demand"] for n in nodes_data}
+    if any(a["source"] not in declared or a["target"] not in declared for a in arcs_data):
+        return None
+
+    total_supply = sum(d for d in declared.values() if d > 0)
+    total_demand = -sum(d for d in declared.values() if d < 0)
+    report = {
+        "total_supply": total_supply,
+        "total_demand": total_demand,
+        "max_flow": None,
+        "cut_arcs": [],
+        "unserved_nodes": {},
+        "stranded_supply": {},
+    }
+    if abs(total_supply - total_demand) > tol:
+        report["reason"] = "imbalance"
+        return report
+
+    G = nx.DiGraph()
+    G.add_nodes_from([_SOURCE, _SINK])
+    for arc in arcs_data:
+        u, v = arc["source"], arc["target"]
+        if G.has_edge(u, v):
+            G[u][v]["capacity"] += arc["capacity"]
+        else:
+            G.add_edge(u, v, capacity=arc["capacity"])
+    for node_id, demand in declared.items():
+        if demand > 0:
+            G.add_edge(_SOURCE, node_id, capacity=demand)
+        elif demand < 0:
+            G.add_edge(node_id, _SINK, capacity=-demand)
+
+    R = preflow_push(G, _SOURCE, _SINK)
+    max_flow = R.graph["flow_value"]
+    if max_flow >= total_demand - tol:
+        return None
+
+    # Côté source de la coupe minimale: nœuds atteignables dans le résiduel
+    reachable = {_SOURCE}
+    stack = [_SOURCE]
+    while stack:
+        u = stack.pop()
+        for v, attr in R[u].items():
+            if v not in reachable and attr["flow"] < attr["capacity"] - tol:
+                reachable.add(v)
+                stack.append(v)
+
+    report["reason"] = "capacity"
+    report["max_flow"] = max_flow
+    report["cut_arcs"] = [
+        (a["source"], a["target"]) for a in arcs_data
+        if a["source"] in reachable and a["target"] not in reachable
+    ]
+    for node_id, demand in declared.items():
+        if demand < 0:
+            missing = -demand - R[node_id][_SINK]["flow"]
+            if missing > tol:
+                report["unserved_nodes"][node_id] = missing
+        elif demand > 0:
+            excess = demand - R[_SOURCE][node_id]["flow"]
+            if excess > tol:
+                report["stranded_supply"][node_id] = excess
+    return report
@@ -0,0 +1,154 @@
+"""
+Présolve des données de conception de réseau, avant la construction du modèle.
+
+1. Arcs dominés: parmi des arcs parallèles (même source et cible), un arc dont
+   coût fixe et coût variable sont >= à ceux d'un autre est retiré si cet
+   autre arc couvre seul le flux maximal de la paire, min(offre totale,
+   somme des capacités de la paire); sinon les deux restent (étape 3).
+2. Arcs inutilisables: un arc dont la source n'est atteignable depuis aucun
+   nœud d'offre, ou dont la cible ne mène à aucun nœud de demande, ne peut
+   porter de flux utile et est retiré.
+3. Arcs parallèles restants: les variables x/y étant indexées par (source,
+   cible), chaque arc parallèle supplémentaire est remplacé par deux arcs via
+   un nœud virtuel de demande nulle (u -> "u->v#k" -> v). postsolve() replie
+   ensuite les résultats sur les arcs d'origine.
+
+Un nœud référencé par un arc mais absent de nodes_data n'a pas de contrainte
+de conservation: il est traité à la fois comme source et puits.
+"""
+from collections import deque
+
+
+def _reachable(starts, adjacency):
+    seen = set(starts)
+    queue = deque(starts)
+    while queue:
+        node = queue.popleft()
+        for nxt in adjacency.get(node, ()):
+            if nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+    return seen
+
+
+def _dominates(a, b, pair_flow):
+    """a remplace b: coûts au plus égaux et capacité suffisante pour tout le flux de la paire."""
+    return (
+        a["fixed_cost"] <= b["fixed_cost"]
+        and a["var_cost"] <= b["var_cost"]
+        and a["capacity"] >= pair_flow
+    )
+
+
+def presolve(nodes_data, arcs_data):
+    """
+    Retourne (nodes_data, arcs_data, report) réduits. report contient les
+    listes (source, target) des arcs retirés ("dominated", "unreachable",
+    "dead_end"), les arcs parallèles scindés ("split_parallel") et la
+    correspondance utilisée par postsolve().
+    """
+    report = {"dominated": [], "unreachable": [], "dead_end": [], "split_parallel": [], "split": {}}
+
+    declared = {n["id"]: n["demand"] for n in nodes_data}
+
+    # 1. Arcs dominés, par paire (source, cible)
+    groups = {}
+    for arc in arcs_data:
+        groups.setdefault((arc["source"], arc["target"]), []).append(arc)
+    # Un nœud non déclaré est une source libre: offre non bornée
+    undeclared = {a[k] for a in arcs_data for k in ("source", "target")} - set(declared)
+    total_supply = float("inf") if undeclared else sum(d for d in declared.values() if d > 0)
+    kept = []
+    for pair, group in groups.items():
+        pair_flow = min(total_supply, sum(a["capacity"] for a in group))
+        survivors = []
+        for arc in sorted(group, key=lambda a: (a["fixed_cost"], a["var_cost"], -a["capacity"])):
+            if any(_dominates(s, arc, pair_flow) for s in survivors):
+                report["dominated"].append(pair)
+            else:
+                survivors.append(arc)
+        kept.extend(survivors)
+
+    # 2. Atteignabilité depuis les offres et vers les demandes
+    free = {a[k] for a in kept for k in ("source", "target")} - set(declared)
+    forward, backward = {}, {}
+    for arc in kept:
+        forward.setdefault(arc["source"], []).append(arc["target"])
+        backward.setdefault(arc["target"], []).append(arc["source"])
+    from_supply = _reachable([n for n, d in declared.items() if d > 0] + list(free), forward)
+    to_demand = _reachable([n for n, d in declared.items() if d < 0] + list(free), backward)
+
+    useful = []
+    for arc in kept:
+        pair = (arc["source"], arc["target"])
+        if arc["source"] not in from_supply:
+            report["unreachable"].append(pair)
+        elif arc["target"] not in to_demand:
+            report["dead_end"].append(pair)
+        else:
+            useful.append(arc)
+
+    # 3. Arcs parallèles non dominés: scission via un nœud virtuel
+    nodes_out, arcs_out, report["split"] = split_parallel(nodes_data, useful)
+    report["split_parallel"] = [pair for pair in report["split"].values() if pair is not None]
+    return nodes_out, arcs_out, report
+
+
+def split_parallel(nodes_data, arcs_data):
+    """
+    Remplace chaque arc parallèle supplémentaire par deux arcs via un nœud
+    virtuel. Retourne (nodes_data, arcs_data, split): split associe chaque
+    arc créé à sa paire d'origine (None pour l'arc nœud virtuel -> cible).
+    """
+    nodes_out = list(nodes_data)
+    arcs_out = []
+    split = {}
+    seen = {}
+    for arc in arcs_data:
+        pair = (arc["source"], arc["target"])
+        k = seen.get(pair, 0)
+        seen[pair] = k + 1
+        if k == 0:
+            arcs_out.append(arc)
+            continue
+        virtual = f"{arc['source']}->{arc['target']}#{k}"
+        nodes_out.append({"id": virtual, "demand": 0})
+        arcs_out.append({**arc, "target": virtual})
+        arcs_out.append({"source": virtual, "target": arc["target"],
+                         "fixed_cost": 0, "var_cost": 0, "capacity": arc["capacity"]})
+        split[(arc["source"], virtual)] = pair
+        split[(virtual, arc["target"])] = None
+    return nodes_out, arcs_out, split
+
+
+def postsolve(results, report):
+    """Replie les arcs scindés sur leur paire d'origine et joint le rapport de présolve."""
+    results = fold_split(results, report["split"])
+    results["presolve"] = {k: v for k, v in report.items() if k != "split"}
+    return results
+
+
+def fold_split(results, split):
+    """Exprime des résultats calculés après split_parallel() sur les arcs d'origine."""
+    virtual = {pair[1] for pair, original in split.items() if original is not None}
+    results = dict(results)
+    if "built_arcs" in results:
+        built = []
+        for arc in results["built_arcs"]:
+            pair = (arc["source"], arc["target"])
+            if pair not in split:
+                built.append(arc)
+            elif split[pair] is not None:
+                built.append({**arc, "source": split[pair][0], "target": split[pair][1]})
+        results["built_arcs"] = built
+    # Sensibilité: les nœuds virtuels et leurs arcs n'existent pas pour l'utilisateur
+    if "node_potentials" in results:
+        results["node_potentials"] = {
+            n: p for n, p in results["node_potentials"].items() if n not in virtual
+        }
+    if "reduced_costs" in results:
+        results["reduced_costs"] = {
+            a: rc for a, rc in results["reduced_costs"].items()
+            if a[0] not in virtual and a[1] not in virtual
+        }
+    return results
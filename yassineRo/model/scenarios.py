@@ -0,0 +1,107 @@
+"""
+Conception de réseau sous incertitude de demande: un ensemble d'arcs et
+plusieurs vecteurs de demande (scénarios).
+
+Deux modes:
+  - "independent": chaque scénario est résolu séparément par
+    TransportOptimizer.solve, en parallèle dans un pool de processus;
+  - "two_stage": une seule conception y partagée, un flux par scénario,
+    minimisant coûts fixes + espérance des coûts variables (Benders
+    multi-coupes, sous-problèmes de scénario évalués en parallèle).
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import gurobipy as gp
+
+from model.benders import benders_design
+from model.network import build_results, empty_results
+
+MODES = ("independent", "two_stage")
+
+
+def _scenario_nodes(nodes_data, demand):
+    """nodes_data avec les demandes remplacées par celles du scénario."""
+    return [{"id": n["id"], "demand": demand.get(n["id"], 0)} for n in nodes_data]
+
+
+def _failed(status, mode, demands):
+    """Résultat sans conception: coût espéré nul, un résultat vide par scénario."""
+    return {
+        "status": status,
+        "mode": mode,
+        "expected_cost": 0,
+        "scenarios": [empty_results(status) for _ in demands],
+        "design": [],
+    }
+
+
+def _solve_independent(args):
+    # Import local: exécuté dans un processus du pool
+    from model.optimizer import TransportOptimizer
+
+    nodes_data, arcs_data = args
+    return TransportOptimizer().solve(nodes_data, arcs_data)
+
+
+def solve_scenarios(nodes_data, arcs_data, demands, mode="independent",
+                    probabilities=None, max_workers=None):
+    """
+    nodes_data: nœuds du réseau (les demandes sont ignorées)
+    arcs_data: arcs candidats, communs à tous les scénarios
+    demands: liste de dicts {node_id: demand}, un par scénario (nœud absent = 0)
+    mode: "independent" ou "two_stage"
+    probabilities: poids des scénarios (défaut: équiprobables)
+
+    Retourne:
+        {"status", "mode", "expected_cost",    # 0 si un scénario n'est pas optimal
+         "scenarios": [dict de résultats par scénario (flux du scénario)],
+         "design": [(source, target), ...]}   # design: mode "two_stage" seulement
+    """
+    if mode not in MODES:
+        raise ValueError(f"Mode inconnu: {mode}")
+    if not demands:
+        raise ValueError("Aucun scénario de demande")
+    if probabilities is None:
+        probabilities = [1.0 / len(demands)] * len(demands)
+    if len(probabilities) != len(demands):
+        raise ValueError("Une probabilité par scénario est requise")
+
+    scenario_nodes = [_scenario_nodes(nodes_data, d) for d in demands]
+
+    if mode == "independent":
+        with ProcessPoolExecutor(max_workers) as pool:
+            results = list(pool.map(_solve_independent,
+                                    [(nodes, arcs_data) for nodes in scenario_nodes]))
+        solved = all(r["status"] == "Optimal" for r in results)
+        return {
+            "status": "Optimal" if solved else "Infeasible/Unbounded",
+            "mode": mode,
+            "expected_cost": (sum(p * r["obj_val"] for p, r in zip(probabilities, results))
+                              if solved else 0),
+            "scenarios": results,
+        }
+
+    node_maps = [{n["id"]: n["demand"] for n in nodes} for nodes in scenario_nodes]
+    try:
+        master, y_vals, scenario_flows = benders_design(arcs_data, node_maps, probabilities,
+                                              max_workers=max_workers)
+    except (ValueError, gp.GurobiError) as e:
+        # Pas de présolve ici (les arcs utiles dépendent du scénario): des arcs
+        # parallèles font échouer index_arcs
+        return _failed(f"Error: {e}", mode, demands)
+    if y_vals is None:
+        return _failed("Infeasible/Unbounded", mode, demands)
+
+    fixed = sum(a["fixed_cost"] for a in arcs_data
+                if y_vals.get((a["source"], a["target"]), 0) > 0.5)
+    results = [
+        build_results("Optimal", fixed + flow_cost, arcs_data, y_vals, flows)
+        for flow_cost, flows in scenario_flows
+    ]
+    return {
+        "status": "Optimal",
+        "mode": mode,
+        "expected_cost": master.ObjVal,
+        "scenarios": results,
+        "design": [a for a, v in y_vals.items() if v > 0.5],
+    }
@@ -0,0 +1,120 @@
+"""
+Analyse de sensibilité d'une conception: les arcs construits y sont fixés et
+seul le LP de flot à coût minimum est résolu (voir benders._FlowSubproblem).
+
+  - potentiel d'un nœud: coût marginal d'une unité de demande supplémentaire
+    au nœud, soit -π du dual de flow_bal_{nœud}. Les lignes de conservation
+    étant liées, les potentiels sont définis à une constante près: seules les
+    différences entre nœuds ont un sens;
+  - coût réduit d'un arc (u, v): c_uv + p_u - p_v. Négatif sur un arc fermé,
+    il indique l'économie par unité que permettrait son ouverture.
+
+Les arcs parallèles sont scindés comme dans le présolve
+(presolve.split_parallel): les données brutes passées à solve() sont
+acceptées, et les résultats sont repliés sur les arcs d'origine.
+
+what_if() réoptimise ce LP pour de nombreuses variations de demande en ne
+modifiant que les seconds membres: la base optimale reste duale réalisable
+et le simplexe dual repart de la résolution précédente.
+"""
+from gurobipy import GRB
+
+from model.benders import _FlowSubproblem
+from model.network import index_arcs, arc_attr, build_results, empty_results
+from model.presolve import split_parallel, fold_split
+
+
+def _design_flows(arcs_data, split, built_arcs):
+    """
+    Flux de chaque arc construit sur le réseau scindé: un arc de built_arcs
+    (paire d'origine) est associé à un arc de même paire, coût fixe et
+    capacité, le moins cher en coût variable d'abord; l'arc nœud virtuel ->
+    cible porte le même flux que son arc d'entrée.
+    """
+    candidates = {}
+    for arc in sorted(arcs_data, key=lambda a: a["var_cost"]):
+        a = (arc["source"], arc["target"])
+        pair = split.get(a, a)
+        if pair is not None:
+            candidates.setdefault((pair, arc["fixed_cost"], arc["capacity"]), []).append(a)
+    flows = {}
+    for arc in built_arcs:
+        pair = (arc["source"], arc["target"])
+        matches = candidates.get((pair, arc["fixed_cost"], arc["capacity"]))
+        if not matches:
+            raise ValueError(f"Arc construit {pair} absent des données d'arcs")
+        a = matches.pop(0)
+        flows[a] = arc["flow"]
+        if a in split:
+            flows[(a[1], pair[1])] = arc["flow"]
+    return flows
+
+
+def _fixed_design_lp(nodes_data, arcs_data, results):
+    """
+    LP de flot pour la conception de `results`, démarré depuis ses flux.
+    Retourne (sub, y_vals, arcs_data scindés, split).
+    """
+    nodes_data, arcs_data, split = split_parallel(nodes_data, arcs_data)
+    arcs, out_arcs, in_arcs = index_arcs(arcs_data)
+    node_map = {n["id"]: n["demand"] for n in nodes_data}
+    sub = _FlowSubproblem(node_map, arcs, out_arcs, in_arcs,
+                          arc_attr(arcs_data, "var_cost"), arc_attr(arcs_data, "capacity"))
+    flows = _design_flows(arcs_data, split, results["built_arcs"])
+    y_vals = {a: 1.0 if a in flows else 0.0 for a in arcs}
+    for a in arcs:
+        sub.x[a].PStart = flows.get(a, 0.0)
+    return sub, y_vals, arcs_data, split
+
+
+def _duals(sub, var_cost):
+    potentials = {n: -c.Pi for n, c in sub.bal.items()}
+    reduced_costs = {
+        (u, v): var_cost[u, v] + potentials.get(u, 0.0) - potentials.get(v, 0.0)
+        for u, v in sub.arcs
+    }
+    return potentials, reduced_costs
+
+
+def design_sensitivity(nodes_data, arcs_data, results):
+    """
+    Potentiels des nœuds et coûts réduits des arcs pour la conception de
+    `results` (dict retourné par TransportOptimizer.solve).
+
+    Retourne {"node_potentials": {nœud: p}, "reduced_costs": {(u, v): rc}},
+    ou None si le LP de flot de cette conception n'est pas optimal.
+    """
+    sub, y_vals, arcs_data, split = _fixed_design_lp(nodes_data, arcs_data, results)
+    if sub.solve(y_vals) != GRB.OPTIMAL:
+        return None
+    potentials, reduced_costs = _duals(sub, arc_attr(arcs_data, "var_cost"))
+    return fold_split({"node_potentials": potentials, "reduced_costs": reduced_costs}, split)
+
+
+def what_if(nodes_data, arcs_data, results, perturbations):
+    """
+    Réoptimise le flux de la conception de `results` pour chaque variation de
+    demande de `perturbations` (liste de dicts {node_id: delta}, ajouté à la
+    demande du nœud; une variation doit rester équilibrée).
+
+    Retourne un dict de résultats par variation (statut "Optimal" ou
+    "Infeasible", coût total conception fixée, flux, node_potentials).
+    """
+    sub, y_vals, arcs_data, split = _fixed_design_lp(nodes_data, arcs_data, results)
+    sub.solve(y_vals)
+    var_cost = arc_attr(arcs_data, "var_cost")
+    fixed = sum(a["fixed_cost"] for a in results["built_arcs"])
+
+    outcomes = []
+    for delta in perturbations:
+        for node_id, constr in sub.bal.items():
+            constr.RHS = sub.node_map[node_id] + delta.get(node_id, 0)
+        sub.model.optimize()
+        if sub.model.status != GRB.OPTIMAL:
+            outcomes.append(empty_results("Infeasible"))
+            continue
+        outcome = build_results("Optimal", fixed + sub.model.ObjVal, arcs_data,
+                                y_vals, sub.flows())
+        outcome["node_potentials"], _ = _duals(sub, var_cost)
+        outcomes.append(fold_split(outcome, split))
+    return outcomes
@@ -0,0 +1,196 @@
+"""
+Session d'édition incrémentale du modèle de conception de réseau.
+
+Le MILP (formulation agrégée) est construit une seule fois puis modifié sur
+place à chaque édition:
+  - coût fixe / variable d'un arc: coefficient objectif de y / x;
+  - capacité d'un arc: coefficient de y dans sa ligne cap;
+  - demande d'un nœud: second membre de flow_bal_{nœud};
+  - ajout / suppression d'un arc: colonnes x, y et ligne cap;
+  - ajout / suppression d'un nœud: ligne flow_bal_{nœud}.
+Chaque résolution repart de la meilleure conception précédente (MIP start).
+
+Les arcs parallèles ne sont pas gérés ici (pas de présolve): utiliser
+TransportOptimizer.solve pour ces réseaux.
+"""
+import gurobipy as gp
+from gurobipy import GRB
+
+from model.network import empty_results, set_mip_start, set_solve_options
+from model.optimizer import TransportOptimizer
+from model.precheck import check_feasibility
+from model.sensitivity import design_sensitivity
+
+ARC_ATTRS = ("fixed_cost", "var_cost", "capacity")
+
+
+class DesignSession:
+    def __init__(self, nodes_data, arcs_data):
+        self.nodes = {n["id"]: n["demand"] for n in nodes_data}
+        self.arcs = {}
+        for arc in arcs_data:
+            pair = (arc["source"], arc["target"])
+            if pair in self.arcs:
+                raise ValueError(f"Arc parallèle {pair[0]} -> {pair[1]}: non géré par la session")
+            self.arcs[pair] = dict(arc)
+        self.results = None
+
+        self.optimizer = TransportOptimizer()
+        m, _, y, x = self.optimizer._build_model(nodes_data, list(self.arcs.values()))
+        m.update()
+        self.model = m
+        self.y = dict(y)
+        self.x = dict(x)
+        self.bal = dict(m._bal)
+        self.cap = dict(m._cap)
+
+    def cancel(self):
+        self.optimizer.cancel()
+
+    def reset_cancel(self):
+        self.optimizer.reset_cancel()
+
+    @property
+    def nodes_data(self):
+        return [{"id": n, "demand": d} for n, d in self.nodes.items()]
+
+    @property
+    def arcs_data(self):
+        return list(self.arcs.values())
+
+    # ------------------------------------------------------------------ #
+    #  Éditions
+    # ------------------------------------------------------------------ #
+    def set_demand(self, node_id, demand):
+        if node_id not in self.nodes:
+            self.add_node(node_id, demand)
+            return
+        self.nodes[node_id] = demand
+        self.bal[node_id].RHS = demand
+
+    def add_node(self, node_id, demand):
+        if node_id in self.nodes:
+            raise ValueError(f"Nœud {node_id} déjà présent")
+        expr = gp.LinExpr()
+        for (u, v), x in self.x.items():
+            if u == node_id:
+                expr.addTerms(1.0, x)
+            if v == node_id:
+                expr.addTerms(-1.0, x)
+        self.nodes[node_id] = demand
+        self.bal[node_id] = self.model.addConstr(expr == demand, name=f"flow_bal_{node_id}")
+
+    def remove_node(self, node_id):
+        """Retire la conservation du nœud; ses arcs éventuels restent candidats."""
+        self.model.remove(self.bal.pop(node_id))
+        del self.nodes[node_id]
+
+    def set_arc(self, source, target, **attrs):
+        """Modifie fixed_cost, var_cost et/ou capacity d'un arc existant."""
+        pair = (source, target)
+        arc = self.arcs[pair]
+        if "fixed_cost" in attrs:
+            self.y[pair].Obj = attrs["fixed_cost"]
+        if "var_cost" in attrs:
+            self.x[pair].Obj = attrs["var_cost"]
+        if "capacity" in attrs:
+            # Ligne cap: x - capacité * y <= 0
+            self.model.chgCoeff(self.cap[pair], self.y[pair], -attrs["capacity"])
+        arc.update({k: attrs[k] for k in ARC_ATTRS if k in attrs})
+
+    def add_arc(self, arc):
+        u, v = pair = (arc["source"], arc["target"])
+        if pair in self.arcs:
+            raise ValueError(f"Arc parallèle {u} -> {v}: non géré par la session")
+        col = gp.Column()
+        if u in self.bal:
+            col.addTerms(1.0, self.bal[u])
+        if v in self.bal:
+            col.addTerms(-1.0, self.bal[v])
+        m = self.model
+        self.x[pair] = m.addVar(lb=0, obj=arc["var_cost"], column=col, name=f"flow_{u}_{v}")
+        self.y[pair] = m.addVar(vtype=GRB.BINARY, obj=arc["fixed_cost"], name=f"build_{u}_{v}")
+        self.cap[pair] = m.addConstr(self.x[pair] <= arc["capacity"] * self.y[pair],
+                                     name=f"cap[{u},{v}]")
+        self.arcs[pair] = dict(arc)
+
+    def remove_arc(self, source, target):
+        pair = (source, target)
+        self.model.remove([self.x.pop(pair), self.y.pop(pair), self.cap.pop(pair)])
+        del self.arcs[pair]
+
+    def sync(self, nodes_data, arcs_data):
+        """
+        Aligne la session sur des données complètes (ex: tables de l'interface)
+        en n'appliquant que les différences. Retourne le nombre d'éditions.
+        """
+        edits = 0
+        nodes = {n["id"]: n["demand"] for n in nodes_data}
+        for node_id in [n for n in self.nodes if n not in nodes]:
+            self.remove_node(node_id)
+            edits += 1
+        for node_id, demand in nodes.items():
+            if self.nodes.get(node_id) != demand:
+                self.set_demand(node_id, demand)
+                edits += 1
+
+        arcs = {}
+        for arc in arcs_data:
+            pair = (arc["source"], arc["target"])
+            if pair in arcs:
+                raise ValueError(f"Arc parallèle {pair[0]} -> {pair[1]}: non géré par la session")
+            arcs[pair] = arc
+        for pair in [p for p in self.arcs if p not in arcs]:
+            self.remove_arc(*pair)
+            edits += 1
+        for pair, arc in arcs.items():
+            if pair not in self.arcs:
+                self.add_arc(arc)
+                edits += 1
+                continue
+            changed = {k: arc[k] for k in ARC_ATTRS if self.arcs[pair][k] != arc[k]}
+            if changed:
+                self.set_arc(*pair, **changed)
+                edits += 1
+        return edits
+
+    # ------------------------------------------------------------------ #
+    #  Résolution
+    # ------------------------------------------------------------------ #
+    def solve(self, time_limit=None, mip_gap=None, node_limit=None, on_incumbent=None,
+              sensitivity=True):
+        """
+        Résout le modèle courant, démarré depuis la conception précédente.
+        Même dict de résultats que TransportOptimizer.solve; comme lui, honore
+        un cancel() fait avant l'appel et l'efface au retour.
+        """
+        try:
+            nodes_data, arcs_data = self.nodes_data, self.arcs_data
+            infeasibility = check_feasibility(nodes_data, arcs_data)
+            if infeasibility is not None:
+                results = empty_results("Infeasible")
+                results["infeasibility"] = infeasibility
+                return results
+
+            m = self.model
+            # Les limites de la résolution précédente ne s'appliquent plus
+            m.resetParams()
+            set_solve_options(m, time_limit, mip_gap, node_limit)
+            if self.results and self.results["built_arcs"]:
+                set_mip_start(self.results, self.y)
+
+            if self.optimizer._stop_requested:
+                return empty_results("Cancelled")
+            try:
+                results = self.optimizer._run_mip(m, list(self.arcs), arcs_data,
+                                                  self.y, self.x, on_incumbent)
+            except gp.GurobiError as e:
+                return empty_results(f"Error: {e}")
+
+            if results["built_arcs"]:
+                self.results = results
+                if sensitivity:
+                    results.update(design_sensitivity(nodes_data, arcs_data, results) or {})
+            return results
+        finally:
+            self.optimizer._stop_requested = False
@@ -0,0 +1,138 @@
+"""
+Conception de réseau survivable: la demande doit rester servie lorsque
+n'importe quel arc construit tombe en panne.
+
+La conception y est partagée; le flux nominal x porte le coût variable et
+chaque scénario de panne e ajoute une copie de flux x^e (sans l'arc e) qui ne
+doit qu'être réalisable:
+
+    min  Σ_a f_a y_a + Σ_a c_a x_a
+    s.c. conservation de x et de chaque x^e,  x <= u y,  x^e <= u y,  x^e_e = 0
+
+Les scénarios sont générés à la demande: après chaque résolution du maître,
+les pannes des arcs construits sont testées en parallèle (LP de flot, un
+environnement Gurobi par thread) et seules les pannes non couvertes ajoutent
+leur copie de flux au maître, qui est résolu de nouveau.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import gurobipy as gp
+from gurobipy import GRB
+
+from model.benders import _FlowSubproblem
+from model.network import (
+    index_arcs,
+    arc_attr,
+    add_flow_balance,
+    build_results,
+    empty_results,
+    set_solve_options,
+    solve_status,
+    add_bound_info,
+)
+from model.precheck import check_feasibility
+
+
+def _add_failure_copy(m, node_map, arcs, out_arcs, in_arcs, capacity, y, failed):
+    """Copie de flux du scénario où l'arc `failed` est hors service."""
+    u, v = failed
+    xe = m.addVars(arcs, lb=0, name=f"flow_fail[{u},{v}]")
+    xe[failed].UB = 0.0
+    add_flow_balance(m, xe, node_map, out_arcs, in_arcs, name=f"fail_bal[{u},{v}]")
+    m.addConstrs((xe[a] <= capacity[a] * y[a] for a in arcs if a != failed),
+                 name=f"fail_cap[{u},{v}]")
+
+
+def solve_survivable(nodes_data, arcs_data, time_limit=None, mip_gap=None,
+                     max_workers=4, max_rounds=100):
+    """
+    time_limit: limite globale en secondes (toutes les résolutions du maître)
+    mip_gap: écart relatif de chaque résolution du maître
+    max_workers: threads de vérification des pannes
+
+    Retourne le dict de TransportOptimizer.solve (flux nominal) complété par
+    "failure_scenarios" (arcs dont la panne a été ajoutée au maître) et
+    "rounds". Arrêté avant couverture de toutes les pannes: statut "Time Limit"
+    ou "Round Limit" et "uncovered_failures" (pannes non couvertes connues).
+    Si aucune conception n'est survivable, statut "Infeasible" et
+    "critical_arcs": arcs dont la panne rend le réseau complet infaisable.
+    """
+    started = time.time()
+    # Import local: model.optimizer importe ce module
+    from model.optimizer import TransportOptimizer
+
+    optimizer = TransportOptimizer()
+    m, arcs, y, x = optimizer._build_model(nodes_data, arcs_data)
+    m.Params.OutputFlag = 0
+    _, out_arcs, in_arcs = index_arcs(arcs_data)
+    var_cost = arc_attr(arcs_data, "var_cost")
+    capacity = arc_attr(arcs_data, "capacity")
+    node_map = {n["id"]: n["demand"] for n in nodes_data}
+
+    # Un LP de flot par thread, chacun dans son propre environnement
+    envs = [gp.Env(params={"OutputFlag": 0}) for _ in range(max_workers)]
+    subs = [_FlowSubproblem(node_map, arcs, out_arcs, in_arcs, var_cost, capacity, env=env)
+            for env in envs]
+
+    def uncovered(sub, failures, y_vals):
+        violated = []
+        for e in failures:
+            if sub.solve({**y_vals, e: 0.0}) != GRB.OPTIMAL:
+                violated.append(e)
+        return violated
+
+    scenarios = []
+    violated = []
+    last = None
+    rounds = 0
+    try:
+        with ThreadPoolExecutor(max_workers) as pool:
+            while True:
+                remaining = None if time_limit is None else time_limit - (time.time() - started)
+                if remaining is not None and remaining <= 0:
+                    break
+                rounds += 1
+                set_solve_options(m, remaining, mip_gap)
+                m.optimize()
+                if m.SolCount == 0:
+                    break
+
+                y_vals = {a: round(y[a].X) for a in arcs}
+                last = add_bound_info(build_results(
+                    solve_status(m), m.ObjVal, arcs_data, y_vals, {a: x[a].X for a in arcs}
+                ), m)
+                built = [a for a in arcs if y_vals[a] > 0.5 and a not in scenarios]
+                chunks = [built[i::max_workers] for i in range(max_workers)]
+                violated = [
+                    e for part in pool.map(uncovered, subs, chunks, [y_vals] * max_workers)
+                    for e in part
+                ]
+                if not violated or rounds >= max_rounds:
+                    break
+                for e in violated:
+                    _add_failure_copy(m, node_map, arcs, out_arcs, in_arcs, capacity, y, e)
+                scenarios.extend(violated)
+    finally:
+        for env in envs:
+            env.dispose()
+
+    if m.SolCount == 0 and m.status == GRB.INFEASIBLE:
+        results = empty_results("Infeasible")
+        results["critical_arcs"] = [
+            e for e in scenarios
+            if check_feasibility(
+                nodes_data, [a for a in arcs_data if (a["source"], a["target"]) != e]
+            ) is not None
+        ]
+    elif last is None:
+        results = empty_results(solve_status(m))
+    else:
+        results = last
+        if violated or m.SolCount == 0 or results["status"] != "Optimal":
+            # Arrêt sur time_limit ou max_rounds: pannes pas toutes couvertes
+            results["status"] = "Time Limit" if rounds < max_rounds else "Round Limit"
+            results["uncovered_failures"] = violated
+    results["failure_scenarios"] = scenarios
+    results["rounds"] = rounds
+    return results
@@ -0,0 +1,186 @@
+"""
+Tests de non-régression des moteurs de conception de réseau: chaque moteur
+est comparé à l'optimum du MIP monolithique sur une petite instance.
+
+Exécuter: python -m pytest tests/test_engines.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from model.optimizer import TransportOptimizer
+from model.precheck import check_feasibility
+from model.session import DesignSession
+
+
+# Deux offres, un hub et deux demandes: liaisons directes ou via le hub
+NODES = [
+    {"id": "S1", "demand": 15},
+    {"id": "S2", "demand": 10},
+    {"id": "H", "demand": 0},
+    {"id": "D1", "demand": -12},
+    {"id": "D2", "demand": -13},
+]
+ARCS = [
+    {"source": "S1", "target": "H", "fixed_cost": 50, "var_cost": 1, "capacity": 30},
+    {"source": "S2", "target": "H", "fixed_cost": 40, "var_cost": 1, "capacity": 30},
+    {"source": "H", "target": "D1", "fixed_cost": 30, "var_cost": 2, "capacity": 30},
+    {"source": "H", "target": "D2", "fixed_cost": 30, "var_cost": 2, "capacity": 30},
+    {"source": "S1", "target": "D1", "fixed_cost": 80, "var_cost": 1, "capacity": 15},
+    {"source": "S2", "target": "D2", "fixed_cost": 70, "var_cost": 1, "capacity": 15},
+    {"source": "S1", "target": "D2", "fixed_cost": 100, "var_cost": 1, "capacity": 10},
+]
+DEMAND = {n["id"]: n["demand"] for n in NODES}
+TOL = 1e-6
+
+
+@pytest.fixture(scope="module")
+def optimum():
+    results = TransportOptimizer().solve(NODES, ARCS)
+    assert results["status"] == "Optimal"
+    return results
+
+
+def _check_design(results, nodes=NODES):
+    """Flux conservés et dans les capacités, coût annoncé égal au coût de la conception."""
+    var_cost = {(a["source"], a["target"]): a["var_cost"] for a in ARCS}
+    balance = {n["id"]: 0.0 for n in nodes}
+    cost = 0.0
+    for arc in results["built_arcs"]:
+        assert -TOL <= arc["flow"] <= arc["capacity"] + TOL
+        balance[arc["source"]] += arc["flow"]
+        balance[arc["target"]] -= arc["flow"]
+        cost += arc["fixed_cost"] + var_cost[arc["source"], arc["target"]] * arc["flow"]
+    for n in nodes:
+        assert balance[n["id"]] == pytest.approx(n["demand"], abs=TOL)
+    assert results["obj_val"] == pytest.approx(cost)
+
+
+def test_mip_optimum(optimum):
+    _check_design(optimum)
+    assert optimum["obj_val"] == pytest.approx(225.0)
+
+
+@pytest.mark.parametrize("options", [
+    {"method": "benders"},
+    {"formulation": "multicommodity"},
+    {"cut_sets": True},
+    {"presolve": False, "precheck": False},
+])
+def test_exact_engines_match_mip(optimum, options):
+    results = TransportOptimizer().solve(NODES, ARCS, **options)
+    assert results["status"] == "Optimal"
+    assert results["obj_val"] == pytest.approx(optimum["obj_val"])
+    _check_design(results)
+
+
+def test_lp_bounds_below_optimum(optimum):
+    bounds = TransportOptimizer().lp_bounds(NODES, ARCS)
+    assert bounds["aggregated"] <= bounds["multicommodity"] + TOL
+    assert bounds["multicommodity"] <= optimum["obj_val"] + TOL
+
+
+def test_slope_scaling(optimum):
+    results = TransportOptimizer().solve(NODES, ARCS, method="heuristic")
+    assert results["status"] == "Heuristic"
+    _check_design(results)
+    assert results["lower_bound"] <= optimum["obj_val"] + TOL
+    assert results["obj_val"] == pytest.approx(optimum["obj_val"])
+
+
+def test_column_generation(optimum):
+    results = TransportOptimizer().solve(NODES, ARCS, method="column_generation")
+    _check_design(results)
+    assert results["bound"] <= optimum["obj_val"] + TOL
+    assert results["obj_val"] == pytest.approx(optimum["obj_val"])
+
+
+def test_local_search(optimum):
+    results = TransportOptimizer().solve(NODES, ARCS, method="local_search", time_limit=1.0)
+    assert results["status"] == "Heuristic"
+    _check_design(results)
+    assert results["obj_val"] == pytest.approx(optimum["obj_val"])
+
+
+def test_heuristic_as_mip_start(optimum):
+    optimizer = TransportOptimizer()
+    start = optimizer.solve(NODES, ARCS, method="heuristic")
+    results = optimizer.solve(NODES, ARCS, start=start)
+    assert results["obj_val"] == pytest.approx(optimum["obj_val"])
+
+
+def test_what_if_without_change_keeps_cost(optimum):
+    (outcome,) = TransportOptimizer().what_if(NODES, ARCS, optimum, [{}])
+    assert outcome["status"] == "Optimal"
+    assert outcome["obj_val"] == pytest.approx(optimum["obj_val"])
+
+
+def test_session_matches_mip_after_edit(optimum):
+    session = DesignSession(NODES, ARCS)
+    assert session.solve()["obj_val"] == pytest.approx(optimum["obj_val"])
+
+    session.set_demand("S1", 20)
+    session.set_demand("D1", -17)
+    edited = [{"id": n, "demand": d} for n, d in {**DEMAND, "S1": 20, "D1": -17}.items()]
+    fresh = TransportOptimizer().solve(edited, ARCS)
+    results = session.solve()
+    assert results["status"] == "Optimal"
+    assert results["obj_val"] == pytest.approx(fresh["obj_val"])
+    _check_design(results, edited)
+
+
+def test_scenarios_independent_match_per_scenario_mip():
+    low = {**DEMAND, "S1": 10, "D1": -7}
+    results = TransportOptimizer().solve_scenarios(NODES, ARCS, [DEMAND, low], max_workers=2)
+    expected = [
+        TransportOptimizer().solve([{"id": n, "demand": d} for n, d in demand.items()], ARCS)
+        for demand in (DEMAND, low)
+    ]
+    assert results["status"] == "Optimal"
+    for got, want in zip(results["scenarios"], expected):
+        assert got["obj_val"] == pytest.approx(want["obj_val"])
+    assert results["expected_cost"] == pytest.approx(
+        sum(r["obj_val"] for r in expected) / 2)
+
+
+def test_scenarios_two_stage(optimum):
+    optimizer = TransportOptimizer()
+    same = optimizer.solve_scenarios(NODES, ARCS, [DEMAND, DEMAND], mode="two_stage")
+    assert same["expected_cost"] == pytest.approx(optimum["obj_val"])
+
+    low = {**DEMAND, "S1": 10, "D1": -7}
+    shared = optimizer.solve_scenarios(NODES, ARCS, [DEMAND, low], mode="two_stage")
+    separate = optimizer.solve_scenarios(NODES, ARCS, [DEMAND, low], max_workers=2)
+    assert shared["status"] == "Optimal"
+    # Une conception commune ne peut faire mieux qu'une conception par scénario
+    assert shared["expected_cost"] >= separate["expected_cost"] - TOL
+    for scenario in shared["scenarios"]:
+        assert {(a["source"], a["target"]) for a in scenario["built_arcs"]} <= set(shared["design"])
+
+
+def test_multi_period(optimum):
+    optimizer = TransportOptimizer()
+    single = optimizer.solve_multi_period(NODES, ARCS, [DEMAND])
+    assert single["status"] == "Optimal"
+    assert single["obj_val"] == pytest.approx(optimum["obj_val"])
+
+    full = optimizer.solve_multi_period(NODES, ARCS, [DEMAND, DEMAND])
+    rolling = optimizer.solve_multi_period(NODES, ARCS, [DEMAND, DEMAND], window=1)
+    # Garder la conception optimale d'une période reste réalisable sur deux
+    fixed = sum(a["fixed_cost"] for a in optimum["built_arcs"])
+    assert full["obj_val"] <= 2 * optimum["obj_val"] - fixed + TOL
+    assert rolling["status"] == "Rolling Horizon"
+    assert rolling["obj_val"] >= full["obj_val"] - TOL
+
+
+def test_survivable_design_survives_each_failure(optimum):
+    results = TransportOptimizer().solve_survivable(NODES, ARCS, max_workers=2)
+    assert results["status"] == "Optimal"
+    assert results["obj_val"] >= optimum["obj_val"] - TOL
+    built = results["built_arcs"]
+    for failed in built:
+        remaining = [a for a in built if a is not failed]
+        assert check_feasibility(NODES, remaining) is None
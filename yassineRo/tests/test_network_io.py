@@ -0,0 +1,53 @@
+"""
+Tests de l'import CSV du réseau (model.network_io).
+
+Exécuter: python -m pytest tests/test_network_io.py -v
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from model.network_io import load_arcs_csv, load_nodes_csv
+
+
+ARCS_HEADER = "source,target,fixed_cost,var_cost,capacity\n"
+
+
+def _write(content):
+    f = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8")
+    f.write(content)
+    f.close()
+    return f.name
+
+
+def test_trailing_blank_lines_ignored():
+    path = _write(ARCS_HEADER + "A,B,10,1,50\nB,C,5,2,30\n\n\n")
+    try:
+        arcs = load_arcs_csv(path)
+    finally:
+        os.unlink(path)
+    assert arcs["source"].tolist() == ["A", "B"]
+    assert arcs["capacity"].tolist() == [50.0, 30.0]
+
+
+def test_only_blank_rows_gives_empty_table():
+    path = _write("id,demand\n\n")
+    try:
+        nodes = load_nodes_csv(path)
+    finally:
+        os.unlink(path)
+    assert len(nodes["id"]) == 0
+
+
+@pytest.mark.parametrize("row", ["B,C,5,2", "B,C,5,2,30,99"])
+def test_wrong_cell_count_reports_row(row):
+    path = _write(ARCS_HEADER + "A,B,10,1,50\n" + row + "\n")
+    try:
+        with pytest.raises(ValueError, match=r"nombre de cellules incorrect \(lignes 2\)"):
+            load_arcs_csv(path)
+    finally:
+        os.unlink(path)
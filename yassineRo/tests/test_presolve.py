@@ -0,0 +1,49 @@
+"""
+Tests du présolve (model.presolve) sur des arcs parallèles.
+
+Exécuter: python -m pytest tests/test_presolve.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from model.optimizer import TransportOptimizer
+from model.presolve import presolve
+
+
+NODES = [{"id": "A", "demand": 20}, {"id": "B", "demand": -20}]
+
+
+# Deux arcs A -> B de capacité 10: le second, plus cher, est nécessaire
+PARALLEL_ARCS = [
+    {"source": "A", "target": "B", "fixed_cost": 100, "var_cost": 0.5, "capacity": 10},
+    {"source": "A", "target": "B", "fixed_cost": 100, "var_cost": 1, "capacity": 10},
+]
+
+
+def test_parallel_arc_needed_for_capacity_is_kept():
+    arcs = PARALLEL_ARCS
+    _, _, report = presolve(NODES, arcs)
+    assert report["dominated"] == []
+    assert report["split_parallel"] == [("A", "B")]
+
+    results = TransportOptimizer().solve(NODES, arcs)
+    assert results["status"] == "Optimal"
+    assert results["obj_val"] == pytest.approx(215.0)
+    assert sorted(a["flow"] for a in results["built_arcs"]) == pytest.approx([10.0, 10.0])
+
+
+def test_parallel_arc_dominated_when_other_covers_pair_flow():
+    arcs = [
+        {"source": "A", "target": "B", "fixed_cost": 100, "var_cost": 0.5, "capacity": 20},
+        {"source": "A", "target": "B", "fixed_cost": 100, "var_cost": 1, "capacity": 10},
+    ]
+    _, arcs_out, report = presolve(NODES, arcs)
+    assert report["dominated"] == [("A", "B")]
+    assert arcs_out == [arcs[0]]
+
+    results = TransportOptimizer().solve(NODES, arcs)
+    assert results["obj_val"] == pytest.approx(110.0)
@@ -0,0 +1,44 @@
+"""
+Tests de la sensibilité d'une conception fixée (model.sensitivity).
+
+Exécuter: python -m pytest tests/test_sensitivity.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from model.optimizer import TransportOptimizer
+
+
+NODES = [{"id": "A", "demand": 20}, {"id": "B", "demand": -20}]
+
+# Arcs parallèles A -> B, tous deux nécessaires (scindés par le présolve)
+PARALLEL_ARCS = [
+    {"source": "A", "target": "B", "fixed_cost": 100, "var_cost": 0.5, "capacity": 10},
+    {"source": "A", "target": "B", "fixed_cost": 100, "var_cost": 1, "capacity": 10},
+]
+
+
+def test_what_if_accepts_parallel_arcs():
+    optimizer = TransportOptimizer()
+    results = optimizer.solve(NODES, PARALLEL_ARCS)
+    assert results["obj_val"] == pytest.approx(215.0)
+
+    same, lower, higher = optimizer.what_if(
+        NODES, PARALLEL_ARCS, results, [{}, {"A": -4, "B": 4}, {"A": 1, "B": -1}]
+    )
+    assert same["obj_val"] == pytest.approx(215.0)
+    # 4 unités de moins sur l'arc le plus cher
+    assert lower["obj_val"] == pytest.approx(211.0)
+    assert [(a["source"], a["target"]) for a in lower["built_arcs"]] == [("A", "B")] * 2
+    # Les deux arcs sont saturés: la conception fixée ne suffit plus
+    assert higher["status"] == "Infeasible"
+
+
+def test_sensitivity_hides_virtual_nodes():
+    results = TransportOptimizer().solve(NODES, PARALLEL_ARCS)
+    assert set(results["node_potentials"]) == {"A", "B"}
+    assert all("#" not in u + v for u, v in results["reduced_costs"])
@@ -4,8 +4,7 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QLabel,
     QMessageBox,
     QHeaderView,
@@ -16,10 +15,21 @@ from PyQt5.QtWidgets import (
     QProgressBar,
     QMenu,
     QAction,
+    QDoubleSpinBox,
+    QFileDialog,
 )
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint
 from PyQt5.QtGui import QFont, QIcon, QPixmap, QColor
 from ui.worker import OptimizationWorker
+from model.session import DesignSession
+from model.network_io import (
+    csv_kind,
+    load_nodes_csv,
+    load_arcs_csv,
+    load_geojson,
+    validate_network,
+)
+from ui.table_models import NodeTableModel, ArcTableModel
 from ui.visualization import NetworkCanvas
 
 
@@ -33,8 +43,19 @@ class MainWindow(QMainWindow):
 
         self.nodes_data = []
         self.arcs_data = []
+        self.current_nodes = []
+        self.current_arcs = []
+        self.worker = None
+        # Modèle conservé entre deux optimisations; tables relues seulement après édition
+        self.session = None
+        self.tables_dirty = True
 
         self.setup_ui()
+        for model in (self.node_model, self.arc_model):
+            model.dataChanged.connect(self.mark_tables_dirty)
+            model.rowsInserted.connect(self.mark_tables_dirty)
+            model.rowsRemoved.connect(self.mark_tables_dirty)
+            model.modelReset.connect(self.mark_tables_dirty)
 
     def setup_ui(self):
         central_widget = QWidget()
@@ -101,7 +122,8 @@ class MainWindow(QMainWindow):
         """)
         nodes_layout = QVBoxLayout(nodes_group)
 
-        self.node_table = self.create_modern_table(["Node ID", "Supply/Demand"])
+        self.node_model = NodeTableModel(self)
+        self.node_table = self.create_modern_table(self.node_model)
         self.node_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.node_table.customContextMenuRequested.connect(self.show_node_context_menu)
 
@@ -140,7 +162,8 @@ class MainWindow(QMainWindow):
         """)
         arcs_layout = QVBoxLayout(arcs_group)
 
-        self.arc_table = self.create_modern_table(["From", "To", "Fixed Cost", "Var Cost", "Capacity"])
+        self.arc_model = ArcTableModel(self)
+        self.arc_table = self.create_modern_table(self.arc_model)
         self.arc_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.arc_table.customContextMenuRequested.connect(self.show_arc_context_menu)
 
@@ -175,12 +198,41 @@ class MainWindow(QMainWindow):
         self.solve_btn.clicked.connect(self.run_optimization)
         self.solve_btn.setToolTip("Run optimization to find optimal network design")
 
+        self.cancel_btn = self.create_modern_button("Stop", "#9C27B0")
+        self.cancel_btn.clicked.connect(self.cancel_optimization)
+        self.cancel_btn.setToolTip("Stop the solver and keep the best design found so far")
+        self.cancel_btn.setEnabled(False)
+
+        self.import_btn = self.create_modern_button("Import Data", "#2196F3")
+        self.import_btn.clicked.connect(self.import_network)
+        self.import_btn.setToolTip("Load nodes and routes from CSV or GeoJSON files")
+
         self.clear_btn = self.create_modern_button("Clear Data", "#f44336")
         self.clear_btn.clicked.connect(self.clear_data)
         self.clear_btn.setToolTip("Clear all input data")
 
+        # Limites de résolution (0 = pas de limite)
+        self.time_limit_spin = QDoubleSpinBox()
+        self.time_limit_spin.setRange(0, 86400)
+        self.time_limit_spin.setSuffix(" s")
+        self.time_limit_spin.setSpecialValueText("No limit")
+        self.time_limit_spin.setToolTip("Solver time limit (0 = no limit)")
+
+        self.gap_spin = QDoubleSpinBox()
+        self.gap_spin.setRange(0, 100)
+        self.gap_spin.setDecimals(2)
+        self.gap_spin.setSuffix(" %")
+        self.gap_spin.setSpecialValueText("Default")
+        self.gap_spin.setToolTip("Target MIP gap (0 = Gurobi default)")
+
         control_layout.addWidget(self.solve_btn)
+        control_layout.addWidget(self.cancel_btn)
+        control_layout.addWidget(self.import_btn)
         control_layout.addWidget(self.clear_btn)
+        control_layout.addWidget(QLabel("Time limit:"))
+        control_layout.addWidget(self.time_limit_spin)
+        control_layout.addWidget(QLabel("Gap:"))
+        control_layout.addWidget(self.gap_spin)
         control_layout.addStretch()
 
         results_layout.addLayout(control_layout)
@@ -284,15 +336,14 @@ class MainWindow(QMainWindow):
 
         return results_widget
 
-    def create_modern_table(self, headers):
-        table = QTableWidget()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
+    def create_modern_table(self, model):
+        table = QTableView()
+        table.setModel(model)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setSelectionBehavior(QTableView.SelectRows)
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #555;
                 background-color: #2D2D2D;
                 color: #FFFFFF;
@@ -300,12 +351,12 @@ class MainWindow(QMainWindow):
                 border-radius: 8px;
                 selection-background-color: #2196F3;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border-bottom: 1px solid #444;
                 border-right: 1px solid #444;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: rgba(33, 150, 243, 0.3);
                 color: #FFFFFF;
             }
@@ -317,7 +368,7 @@ class MainWindow(QMainWindow):
                 font-weight: bold;
                 font-size: 12px;
             }
-            QTableWidget QTableCornerButton::section {
+            QTableView QTableCornerButton::section {
                 background-color: #424242;
                 border: 1px solid #555;
             }
@@ -426,29 +477,21 @@ class MainWindow(QMainWindow):
         menu.exec_(self.arc_table.mapToGlobal(position))
 
     def delete_selected_row(self, table):
-        current_row = table.currentRow()
+        current_row = table.currentIndex().row()
         if current_row >= 0:
             reply = QMessageBox.question(self, 'Delete Row',
                                        f'Are you sure you want to delete row {current_row + 1}?',
                                        QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                table.removeRow(current_row)
+                table.model().removeRows(current_row, 1)
                 self.status_label.setText(f"Row {current_row + 1} deleted")
         else:
             QMessageBox.information(self, "No Selection", "Please select a row to delete.")
 
     def edit_selected_row(self, table):
-        current_row = table.currentRow()
+        current_row = table.currentIndex().row()
         if current_row >= 0:
-            # Enable editing for the selected row
-            for col in range(table.columnCount()):
-                item = table.item(current_row, col)
-                if item:
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-                else:
-                    # Create item if it doesn't exist
-                    table.setItem(current_row, col, QTableWidgetItem(""))
-            table.editItem(table.item(current_row, 0))
+            table.edit(table.model().index(current_row, 0))
             self.status_label.setText(f"Editing row {current_row + 1}")
         else:
             QMessageBox.information(self, "No Selection", "Please select a row to edit.")
@@ -458,42 +501,25 @@ class MainWindow(QMainWindow):
                                    'Are you sure you want to clear all input data?',
                                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            self.node_table.setRowCount(0)
-            self.arc_table.setRowCount(0)
+            self.node_model.clear()
+            self.arc_model.clear()
             self.result_text.setText("Results will appear here after optimization...")
-            self.canvas.axes.clear()
+            self.canvas.reset()
             self.canvas.draw()
+            self.session = None
             self.status_label.setText("Data cleared")
 
     def add_node_row(self, id_val="", demand=""):
-        row = self.node_table.rowCount()
-        self.node_table.insertRow(row)
-        self.node_table.setItem(row, 0, QTableWidgetItem(str(id_val)))
-        self.node_table.setItem(row, 1, QTableWidgetItem(str(demand)))
+        self.node_model.append_row({"id": id_val, "demand": demand})
 
     def add_arc_row(self, src="", dst="", fixed="", var="", cap=""):
-        row = self.arc_table.rowCount()
-        self.arc_table.insertRow(row)
-        self.arc_table.setItem(row, 0, QTableWidgetItem(str(src)))
-        self.arc_table.setItem(row, 1, QTableWidgetItem(str(dst)))
-        self.arc_table.setItem(row, 2, QTableWidgetItem(str(fixed)))
-        self.arc_table.setItem(row, 3, QTableWidgetItem(str(var)))
-        self.arc_table.setItem(row, 4, QTableWidgetItem(str(cap)))
-
-    def add_node_row(self, id_val="", demand=""):
-        row = self.node_table.rowCount()
-        self.node_table.insertRow(row)
-        self.node_table.setItem(row, 0, QTableWidgetItem(str(id_val)))
-        self.node_table.setItem(row, 1, QTableWidgetItem(str(demand)))
-
-    def add_arc_row(self, src="", dst="", fixed="", var="", cap=""):
-        row = self.arc_table.rowCount()
-        self.arc_table.insertRow(row)
-        self.arc_table.setItem(row, 0, QTableWidgetItem(str(src)))
-        self.arc_table.setItem(row, 1, QTableWidgetItem(str(dst)))
-        self.arc_table.setItem(row, 2, QTableWidgetItem(str(fixed)))
-        self.arc_table.setItem(row, 3, QTableWidgetItem(str(var)))
-        self.arc_table.setItem(row, 4, QTableWidgetItem(str(cap)))
+        self.arc_model.append_row({
+            "source": src,
+            "target": dst,
+            "fixed_cost": fixed,
+            "var_cost": var,
+            "capacity": cap,
+        })
 
     def load_default_data(self):
         # More realistic default data
@@ -520,59 +546,101 @@ class MainWindow(QMainWindow):
             self.add_arc_row(*a)
 
     def get_data_from_ui(self):
-        nodes = []
-        for r in range(self.node_table.rowCount()):
-            try:
-                nid = self.node_table.item(r, 0).text()
-                dem = float(self.node_table.item(r, 1).text())
-                nodes.append({"id": nid, "demand": dem})
-            except:
-                pass
-
-        arcs = []
-        for r in range(self.arc_table.rowCount()):
-            try:
-                src = self.arc_table.item(r, 0).text()
-                dst = self.arc_table.item(r, 1).text()
-                fc = float(self.arc_table.item(r, 2).text())
-                vc = float(self.arc_table.item(r, 3).text())
-                cap = float(self.arc_table.item(r, 4).text())
-                arcs.append(
-                    {
-                        "source": src,
-                        "target": dst,
-                        "fixed_cost": fc,
-                        "var_cost": vc,
-                        "capacity": cap,
-                    }
-                )
-            except:
-                pass
-        return nodes, arcs
+        # Lignes incomplètes ignorées
+        return self.node_model.records(), self.arc_model.records()
+
+    def import_network(self):
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Import Network", "",
+            "Network files (*.csv *.geojson *.json);;CSV (*.csv);;GeoJSON (*.geojson *.json)",
+        )
+        if not paths:
+            return
+        # Un fichier absent (ex. CSV d'arcs seul) conserve le contenu de la table
+        nodes, arcs = None, None
+        try:
+            for path in paths:
+                if path.lower().endswith(".csv"):
+                    if csv_kind(path) == "nodes":
+                        nodes = load_nodes_csv(path)
+                    else:
+                        arcs = load_arcs_csv(path)
+                else:
+                    nodes, arcs = load_geojson(path)
+            if nodes is None:
+                nodes = self.node_model.valid_arrays()
+            if arcs is None:
+                arcs = self.arc_model.valid_arrays()
+            validate_network(nodes, arcs)
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+            QMessageBox.warning(self, "Import Error", str(e))
+            return
+
+        self.node_model.set_arrays(nodes)
+        self.arc_model.set_arrays(arcs)
+        self.session = None
+        self.status_label.setText(
+            f"Imported {len(nodes['id'])} nodes and {len(arcs['source'])} routes"
+        )
 
     def run_optimization(self):
         # Validate input data
-        if self.node_table.rowCount() == 0 or self.arc_table.rowCount() == 0:
+        if self.node_model.rowCount() == 0 or self.arc_model.rowCount() == 0:
             QMessageBox.warning(self, "Input Error", "Please add at least one node and one route before optimizing.")
             return
 
         self.solve_btn.setEnabled(False)
         self.clear_btn.setEnabled(False)
+        self.import_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.status_label.setText("Optimizing network...")
         self.status_label.setStyleSheet("QLabel { color: #FF9800; font-weight: bold; padding: 5px; }")
 
-        nodes, arcs = self.get_data_from_ui()
-
-        self.worker = OptimizationWorker(nodes, arcs)
+        if self.tables_dirty:
+            self.current_nodes, self.current_arcs = self.get_data_from_ui()
+            self.tables_dirty = False
+        nodes, arcs = self.current_nodes, self.current_arcs
+
+        pairs = {(a["source"], a["target"]) for a in arcs}
+        if len(pairs) != len(arcs):
+            # Arcs parallèles: résolution complète avec présolve
+            self.session = None
+        elif self.session is None:
+            self.session = DesignSession(nodes, arcs)
+
+        options = {}
+        if self.time_limit_spin.value() > 0:
+            options["time_limit"] = self.time_limit_spin.value()
+        if self.gap_spin.value() > 0:
+            options["mip_gap"] = self.gap_spin.value() / 100
+
+        self.worker = OptimizationWorker(nodes, arcs, session=self.session, **options)
         self.worker.finished.connect(self.on_optimization_finished)
+        self.worker.incumbent.connect(self.on_incumbent)
         self.worker.error.connect(self.on_optimization_error)
         self.worker.start()
+        self.cancel_btn.setEnabled(True)
+
+    def mark_tables_dirty(self, *args):
+        self.tables_dirty = True
+
+    def cancel_optimization(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Stopping optimization...")
+
+    def on_incumbent(self, results):
+        # Redessin progressif à chaque nouvelle meilleure conception
+        self.status_label.setText(f"New best design found: €{results['obj_val']:.2f}")
+        self.canvas.plot_solution(self.current_nodes, results, self.current_arcs)
 
     def on_optimization_finished(self, results):
         self.solve_btn.setEnabled(True)
         self.clear_btn.setEnabled(True)
+        self.import_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
 
         if results['status'] == 'Optimal':
@@ -592,6 +660,29 @@ class MainWindow(QMainWindow):
             </div>
         """
 
+        infeasibility = results.get('infeasibility')
+        if infeasibility:
+            txt += "<h4 style='color: #f44336;'>Infeasible Network:</h4><div style='background-color: #333; padding: 10px; border-radius: 5px; margin-bottom: 10px;'>"
+            if infeasibility['reason'] == 'imbalance':
+                txt += f"Total supply {infeasibility['total_supply']:.0f} ≠ total demand {infeasibility['total_demand']:.0f}"
+            else:
+                txt += f"Max flow {infeasibility['max_flow']:.0f} / demand {infeasibility['total_demand']:.0f} with every route built<br>"
+                cut = ", ".join(f"{u} → {v}" for u, v in infeasibility['cut_arcs']) or "none (no route)"
+                txt += f"<strong>Saturated routes:</strong> {cut}<br>"
+                unserved = ", ".join(f"{n} ({q:.0f})" for n, q in infeasibility['unserved_nodes'].items())
+                txt += f"<strong>Unserved demand:</strong> {unserved}"
+            txt += "</div>"
+
+        presolve = results.get('presolve')
+        if presolve and any(presolve.values()):
+            txt += (f"<div style='margin-bottom: 10px; color: #9E9E9E;'>Presolve: "
+                    f"{len(presolve['dominated'])} dominated, {len(presolve['unreachable'])} unreachable, "
+                    f"{len(presolve['dead_end'])} dead-end routes removed; "
+                    f"{len(presolve['split_parallel'])} parallel routes split</div>")
+
+        if results.get('built_arcs') and 'mip_gap' in results:
+            txt += f"<div style='margin-bottom: 10px;'><strong>Lower Bound:</strong> €{results['bound']:.2f} &nbsp; <strong>Gap:</strong> {results['mip_gap'] * 100:.2f}%</div>"
+
         if results.get('built_arcs'):
             txt += "<h4 style='color: #FF9800;'>Built Routes:</h4><div style='background-color: #333; padding: 10px; border-radius: 5px; margin-bottom: 10px;'>"
             for arc in results['built_arcs']:
@@ -604,8 +695,7 @@ class MainWindow(QMainWindow):
 
         self.result_text.setText(txt)
 
-        nodes, _ = self.get_data_from_ui()
-        self.canvas.plot_solution(nodes, results)
+        self.canvas.plot_solution(self.current_nodes, results, self.current_arcs)
 
         # Animate the results section
         self.animate_results()
@@ -624,7 +714,11 @@ class MainWindow(QMainWindow):
     def on_optimization_error(self, error_msg):
         self.solve_btn.setEnabled(True)
         self.clear_btn.setEnabled(True)
+        self.import_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
+        # Session possiblement partiellement mise à jour: reconstruite au prochain essai
+        self.session = None
         self.status_label.setText("Optimization failed")
         self.status_label.setStyleSheet("QLabel { color: #f44336; font-weight: bold; padding: 5px; }")
 
@@ -0,0 +1,149 @@
+"""
+Modèles de table adossés à des tableaux NumPy (un tableau par colonne).
+
+Remplacent les QTableWidget: la vue ne demande que les cellules visibles, un
+import de 100 000 arcs n'est qu'un remplacement de tableaux (modelReset) et
+la conversion en dicts pour le solveur reste vectorisée.
+"""
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from model.network_io import empty_nodes, empty_arcs, nodes_to_records, arcs_to_records
+
+
+def _format(value):
+    if isinstance(value, float):
+        if np.isnan(value):
+            return ""
+        return str(int(value)) if value.is_integer() and abs(value) < 1e15 else repr(value)
+    return str(value)
+
+
+def _parse(value):
+    text = str(value).strip()
+    return np.nan if text == "" else float(text)
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    columns: [(clé, en-tête)] des colonnes affichées; les clés de `arrays` non
+    affichées (ex. coordonnées x / y) suivent les insertions et suppressions.
+    Les colonnes float64 valent NaN quand la cellule est vide.
+    """
+
+    def __init__(self, columns, arrays, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.arrays = arrays
+
+    # -- Interface Qt --
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.arrays[self.columns[0][0]])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        value = self.arrays[self.columns[index.column()][0]][index.row()]
+        return _format(value.item() if isinstance(value, np.generic) else value)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        column = self.arrays[self.columns[index.column()][0]]
+        if column.dtype == object:
+            column[index.row()] = str(value).strip()
+        else:
+            try:
+                column[index.row()] = _parse(value)
+            except ValueError:
+                return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section][1]
+        return str(section + 1)
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        for key, column in self.arrays.items():
+            blank = "" if column.dtype == object else np.nan
+            self.arrays[key] = np.insert(column, row, [blank] * count)
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or row < 0 or row + count > self.rowCount():
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for key, column in self.arrays.items():
+            self.arrays[key] = np.delete(column, np.s_[row:row + count])
+        self.endRemoveRows()
+        return True
+
+    # -- Manipulation en bloc --
+    def set_arrays(self, arrays):
+        self.beginResetModel()
+        self.arrays = arrays
+        self.endResetModel()
+
+    def append_row(self, values):
+        """values: {clé: valeur}; les clés absentes restent vides."""
+        row = self.rowCount()
+        self.insertRows(row, 1)
+        for key, value in values.items():
+            column = self.arrays[key]
+            if column.dtype == object:
+                column[row] = str(value).strip()
+            else:
+                column[row] = _parse(value)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def clear(self):
+        self.set_arrays({key: column[:0] for key, column in self.arrays.items()})
+
+    def valid_mask(self):
+        """Lignes complètes: texte non vide et nombres renseignés."""
+        mask = np.ones(self.rowCount(), dtype=bool)
+        for key, _ in self.columns:
+            column = self.arrays[key]
+            if column.dtype == object:
+                mask &= column.astype(str) != ""
+            else:
+                mask &= ~np.isnan(column)
+        return mask
+
+    def valid_arrays(self):
+        mask = self.valid_mask()
+        return {key: column[mask] for key, column in self.arrays.items()}
+
+
+class NodeTableModel(ArrayTableModel):
+    def __init__(self, parent=None):
+        super().__init__([("id", "Node ID"), ("demand", "Supply/Demand")], empty_nodes(), parent)
+
+    def records(self):
+        return nodes_to_records(self.valid_arrays())
+
+
+class ArcTableModel(ArrayTableModel):
+    def __init__(self, parent=None):
+        super().__init__(
+            [("source", "From"), ("target", "To"), ("fixed_cost", "Fixed Cost"),
+             ("var_cost", "Var Cost"), ("capacity", "Capacity")],
+            empty_arcs(), parent,
+        )
+
+    def records(self):
+        return arcs_to_records(self.valid_arrays())
@@ -1,9 +1,14 @@
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 
 class NetworkCanvas(FigureCanvas):
+    # Au-delà, les étiquettes flux/capacité ne sont plus dessinées
+    MAX_FLOW_LABELS = 60
+
     def __init__(self, parent=None, width=5, height=4, dpi=100):
         plt.style.use('dark_background')
         self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor='#2D2D2D')
@@ -12,6 +17,11 @@ class NetworkCanvas(FigureCanvas):
         super().__init__(self.fig)
         self.setParent(parent)
 
+        self._layout_cache = {}
+        self.pos = {}
+        self._title = None
+        self.reset()
+
         # Set modern matplotlib parameters
         plt.rcParams['font.family'] = 'Segoe UI'
         plt.rcParams['font.size'] = 10
@@ -19,36 +29,21 @@ class NetworkCanvas(FigureCanvas):
         plt.rcParams['xtick.color'] = 'white'
         plt.rcParams['ytick.color'] = 'white'
 
-    def plot_solution(self, nodes_data, results):
-        self.axes.clear()
-        self.axes.set_facecolor('#2D2D2D')
-
-        G = nx.DiGraph()
-
-        # 1. Add nodes safely (handling duplicates)
+    def plot_solution(self, nodes_data, results, arcs_data=None, positions=None):
+        """
+        nodes_data: nœuds (les clés optionnelles 'x'/'y' fixent la position)
+        results: dict de résultats de TransportOptimizer.solve (ou incumbent)
+        arcs_data: arcs candidats, utilisés pour la disposition automatique
+        positions: dict optionnel {node_id: (x, y)} fourni par l'utilisateur
+
+        Pour un même réseau, seuls les styles de flux sont mis à jour: la
+        disposition est mise en cache par topologie et les nœuds ne sont
+        redessinés que si le réseau ou les demandes changent.
+        """
         unique_nodes = {n['id']: n for n in nodes_data if n['id']}
 
-        colors = []
-        labels = {}
-        node_sizes = []
-
-        for nid, n in unique_nodes.items():
-            G.add_node(nid)
-            demand = n['demand']
-            labels[nid] = f"{nid}\n({demand:+.0f})"
-
-            # Enhanced color scheme
-            if demand > 0:
-                colors.append('#4CAF50')  # Green for supply
-                node_sizes.append(800)
-            elif demand < 0:
-                colors.append('#f44336')  # Red for demand
-                node_sizes.append(800)
-            else:
-                colors.append('#9E9E9E')  # Gray for neutral
-                node_sizes.append(600)
-
-        if len(G.nodes) == 0:
+        if not unique_nodes:
+            self.reset()
             self.axes.text(0.5, 0.5, 'No nodes to display', ha='center', va='center',
                           transform=self.axes.transAxes, color='white', fontsize=12)
             self.axes.set_title("Network Architecture", color='white', fontsize=14, fontweight='bold')
@@ -56,85 +51,157 @@ class NetworkCanvas(FigureCanvas):
             self.draw()
             return
 
-        # 2. Enhanced layout
-        pos = nx.spring_layout(G, seed=42, k=2, iterations=50)
+        scene_key = (
+            self._topology_key(unique_nodes, arcs_data),
+            tuple(unique_nodes[nid]['demand'] for nid in unique_nodes),
+        )
+        if positions is not None or scene_key != self._scene_key:
+            self._draw_network(unique_nodes, arcs_data, positions)
+            self._scene_key = scene_key
 
-        # 3. Draw Nodes with enhanced styling
-        node_list = list(G.nodes())
-        ordered_colors = []
-        ordered_sizes = []
+        self._draw_flows(results)
+
+        # Enhanced title and styling
+        title_color = '#2196F3' if (results and results.get('status') == 'Optimal') else '#FF9800'
+        self._title.set_color(title_color)
+
+        self.draw_idle()
+
+    def reset(self):
+        """Efface le dessin (le cache de disposition est conservé)."""
+        self.axes.clear()
+        self.axes.set_facecolor('#2D2D2D')
+        self._scene_key = None
+        self._edges = None
+        self._arrows = None
+        self._flow_labels = []
+
+    @staticmethod
+    def _topology_key(unique_nodes, arcs_data):
+        arcs = frozenset((a['source'], a['target']) for a in (arcs_data or []))
+        return frozenset(unique_nodes), arcs
+
+    def _layout(self, unique_nodes, arcs_data, positions):
+        """Positions des nœuds: fournies, issues de 'x'/'y', sinon spring_layout en cache."""
+        pos = {}
+        for nid, n in unique_nodes.items():
+            if positions and nid in positions:
+                pos[nid] = tuple(positions[nid])
+            elif n.get('x') is not None and n.get('y') is not None:
+                pos[nid] = (n['x'], n['y'])
+        if len(pos) == len(unique_nodes):
+            return pos
+
+        key = self._topology_key(unique_nodes, arcs_data)
+        if key not in self._layout_cache:
+            G = nx.DiGraph()
+            G.add_nodes_from(unique_nodes)
+            G.add_edges_from(a for a in key[1] if a[0] in unique_nodes and a[1] in unique_nodes)
+            self._layout_cache[key] = nx.spring_layout(G, seed=42, k=2, iterations=50,
+                                                       pos=pos or None, fixed=list(pos) or None)
+        return {**self._layout_cache[key], **pos}
+
+    def _draw_network(self, unique_nodes, arcs_data, positions):
+        self.reset()
+        self.pos = self._layout(unique_nodes, arcs_data, positions)
+
+        # Nodes: one collection, colors computed once
+        node_list = list(unique_nodes)
+        colors, sizes = [], []
         for nid in node_list:
             demand = unique_nodes[nid]['demand']
             if demand > 0:
-                ordered_colors.append('#4CAF50')
-                ordered_sizes.append(800)
+                colors.append('#4CAF50')  # Green for supply
+                sizes.append(800)
             elif demand < 0:
-                ordered_colors.append('#f44336')
-                ordered_sizes.append(800)
+                colors.append('#f44336')  # Red for demand
+                sizes.append(800)
             else:
-                ordered_colors.append('#9E9E9E')
-                ordered_sizes.append(600)
+                colors.append('#9E9E9E')  # Gray for neutral
+                sizes.append(600)
+        labels = {nid: f"{nid}\n({unique_nodes[nid]['demand']:+.0f})" for nid in node_list}
 
-        nx.draw_networkx_nodes(G, pos, ax=self.axes, nodelist=node_list,
-                              node_color=ordered_colors, node_size=ordered_sizes,
+        G = nx.DiGraph()
+        G.add_nodes_from(node_list)
+        nx.draw_networkx_nodes(G, self.pos, ax=self.axes, nodelist=node_list,
+                              node_color=colors, node_size=sizes,
                               edgecolors='white', linewidths=2)
 
         # Enhanced labels
-        nx.draw_networkx_labels(G, pos, labels, ax=self.axes, font_size=9,
+        nx.draw_networkx_labels(G, self.pos, labels, ax=self.axes, font_size=9,
                                font_color='white', font_weight='bold')
 
-        # 4. Draw Arcs with modern styling
-        if results and results.get('status') == 'Optimal' and 'built_arcs' in results:
-            for arc in results['built_arcs']:
-                u, v = arc['source'], arc['target']
-
-                if u in G.nodes and v in G.nodes:
-                    flow = arc['flow']
-                    cap = arc['capacity']
-                    utilization = flow / cap if cap > 0 else 0
-
-                    # Dynamic edge styling based on utilization
-                    if utilization < 0.8:
-                        edge_color = '#4CAF50'  # Green for good utilization
-                        width = 2 + utilization * 3
-                    elif utilization < 1.0:
-                        edge_color = '#FF9800'  # Orange for high utilization
-                        width = 3 + utilization * 2
-                    else:
-                        edge_color = '#f44336'  # Red for over capacity
-                        width = 5
-
-                    # Draw the edge
-                    nx.draw_networkx_edges(
-                        G, pos,
-                        edgelist=[(u, v)],
-                        ax=self.axes,
-                        width=width,
-                        edge_color=edge_color,
-                        arrowstyle='->',
-                        arrowsize=20,
-                        alpha=0.8
-                    )
-
-                    # Add flow/capacity label
-                    mid_x = (pos[u][0] + pos[v][0]) / 2
-                    mid_y = (pos[u][1] + pos[v][1]) / 2
-                    self.axes.text(mid_x, mid_y, f"{flow:.0f}/{cap:.0f}",
-                                  color='white', fontweight='bold', fontsize=8,
-                                  ha='center', va='center',
-                                  bbox=dict(boxstyle="round,pad=0.3",
-                                           facecolor=edge_color, alpha=0.7))
+        # All arcs in a single collection, restyled for each new solution
+        self._edges = LineCollection([], alpha=0.8, zorder=0)
+        self.axes.add_collection(self._edges)
 
-        # Enhanced title and styling
-        title_color = '#2196F3' if (results and results.get('status') == 'Optimal') else '#FF9800'
-        self.axes.set_title("Network Architecture", color=title_color,
-                           fontsize=14, fontweight='bold', pad=20)
+        xs = [p[0] for p in self.pos.values()]
+        ys = [p[1] for p in self.pos.values()]
+        mx = max(max(xs) - min(xs), 1e-9) * 0.1
+        my = max(max(ys) - min(ys), 1e-9) * 0.1
+        self.axes.set_xlim(min(xs) - mx, max(xs) + mx)
+        self.axes.set_ylim(min(ys) - my, max(ys) + my)
+
+        self._title = self.axes.set_title("Network Architecture", color='#FF9800',
+                                          fontsize=14, fontweight='bold', pad=20)
         self.axes.axis('off')
 
         # Add legend
         self.add_legend()
 
-        self.draw()
+    def _draw_flows(self, results):
+        for text in self._flow_labels:
+            text.remove()
+        self._flow_labels = []
+        if self._arrows is not None:
+            self._arrows.remove()
+            self._arrows = None
+
+        arcs = [arc for arc in (results or {}).get('built_arcs', [])
+                if arc['source'] in self.pos and arc['target'] in self.pos]
+        max_flow = max([arc['flow'] for arc in arcs] + [1e-9])
+
+        segments, colors, widths = [], [], []
+        for arc in arcs:
+            flow, cap = arc['flow'], arc['capacity']
+            utilization = flow / cap if cap > 0 else 0
+
+            # Dynamic edge styling: color by utilization, width by flow
+            if utilization < 0.8:
+                colors.append('#4CAF50')  # Green for good utilization
+            elif utilization < 1.0:
+                colors.append('#FF9800')  # Orange for high utilization
+            else:
+                colors.append('#f44336')  # Red for over capacity
+            widths.append(1.5 + 4.5 * flow / max_flow)
+            segments.append((self.pos[arc['source']], self.pos[arc['target']]))
+
+        self._edges.set_segments(segments)
+        self._edges.set_color(colors)
+        self._edges.set_linewidth(widths)
+
+        if not segments:
+            return
+
+        # Direction: one arrow per arc, drawn as a single quiver collection
+        starts = np.array([seg[0] for seg in segments], dtype=float)
+        ends = np.array([seg[1] for seg in segments], dtype=float)
+        tips = starts + 0.55 * (ends - starts)
+        tails = starts + 0.45 * (ends - starts)
+        self._arrows = self.axes.quiver(
+            tails[:, 0], tails[:, 1], tips[:, 0] - tails[:, 0], tips[:, 1] - tails[:, 1],
+            color=colors, angles='xy', scale_units='xy', scale=1,
+            width=0.004, headwidth=4, headlength=5, zorder=1,
+        )
+
+        # Flow/capacity labels only while they stay readable
+        if len(arcs) <= self.MAX_FLOW_LABELS:
+            for arc, (x0, y0), (x1, y1), color in zip(arcs, starts, ends, colors):
+                self._flow_labels.append(self.axes.text(
+                    (x0 + x1) / 2, (y0 + y1) / 2, f"{arc['flow']:.0f}/{arc['capacity']:.0f}",
+                    color='white', fontweight='bold', fontsize=8,
+                    ha='center', va='center',
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor=color, alpha=0.7)))
 
     def add_legend(self):
         # Add a small legend
@@ -4,17 +4,39 @@ from model.optimizer import TransportOptimizer
 
 class OptimizationWorker(QThread):
     finished = pyqtSignal(dict)
+    incumbent = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, nodes, arcs):
+    def __init__(self, nodes, arcs, session=None, **options):
+        """
+        session: DesignSession optionnelle, mise à jour avec nodes/arcs puis
+                 résolue (modèle conservé d'une résolution à l'autre)
+        options: arguments passés à TransportOptimizer.solve / DesignSession.solve
+        (method, time_limit, mip_gap, node_limit, ...)
+        """
         super().__init__()
         self.nodes = nodes
         self.arcs = arcs
-        self.optimizer = TransportOptimizer()
+        self.options = options
+        self.session = session
+        self.optimizer = session or TransportOptimizer()
+        # Un cancel() envoyé dès start(), avant solve(), doit être conservé:
+        # la demande d'arrêt est effacée ici plutôt qu'au début de solve()
+        self.optimizer.reset_cancel()
+
+    def cancel(self):
+        # La résolution s'arrête et retourne la meilleure conception trouvée
+        self.optimizer.cancel()
 
     def run(self):
         try:
-            results = self.optimizer.solve(self.nodes, self.arcs)
+            if self.session is not None:
+                self.session.sync(self.nodes, self.arcs)
+                results = self.session.solve(on_incumbent=self.incumbent.emit, **self.options)
+            else:
+                results = self.optimizer.solve(
+                    self.nodes, self.arcs, on_incumbent=self.incumbent.emit, **self.options
+                )
             self.finished.emit(results)
         except Exception as e:
             self.error.emit(str(e))